@@ -0,0 +1,272 @@
+import argparse
+import fnmatch
+import functools
+import math
+import operator
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.numpy_practical_tasks.harness import (
+    DEFAULT_NOISE_FLOOR,
+    DEFAULT_THRESHOLD,
+    Benchmark,
+    compare_results,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+from src.numpy_practical_tasks import task_2, task_3, task_4
+
+SEED = 42
+PERIOD_ONE = (np.datetime64("2024-01-01"), np.datetime64("2024-03-31"))
+PERIOD_TWO = (np.datetime64("2024-04-01"), np.datetime64("2024-06-30"))
+FILE_FORMATS = ("csv", "txt", "npy", "npz", "chunked")
+IN_PLACE_TASKS = ("increase_price",)
+# The threaded csv reader is compared with np.loadtxt, the default loader, above.
+READER_THREADS = tuple(dict.fromkeys((1, os.cpu_count() or 1)))
+
+
+def make_transactions(size: int, seed: int = SEED) -> np.array:
+    rng = np.random.default_rng(seed)
+    start = np.datetime64("2024-01-01T00:00:00", "s")
+    seconds_in_year = 366 * 24 * 60 * 60
+    return np.rec.fromarrays(
+        [
+            np.arange(size, dtype="int64"),
+            rng.integers(0, max(size // 10, 1), size, dtype="int32"),
+            rng.integers(0, 1000, size, dtype="int32"),
+            rng.integers(0, 20, size, dtype="int16"),
+            rng.uniform(1, 500, size).round(2),
+            start + rng.integers(0, seconds_in_year, size).astype("timedelta64[s]"),
+        ],
+        dtype=[
+            ("transaction_id", "int64"),
+            ("user_id", "int32"),
+            ("product_id", "int32"),
+            ("quantity", "int16"),
+            ("price", "float64"),
+            ("timestamp", "datetime64[s]"),
+        ],
+    )
+
+
+def make_matrix(size: int, seed: int = SEED) -> np.array:
+    side = max(math.isqrt(size), 1)
+    return np.random.default_rng(seed).integers(0, 100, (side, side), dtype="int64")
+
+
+def transactions(*extra_args):
+    return lambda size, directory: (make_transactions(size), *extra_args)
+
+
+def matrix(*extra_args):
+    return lambda size, directory: (make_matrix(size), *extra_args)
+
+
+def saved_matrix(file_format: str):
+    def setup(size: int, directory: Path) -> tuple:
+        file_path = directory / f"load_{size}.{file_format}"
+        return (task_4.save_array(make_matrix(size), file_format, file_path),)
+
+    return setup
+
+
+def saved_directory(size: int, directory: Path) -> tuple:
+    arrays_directory = directory / f"arrays_{size}"
+    for file_format in ("npy", "npz", "csv"):
+        task_4.save_array(
+            make_matrix(size // 3), file_format, arrays_directory / f"arr.{file_format}"
+        )
+    return (arrays_directory,)
+
+
+def save_matrix(file_format: str):
+    return lambda size, directory: (
+        make_matrix(size),
+        file_format,
+        directory / f"save_{size}.{file_format}",
+    )
+
+
+def transaction_chunks(size: int, directory: Path) -> tuple:
+    return ([make_transactions(size)],)
+
+
+def prices(size: int, directory: Path) -> tuple:
+    return (make_transactions(size).price,)
+
+
+def user_transactions(size: int, directory: Path) -> tuple:
+    arr = make_transactions(size)
+    return arr, int(arr.user_id[0])
+
+
+def split_matrix(size: int, directory: Path) -> tuple:
+    arr = make_matrix(size)
+    return arr, [len(arr) // 2], 1
+
+
+def reshape_matrix(size: int, directory: Path) -> tuple:
+    arr = make_matrix(size)
+    return arr, (-1, 1)
+
+
+def combine_matrices(size: int, directory: Path) -> tuple:
+    arr = make_matrix(size // 2)
+    return arr, arr
+
+
+def create_benchmarks() -> list[Benchmark]:
+    benchmarks = [
+        Benchmark(
+            f"task_2.{name}",
+            getattr(task_2, name),
+            setup,
+            mutates_input=name in IN_PLACE_TASKS,
+        )
+        for name, setup in [
+            ("calculate_total_revenue", transactions()),
+            ("calculate_unique_users", transactions()),
+            ("calculate_most_purchased_product", transactions()),
+            ("estimate_unique_users", transaction_chunks),
+            ("estimate_most_purchased_product", transaction_chunks),
+            ("cast_float_to_int", prices),
+            ("check_dtype_of_each_column", transactions()),
+            ("project_columns", transactions(("user_id", "price"))),
+            ("create_product_quantity_array", transactions()),
+            ("calculate_transaction_count_per_user", transactions()),
+            ("create_masked_array_quantity_zero", transactions()),
+            ("increase_price", transactions(0.05)),
+            ("filter_transactions_quantity_greater_than_one", transactions()),
+            ("compare_revenue", transactions(PERIOD_ONE, PERIOD_TWO, operator.gt)),
+            ("get_user_transactions", user_transactions),
+            ("filter_array_by_date_range", transactions(PERIOD_ONE)),
+            ("get_top_n_products_by_revenue", transactions(10)),
+        ]
+    ]
+    benchmarks += [
+        Benchmark(f"task_3.{function.__name__}", function, setup)
+        for function, setup in [
+            (task_3.transpose, matrix()),
+            (task_3.blocked_transpose, matrix()),
+            (task_3.reshape_array, reshape_matrix),
+            (task_3.split_array_by_axis, split_matrix),
+            (task_3.combine_arrays, combine_matrices),
+        ]
+    ]
+    benchmarks += [
+        Benchmark(f"task_4.save_array[{file_format}]", task_4.save_array, setup)
+        for file_format, setup in zip(FILE_FORMATS, map(save_matrix, FILE_FORMATS))
+    ]
+    benchmarks += [
+        Benchmark(
+            f"task_4.load_array_from_file[{file_format}]",
+            task_4.load_array_from_file,
+            saved_matrix(file_format),
+        )
+        for file_format in FILE_FORMATS
+    ]
+    benchmarks += [
+        Benchmark(
+            f"task_4.load_array_from_file[{file_format}, {threads} threads]",
+            functools.partial(task_4.load_array_from_file, max_workers=threads),
+            saved_matrix(file_format),
+        )
+        for file_format in ("csv", "txt")
+        for threads in READER_THREADS
+    ]
+    benchmarks += [
+        Benchmark(
+            "task_4.load_arrays_from_directory",
+            task_4.load_arrays_from_directory,
+            saved_directory,
+        )
+    ]
+    benchmarks += [
+        Benchmark(f"task_4.{function.__name__}", function, matrix(0))
+        for function in (
+            task_4.summarize_array,
+            task_4.mean_array_value,
+            task_4.median_array_value,
+            task_4.std_array_value,
+        )
+    ]
+    benchmarks += [
+        Benchmark(
+            "task_4.apply_aggregate_function_by_axis",
+            task_4.apply_aggregate_function_by_axis,
+            matrix(np.sum, 0),
+        )
+    ]
+    return benchmarks
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time the numpy practical tasks on synthetic data."
+    )
+    parser.add_argument("--min-exponent", type=int, default=3)
+    parser.add_argument("--max-exponent", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--filter", default="*", help="Glob of benchmark names to run, e.g. 'task_2.*'"
+    )
+    parser.add_argument("--output", type=Path, help="Where to write the JSON results")
+    parser.add_argument("--baseline", type=Path, help="JSON results to compare with")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--memory-threshold", type=float)
+    parser.add_argument("--noise-floor", type=float, default=DEFAULT_NOISE_FLOOR)
+    return parser.parse_args(argv)
+
+
+def print_result(result: dict):
+    print(
+        f"{result['benchmark']:<55} {result['size']:>11,} "
+        f"{result['seconds'] * 1000:>12.3f} ms {result['throughput']:>14,.0f}/s "
+        f"{result['peak_memory'] / 2**20:>10.1f} MiB"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if not 0 <= args.min_exponent <= args.max_exponent:
+        raise ValueError(
+            f"Invalid exponents {args.min_exponent} and {args.max_exponent}!"
+        )
+
+    benchmarks = [
+        benchmark
+        for benchmark in create_benchmarks()
+        if fnmatch.fnmatchcase(benchmark.name, args.filter)
+    ]
+    sizes = [
+        10**exponent for exponent in range(args.min_exponent, args.max_exponent + 1)
+    ]
+    results = run_benchmarks(benchmarks, sizes, repeat=args.repeat, log=print_result)
+    if args.output:
+        save_results(results, args.output)
+
+    if args.baseline is None:
+        return 0
+    regressions = compare_results(
+        results,
+        load_results(args.baseline),
+        threshold=args.threshold,
+        memory_threshold=args.memory_threshold,
+        noise_floor=args.noise_floor,
+    )
+    for regression in regressions:
+        print(
+            f"Regression in {regression['benchmark']} at {regression['size']:,}: "
+            f"{regression['metric']} {regression['baseline']:.6g} -> "
+            f"{regression['current']:.6g} ({regression['change']:+.1%})",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
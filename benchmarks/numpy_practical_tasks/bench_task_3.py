@@ -0,0 +1,70 @@
+import argparse
+import timeit
+
+import numpy as np
+
+from src.numpy_practical_tasks.array_builder import ArrayBuilder
+from src.numpy_practical_tasks.task_3 import (
+    blocked_transpose,
+    combine_arrays,
+    transpose,
+)
+
+
+def combine_in_loop(blocks: list[np.array]) -> np.array:
+    result = blocks[0]
+    for block in blocks[1:]:
+        result = combine_arrays(result, block)
+    return result
+
+
+def build_in_loop(blocks: list[np.array]) -> np.array:
+    builder = ArrayBuilder()
+    for block in blocks:
+        builder.append(block)
+    return builder.result()
+
+
+def report(name: str, seconds: float, baseline: float):
+    print(f"{name:<40} {seconds * 1000:>10.2f} ms {baseline / seconds:>8.2f}x")
+
+
+def bench_combine(n_blocks: int, block_rows: int, repeat: int):
+    blocks = [np.random.rand(block_rows, 8) for _ in range(n_blocks)]
+    assert np.array_equal(combine_in_loop(blocks), build_in_loop(blocks))
+
+    baseline = min(
+        timeit.repeat(lambda: combine_in_loop(blocks), number=1, repeat=repeat)
+    )
+    report(f"combine_arrays in a loop ({n_blocks} blocks)", baseline, baseline)
+    seconds = min(timeit.repeat(lambda: build_in_loop(blocks), number=1, repeat=repeat))
+    report(f"ArrayBuilder.append ({n_blocks} blocks)", seconds, baseline)
+
+
+def bench_transpose(size: int, dtype: str, repeat: int):
+    arr = np.random.rand(size, size).astype(dtype)
+    assert np.array_equal(blocked_transpose(arr), transpose(arr))
+
+    baseline = min(
+        timeit.repeat(
+            lambda: np.ascontiguousarray(transpose(arr)), number=1, repeat=repeat
+        )
+    )
+    report(f"transpose + copy ({size}x{size} {dtype})", baseline, baseline)
+    seconds = min(
+        timeit.repeat(lambda: blocked_transpose(arr), number=1, repeat=repeat)
+    )
+    report(f"blocked_transpose ({size}x{size} {dtype})", seconds, baseline)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--blocks", type=int, default=2000)
+    parser.add_argument("--block-rows", type=int, default=100)
+    parser.add_argument("--size", type=int, default=4096)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    bench_combine(args.blocks, args.block_rows, args.repeat)
+    for dtype in ("float64", "float32"):
+        bench_transpose(args.size, dtype, args.repeat)
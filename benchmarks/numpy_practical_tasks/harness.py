@@ -0,0 +1,149 @@
+import json
+import platform
+import tempfile
+import time
+import tracemalloc
+import typing
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_NOISE_FLOOR = 1e-4
+
+
+class Benchmark:
+    def __init__(
+        self,
+        name: str,
+        function: typing.Callable,
+        setup: typing.Callable[[int, Path], tuple],
+        mutates_input: bool = False,
+    ):
+        self.name = name
+        self.function = function
+        self.setup = setup
+        self.mutates_input = mutates_input
+
+    def run(self, size: int, directory: Path, repeat: int = 3) -> dict:
+        args = self.setup(size, directory)
+        self.function(*self._arguments(args))
+
+        timings = []
+        for _ in range(repeat):
+            call_args = self._arguments(args)
+            start = time.perf_counter()
+            self.function(*call_args)
+            timings.append(time.perf_counter() - start)
+
+        # Inputs are allocated before tracing starts, only the call is measured.
+        call_args = self._arguments(args)
+        tracemalloc.start()
+        try:
+            self.function(*call_args)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        seconds = min(timings)
+        return {
+            "benchmark": self.name,
+            "size": size,
+            "seconds": seconds,
+            "throughput": size / seconds if seconds else float("inf"),
+            "peak_memory": peak_memory,
+        }
+
+    def _arguments(self, args: tuple) -> tuple:
+        # Functions working in place get a fresh copy of the inputs on every call.
+        if not self.mutates_input:
+            return args
+        return tuple(arg.copy() if isinstance(arg, np.ndarray) else arg for arg in args)
+
+
+def run_benchmarks(
+    benchmarks: typing.Iterable[Benchmark],
+    sizes: typing.Iterable[int],
+    repeat: int = 3,
+    log: typing.Callable[[dict], None] | None = None,
+) -> dict:
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for benchmark in benchmarks:
+            for size in sizes:
+                result = benchmark.run(size, Path(directory), repeat=repeat)
+                results.append(result)
+                if log is not None:
+                    log(result)
+
+    return {
+        "metadata": {
+            "created_at": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+        },
+        "results": results,
+    }
+
+
+def compare_results(
+    current: dict,
+    baseline: dict,
+    threshold: float = DEFAULT_THRESHOLD,
+    memory_threshold: float | None = None,
+    noise_floor: float = DEFAULT_NOISE_FLOOR,
+) -> list[dict]:
+    if threshold < 0 or (memory_threshold is not None and memory_threshold < 0):
+        raise ValueError(
+            f"Thresholds should be non-negative, got {threshold} and "
+            f"{memory_threshold}!"
+        )
+
+    baseline_results = {
+        (result["benchmark"], result["size"]): result for result in baseline["results"]
+    }
+    regressions = []
+    for result in current["results"]:
+        previous = baseline_results.get((result["benchmark"], result["size"]))
+        if previous is None:
+            continue
+
+        slowdown = result["seconds"] / previous["seconds"] - 1
+        # Timings of the smallest inputs are dominated by noise, not by the code.
+        if (
+            slowdown > threshold
+            and result["seconds"] - previous["seconds"] > noise_floor
+        ):
+            regressions.append(_regression(result, previous, "seconds", slowdown))
+
+        if memory_threshold is not None and previous["peak_memory"]:
+            growth = result["peak_memory"] / previous["peak_memory"] - 1
+            if growth > memory_threshold:
+                regressions.append(_regression(result, previous, "peak_memory", growth))
+
+    return regressions
+
+
+def load_results(file_path: Path | str) -> dict:
+    return json.loads(Path(file_path).read_text())
+
+
+def save_results(results: dict, file_path: Path | str) -> Path:
+    file_path = Path(file_path)
+    file_path.parent.mkdir(exist_ok=True, parents=True)
+    file_path.write_text(json.dumps(results, indent=2))
+    return file_path
+
+
+def _regression(result: dict, previous: dict, metric: str, change: float) -> dict:
+    return {
+        "benchmark": result["benchmark"],
+        "size": result["size"],
+        "metric": metric,
+        "baseline": previous[metric],
+        "current": result[metric],
+        "change": change,
+    }
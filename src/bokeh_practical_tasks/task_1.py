@@ -13,16 +13,17 @@ from bokeh.models import (
     FixedTicker,
 )
 
+from src.pandas_practical_tasks.binning import Bins
+
+AGE_GROUP_BINS = Bins(
+    edges=[18, 35, 60],
+    labels=["Child", "Young Adult", "Adult", "Senior"],
+    right=False,
+)
+
 
 def _categorize_age_group(age_value: float) -> str:
-    if age_value < 18:
-        return "Child"
-    elif 18 <= age_value < 35:
-        return "Young Adult"
-    elif 35 <= age_value < 60:
-        return "Adult"
-    else:
-        return "Senior"
+    return AGE_GROUP_BINS.label(age_value)
 
 
 def prepare_dataset(dataset: pd.DataFrame) -> pd.DataFrame:
@@ -30,14 +31,17 @@ def prepare_dataset(dataset: pd.DataFrame) -> pd.DataFrame:
     dataset["Cabin"].fillna("unknown", inplace=True)
     dataset["Embarked"].fillna("unknown", inplace=True)
 
-    dataset["AgeGroup"] = dataset["Age"].apply(_categorize_age_group)
+    dataset["AgeGroup"] = AGE_GROUP_BINS.apply(dataset["Age"])
 
     return dataset
 
 
 def create_survival_rate_dataset_by_age_group(dataset: pd.DataFrame) -> pd.DataFrame:
-    new_dataset = dataset.groupby(["AgeGroup"])["Survived"].mean().reset_index()
+    new_dataset = (
+        dataset.groupby(["AgeGroup"], observed=True)["Survived"].mean().reset_index()
+    )
     new_dataset.columns = ["AgeGroup", "SurvivalRate"]
+    new_dataset["AgeGroup"] = new_dataset["AgeGroup"].astype(str)
     new_dataset["SurvivalRate"] *= 100
 
     return new_dataset
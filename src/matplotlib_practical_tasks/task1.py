@@ -5,6 +5,17 @@ import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
 
+from src.pandas_practical_tasks.task_1 import load_cleaned_listings
+
+COLUMNS = (
+    "neighbourhood_group",
+    "room_type",
+    "price",
+    "number_of_reviews",
+    "last_review",
+    "availability_365",
+)
+
 
 def neighborhood_distribution_of_listings(
     neighbourhood_group_data: pd.Series,
@@ -68,7 +79,9 @@ def price_distribution_across_neighborhoods(graph_data: pd.DataFrame) -> plt.fig
 
 def room_type_vs_availability(graph_data: pd.DataFrame) -> plt.figure:
     grouped_data = (
-        graph_data.groupby(["neighbourhood_group", "room_type"])["availability_365"]
+        graph_data.groupby(["neighbourhood_group", "room_type"], observed=True)[
+            "availability_365"
+        ]
         .agg(["mean", "std"])
         .reset_index()
     )
@@ -207,7 +220,7 @@ def price_and_availability_heatmap(
     graph_data: pd.DataFrame,
 ) -> plt.figure:
     pivot_table = (
-        graph_data.groupby("neighbourhood_group")
+        graph_data.groupby("neighbourhood_group", observed=True)
         .agg({"price": "mean", "availability_365": "mean"})
         .reset_index()
     )
@@ -246,7 +259,9 @@ def room_type_and_review_count_analysis(
     graph_data: pd.DataFrame,
 ) -> plt.figure:
     aggregated_data = (
-        graph_data.groupby(["neighbourhood_group", "room_type"])["number_of_reviews"]
+        graph_data.groupby(["neighbourhood_group", "room_type"], observed=True)[
+            "number_of_reviews"
+        ]
         .sum()
         .unstack()
         .fillna(0)
@@ -283,9 +298,7 @@ def room_type_and_review_count_analysis(
 
 if __name__ == "__main__":
     current_folder = Path(__file__).parent
-    data_folder = current_folder.parent.parent / "data"
-    file_path = data_folder / "cleaned_airbnb_data.csv"
-    dataset = pd.read_csv(file_path)
+    dataset = load_cleaned_listings(columns=COLUMNS)
 
     result_fig_1 = neighborhood_distribution_of_listings(dataset["neighbourhood_group"])
     result_fig_1.savefig(current_folder / "neighborhood_distribution_of_listings.png")
@@ -0,0 +1,85 @@
+from collections.abc import Iterable
+
+import numpy as np
+
+DEFAULT_CAPACITY = 16
+GROWTH_FACTOR = 2
+
+
+class ArrayBuilder:
+    def __init__(
+        self,
+        dtype: np.dtype | str | None = None,
+        axis: int = 0,
+        capacity: int = DEFAULT_CAPACITY,
+    ):
+        if capacity < 1:
+            raise ValueError(f"Capacity should be positive, got {capacity}!")
+        self.dtype = np.dtype(dtype) if dtype is not None else None
+        self.axis = axis
+        self.initial_capacity = capacity
+        self.size = 0
+        # Rows are kept along the first axis of the buffer, result() moves them back.
+        self._buffer = None
+        self._shared = False
+
+    @property
+    def capacity(self) -> int:
+        return 0 if self._buffer is None else len(self._buffer)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append(self, arr: np.array) -> "ArrayBuilder":
+        block = np.moveaxis(np.asarray(arr), self.axis, 0)
+        if self._buffer is None:
+            dtype = self.dtype or block.dtype
+            self._buffer = np.empty(
+                (max(self.initial_capacity, len(block)), *block.shape[1:]), dtype=dtype
+            )
+        elif block.shape[1:] != self._buffer.shape[1:]:
+            raise ValueError(
+                f"Can't append a block of shape {block.shape[1:]} to rows of shape "
+                f"{self._buffer.shape[1:]} along axis {self.axis}!"
+            )
+
+        dtype = (
+            self._buffer.dtype
+            if self.dtype is not None
+            else np.result_type(self._buffer.dtype, block.dtype)
+        )
+        if self.size + len(block) > self.capacity or dtype != self._buffer.dtype:
+            self._reallocate(self.size + len(block), dtype)
+
+        self._buffer[self.size : self.size + len(block)] = block
+        self.size += len(block)
+        return self
+
+    def extend(self, arrays: Iterable[np.array]) -> "ArrayBuilder":
+        for arr in arrays:
+            self.append(arr)
+        return self
+
+    def result(self, copy: bool = False) -> np.array:
+        if self._buffer is None:
+            return np.empty((0,), dtype=self.dtype or "float64")
+        filled = self._buffer[: self.size]
+        self._shared = self._shared or not copy
+        return np.moveaxis(filled.copy() if copy else filled, 0, self.axis)
+
+    def clear(self) -> "ArrayBuilder":
+        # Rows handed out as views stay valid, the next append starts a new buffer.
+        if self._shared:
+            self._buffer = None
+            self._shared = False
+        self.size = 0
+        return self
+
+    def _reallocate(self, min_capacity: int, dtype: np.dtype):
+        # Growing geometrically keeps appends amortized O(1) instead of a full copy.
+        capacity = max(self.capacity, 1)
+        while capacity < min_capacity:
+            capacity *= GROWTH_FACTOR
+        buffer = np.empty((capacity, *self._buffer.shape[1:]), dtype=dtype)
+        buffer[: self.size] = self._buffer[: self.size]
+        self._buffer = buffer
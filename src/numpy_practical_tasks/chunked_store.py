@@ -0,0 +1,153 @@
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+
+from src.numpy_practical_tasks.compression import (
+    Codec,
+    check_codec,
+    compress,
+    decompress,
+)
+
+INDEX_FILE_NAME = "index.json"
+
+
+class ChunkedArrayStore:
+    def __init__(
+        self,
+        directory: Path | str,
+        codec: Codec = "zlib",
+        compression_level: int | None = None,
+        chunk_rows: int | None = None,
+    ):
+        check_codec(codec)
+        if chunk_rows is not None and chunk_rows < 1:
+            raise ValueError(f"Chunk rows should be positive, got {chunk_rows}!")
+        self.directory = Path(directory)
+        self.codec = codec
+        self.compression_level = compression_level
+        self.chunk_rows = chunk_rows
+        self.index = self._read_index()
+
+    @property
+    def dtype(self) -> np.dtype | None:
+        return np.dtype(self.index["dtype"]) if self.index["dtype"] else None
+
+    @property
+    def chunks(self) -> list[dict]:
+        return self.index["chunks"]
+
+    def __len__(self) -> int:
+        return sum(chunk["rows"] for chunk in self.chunks)
+
+    def append(self, arr: np.array) -> "ChunkedArrayStore":
+        arr = np.asarray(arr)
+        if arr.ndim == 0:
+            raise ValueError("Can't append a scalar, append at least one row!")
+        if not (np.issubdtype(arr.dtype, np.number) or arr.dtype == np.bool_):
+            raise TypeError(
+                f"Chunked store only keeps numeric arrays, got {arr.dtype}!"
+            )
+        if self.dtype is None:
+            self.index["dtype"] = arr.dtype.str
+            self.index["row_shape"] = list(arr.shape[1:])
+        elif arr.dtype != self.dtype or list(arr.shape[1:]) != self.index["row_shape"]:
+            raise ValueError(
+                f"Can't append {arr.dtype} rows of shape {arr.shape[1:]} to a store of "
+                f"{self.dtype} rows of shape {tuple(self.index['row_shape'])}!"
+            )
+
+        self.directory.mkdir(exist_ok=True, parents=True)
+        step = self.chunk_rows or max(len(arr), 1)
+        for start in range(0, len(arr), step):
+            self._write_chunk(arr[start : start + step])
+        self._write_index()
+        return self
+
+    def read_chunk(self, position: int) -> np.array:
+        chunk = self.chunks[position]
+        data = decompress(
+            (self.directory / chunk["file"]).read_bytes(), chunk.get("codec", "zlib")
+        )
+        return np.frombuffer(data, dtype=self.dtype).reshape(
+            -1, *self.index["row_shape"]
+        )
+
+    def iter_chunks(
+        self, min_value: float | None = None, max_value: float | None = None
+    ) -> Iterator[np.array]:
+        filtered = min_value is not None or max_value is not None
+        for position, chunk in enumerate(self.chunks):
+            # Chunks whose value range can't overlap the query are never decompressed.
+            if filtered and chunk["min"] is None:
+                continue
+            if min_value is not None and chunk["max"] < min_value:
+                continue
+            if max_value is not None and chunk["min"] > max_value:
+                continue
+            yield self.read_chunk(position)
+
+    def read(
+        self, min_value: float | None = None, max_value: float | None = None
+    ) -> np.array:
+        chunks = list(self.iter_chunks(min_value=min_value, max_value=max_value))
+        if not chunks:
+            return np.empty(
+                (0, *self.index["row_shape"]), dtype=self.dtype or "float64"
+            )
+        return np.concatenate(chunks)
+
+    def sum(self) -> float | int:
+        return sum(chunk["sum"] for chunk in self.chunks)
+
+    def min(self) -> float | int | None:
+        return min(
+            (chunk["min"] for chunk in self.chunks if chunk["min"] is not None),
+            default=None,
+        )
+
+    def max(self) -> float | int | None:
+        return max(
+            (chunk["max"] for chunk in self.chunks if chunk["max"] is not None),
+            default=None,
+        )
+
+    def clear(self) -> "ChunkedArrayStore":
+        for chunk in self.chunks:
+            (self.directory / chunk["file"]).unlink(missing_ok=True)
+        (self.directory / INDEX_FILE_NAME).unlink(missing_ok=True)
+        self.index = self._read_index()
+        return self
+
+    def _write_chunk(self, block: np.array):
+        file_name = f"chunk_{len(self.chunks):06d}.{self.codec}"
+        data = compress(
+            np.ascontiguousarray(block).tobytes(), self.codec, self.compression_level
+        )
+        (self.directory / file_name).write_bytes(data)
+
+        empty = block.size == 0
+        self.chunks.append(
+            {
+                "file": file_name,
+                "codec": self.codec,
+                "rows": len(block),
+                "min": None if empty else block.min().item(),
+                "max": None if empty else block.max().item(),
+                "sum": block.sum().item(),
+            }
+        )
+
+    def _read_index(self) -> dict:
+        index_path = self.directory / INDEX_FILE_NAME
+        if index_path.exists():
+            return json.loads(index_path.read_text())
+        return {"dtype": None, "row_shape": [], "chunks": []}
+
+    def _write_index(self):
+        # Replacing the file keeps the index valid if the process dies mid-write.
+        tmp_path = self.directory / f"{INDEX_FILE_NAME}.tmp"
+        tmp_path.write_text(json.dumps(self.index))
+        tmp_path.replace(self.directory / INDEX_FILE_NAME)
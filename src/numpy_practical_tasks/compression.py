@@ -0,0 +1,276 @@
+import bz2
+import lzma
+import os
+import struct
+import typing
+import zipfile
+import zlib
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+Codec = typing.Literal["zlib", "bz2", "lzma"]
+
+ZIP_COMPRESSION = {
+    "zlib": zipfile.ZIP_DEFLATED,
+    "bz2": zipfile.ZIP_BZIP2,
+    "lzma": zipfile.ZIP_LZMA,
+}
+# Zip spec versions needed to extract each method and the zip64 records.
+ZIP_VERSIONS = {"zlib": 20, "bz2": 46, "lzma": 63}
+ZIP64_VERSION = 45
+ZIP64_LIMIT = 0xFFFFFFFF
+ZIP64_MARKER = 0xFFFFFFFF
+ZIP_COUNT_LIMIT = 0xFFFF
+# Members are dated 1980-01-01 like np.savez does, so archives are reproducible.
+DOS_DATE, DOS_TIME = 0x21, 0
+MADE_BY_UNIX = 3 << 8
+LZMA_EOS_FLAG = 0x02
+UTF8_FLAG = 0x800
+# Dictionary sizes of the lzma presets 0-9, the member stores them in its header.
+LZMA_DICT_SIZES = (
+    1 << 18,
+    1 << 20,
+    1 << 21,
+    1 << 22,
+    1 << 22,
+    1 << 23,
+    1 << 23,
+    1 << 24,
+    1 << 25,
+    1 << 26,
+)
+LZMA_DEFAULT_PRESET = 6
+
+
+def check_codec(codec: str):
+    if codec not in ZIP_COMPRESSION:
+        raise ValueError(
+            f"Invalid codec {codec}, choose one of {', '.join(ZIP_COMPRESSION)}!"
+        )
+
+
+def compress(data: bytes, codec: Codec = "zlib", level: int | None = None) -> bytes:
+    check_codec(codec)
+    match codec:
+        case "zlib":
+            return zlib.compress(data, -1 if level is None else level)
+        case "bz2":
+            return bz2.compress(data, 9 if level is None else level)
+        case "lzma":
+            return lzma.compress(data, preset=level)
+
+
+def decompress(data: bytes, codec: Codec = "zlib") -> bytes:
+    check_codec(codec)
+    match codec:
+        case "zlib":
+            return zlib.decompress(data)
+        case "bz2":
+            return bz2.decompress(data)
+        case "lzma":
+            return lzma.decompress(data)
+
+
+def save_arrays_compressed(
+    arrays: Mapping[str, np.array],
+    file_path: Path | str,
+    codec: Codec = "zlib",
+    level: int | None = None,
+    max_workers: int | None = None,
+) -> Path:
+    check_codec(codec)
+    if codec == "lzma" and level is not None and not 0 <= level < len(LZMA_DICT_SIZES):
+        raise ValueError(f"Lzma preset should be between 0 and 9, got {level}!")
+    file_path = Path(file_path)
+    file_path.parent.mkdir(exist_ok=True, parents=True)
+    window = max_workers or os.cpu_count() or 1
+
+    members = []
+    with (
+        ThreadPoolExecutor(max_workers=max_workers) as pool,
+        open(file_path, "wb") as file,
+    ):
+        # Members are compressed in parallel, the codecs release the GIL, and
+        # written in order as they finish. The window bounds the memory they hold.
+        pending = deque()
+        for name, arr in arrays.items():
+            pending.append(pool.submit(_compress_member, name, arr, codec, level))
+            if len(pending) > window:
+                members.append(_write_member(file, pending.popleft()))
+        while pending:
+            members.append(_write_member(file, pending.popleft()))
+        _write_central_directory(file, members)
+
+    return file_path
+
+
+class _CompressedMember:
+    def __init__(self, name: str, codec: Codec, level: int | None):
+        self.name = f"{name}.npy".encode()
+        self.codec = codec
+        self.flags = 0 if self.name.isascii() else UTF8_FLAG
+        self.crc = 0
+        self.size = 0
+        self.offset = 0
+        self.chunks = []
+        match codec:
+            case "zlib":
+                # Zip members hold raw deflate streams, without the zlib header.
+                self.compressor = zlib.compressobj(
+                    -1 if level is None else level, zlib.DEFLATED, -zlib.MAX_WBITS
+                )
+            case "bz2":
+                self.compressor = bz2.BZ2Compressor(9 if level is None else level)
+            case "lzma":
+                preset = LZMA_DEFAULT_PRESET if level is None else level
+                lc, lp, pb = 3, 0, 2
+                properties = struct.pack(
+                    "<BI", (pb * 5 + lp) * 9 + lc, LZMA_DICT_SIZES[preset]
+                )
+                # The stream starts with the lzma SDK version and its properties.
+                self.chunks.append(struct.pack("<BBH", 9, 4, len(properties)))
+                self.chunks.append(properties)
+                self.flags |= LZMA_EOS_FLAG
+                self.compressor = lzma.LZMACompressor(
+                    lzma.FORMAT_RAW,
+                    filters=[
+                        {
+                            "id": lzma.FILTER_LZMA1,
+                            "preset": preset,
+                            "dict_size": LZMA_DICT_SIZES[preset],
+                            "lc": lc,
+                            "lp": lp,
+                            "pb": pb,
+                        }
+                    ],
+                )
+
+    def write(self, data: bytes) -> int:
+        self.crc = zlib.crc32(data, self.crc)
+        self.size += len(data)
+        self.chunks.append(self.compressor.compress(data))
+        return len(data)
+
+    def close(self):
+        self.chunks.append(self.compressor.flush())
+        self.data = b"".join(self.chunks)
+        self.compress_size = len(self.data)
+        self.chunks = []
+
+    def version(self, zip64: bool) -> int:
+        return max(ZIP_VERSIONS[self.codec], ZIP64_VERSION if zip64 else 0)
+
+
+def _compress_member(
+    name: str, arr: np.array, codec: Codec, level: int | None
+) -> _CompressedMember:
+    member = _CompressedMember(name, codec, level)
+    # write_array streams the array to the member in buffered pieces.
+    np.lib.format.write_array(member, np.asanyarray(arr), allow_pickle=False)
+    member.close()
+    return member
+
+
+def _write_member(file: typing.BinaryIO, future: Future) -> _CompressedMember:
+    member = future.result()
+    member.offset = file.tell()
+    zip64 = max(member.size, member.compress_size) >= ZIP64_LIMIT
+    extra = (
+        struct.pack("<HHQQ", 1, 16, member.size, member.compress_size) if zip64 else b""
+    )
+    file.write(
+        struct.pack(
+            "<IHHHHHIIIHH",
+            0x04034B50,
+            member.version(zip64),
+            member.flags,
+            ZIP_COMPRESSION[member.codec],
+            DOS_TIME,
+            DOS_DATE,
+            member.crc,
+            ZIP64_MARKER if zip64 else member.compress_size,
+            ZIP64_MARKER if zip64 else member.size,
+            len(member.name),
+            len(extra),
+        )
+    )
+    file.write(member.name)
+    file.write(extra)
+    file.write(member.data)
+    member.data = b""
+    return member
+
+
+def _write_central_directory(file: typing.BinaryIO, members: list[_CompressedMember]):
+    start = file.tell()
+    for member in members:
+        # Fields that don't fit are replaced by markers and moved to a zip64 extra.
+        fields = (member.size, member.compress_size, member.offset)
+        large = [value for value in fields if value >= ZIP64_LIMIT]
+        extra = struct.pack(f"<HH{len(large)}Q", 1, 8 * len(large), *large)
+        size, compress_size, offset = (
+            ZIP64_MARKER if value >= ZIP64_LIMIT else value for value in fields
+        )
+        version = member.version(bool(large))
+        file.write(
+            struct.pack(
+                "<IHHHHHHIIIHHHHHII",
+                0x02014B50,
+                MADE_BY_UNIX | version,
+                version,
+                member.flags,
+                ZIP_COMPRESSION[member.codec],
+                DOS_TIME,
+                DOS_DATE,
+                member.crc,
+                compress_size,
+                size,
+                len(member.name),
+                len(extra) if large else 0,
+                0,
+                0,
+                0,
+                0o600 << 16,
+                offset,
+            )
+        )
+        file.write(member.name)
+        if large:
+            file.write(extra)
+    end = file.tell()
+
+    count, size = len(members), end - start
+    if count >= ZIP_COUNT_LIMIT or max(start, size) >= ZIP64_LIMIT:
+        file.write(
+            struct.pack(
+                "<IQHHIIQQQQ",
+                0x06064B50,
+                44,
+                MADE_BY_UNIX | ZIP64_VERSION,
+                ZIP64_VERSION,
+                0,
+                0,
+                count,
+                count,
+                size,
+                start,
+            )
+        )
+        file.write(struct.pack("<IIQI", 0x07064B50, 0, end, 1))
+    file.write(
+        struct.pack(
+            "<IHHHHIIH",
+            0x06054B50,
+            0,
+            0,
+            min(count, ZIP_COUNT_LIMIT),
+            min(count, ZIP_COUNT_LIMIT),
+            ZIP64_MARKER if size >= ZIP64_LIMIT else size,
+            ZIP64_MARKER if start >= ZIP64_LIMIT else start,
+            0,
+        )
+    )
@@ -0,0 +1,167 @@
+import mmap
+import os
+import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+SAMPLE_SIZE = 1 << 16
+DEFAULT_BLOCK_SIZE = 1 << 24
+INTEGER_PATTERN = re.compile(rb"[+-]?\d+")
+INTEGER_BYTES = b"0123456789+- \t\r\n"
+
+
+def infer_dtype(sample: bytes, delimiter: str | None = None) -> np.dtype:
+    lines = sample.splitlines()
+    tokens = (
+        token.strip()
+        for line in lines
+        for token in (line.split(delimiter.encode()) if delimiter else line.split())
+    )
+    if all(INTEGER_PATTERN.fullmatch(token) for token in tokens if token):
+        return np.dtype("int64")
+    return np.dtype("float64")
+
+
+def parse_block(
+    block: bytes, dtype: np.dtype, n_columns: int, delimiter: str | None = None
+) -> np.array:
+    block_bytes = np.frombuffer(block, dtype="uint8")
+    # Older numpy reads "6.5" as the integer 6 with only a warning.
+    if dtype.kind in "iu" and not _only_bytes(
+        block_bytes, INTEGER_BYTES + (delimiter or "").encode()
+    ):
+        raise ValueError(f"Block holds values that aren't {dtype}!")
+    lines = _line_contents(block_bytes)
+    if delimiter:
+        if not lines.all():
+            block = b"\n".join(line for line in block.split(b"\n") if line.strip())
+        # One delimited stream lets fromstring parse the block without the GIL.
+        block = block.replace(b"\r", b"").replace(b"\n", delimiter.encode())
+        values = np.fromstring(
+            block.rstrip(delimiter.encode()), dtype=dtype, sep=delimiter
+        )
+    else:
+        values = np.fromstring(block.strip(), dtype=dtype, sep=" ")
+
+    # fromstring stops at the first value it can't parse, so a short result is an error.
+    n_rows = int(np.count_nonzero(lines))
+    if values.size != n_rows * n_columns:
+        raise ValueError(
+            f"Expected {n_rows} rows of {n_columns} columns as {dtype}, "
+            f"parsed {values.size} values!"
+        )
+    return values.reshape(-1, n_columns)
+
+
+def read_delimited(
+    file_path: Path | str,
+    delimiter: str | None = None,
+    dtype: np.dtype | str | None = None,
+    max_workers: int | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> np.array:
+    with open(file_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return np.empty((0,), dtype=dtype or "float64")
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            sample = _complete_lines(buffer[:SAMPLE_SIZE], len(buffer) <= SAMPLE_SIZE)
+            n_columns = _count_columns(sample, delimiter)
+            block_dtype = np.dtype(dtype or infer_dtype(sample, delimiter))
+
+            def parse_range(bounds: tuple[int, int]) -> np.array:
+                block = buffer[slice(*bounds)]
+                try:
+                    return parse_block(block, block_dtype, n_columns, delimiter)
+                except ValueError:
+                    if dtype or block_dtype == np.dtype("float64"):
+                        raise
+                    # Rows after the sample may need floats where it only held
+                    # integers, only the ranges holding them are parsed again.
+                    return parse_block(block, np.dtype("float64"), n_columns, delimiter)
+
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                blocks = list(pool.map(parse_range, _split_ranges(buffer, block_size)))
+
+    # Integer ranges next to float ones are promoted to float64 here.
+    return np.squeeze(np.concatenate(blocks))
+
+
+def iter_delimited_blocks(
+    file_path: Path | str,
+    delimiter: str | None = None,
+    dtype: np.dtype | str | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> Iterator[np.array]:
+    inferred = False
+    with open(file_path, "rb") as file:
+        remainder = b""
+        while True:
+            data = file.read(block_size)
+            block = remainder + data
+            if not data:
+                remainder = b""
+            else:
+                line_end = block.rfind(b"\n") + 1
+                block, remainder = block[:line_end], block[line_end:]
+
+            if block.strip():
+                n_columns = _count_columns(block, delimiter)
+                if dtype is None:
+                    dtype = infer_dtype(block[:SAMPLE_SIZE], delimiter)
+                    inferred = True
+                try:
+                    rows = parse_block(block, np.dtype(dtype), n_columns, delimiter)
+                except ValueError:
+                    if not inferred or np.dtype(dtype) == np.dtype("float64"):
+                        raise
+                    # Blocks already yielded can't change, so a stream inferred as
+                    # int64 goes on as float64 from the first block holding a float.
+                    # Pass dtype to get one dtype for the whole stream.
+                    dtype = np.dtype("float64")
+                    rows = parse_block(block, dtype, n_columns, delimiter)
+                yield rows
+            if not data:
+                return
+
+
+def _complete_lines(sample: bytes, is_whole_file: bool) -> bytes:
+    if is_whole_file:
+        return sample
+    return sample[: sample.rfind(b"\n") + 1] or sample
+
+
+def _count_columns(sample: bytes, delimiter: str | None) -> int:
+    first_line = sample.lstrip().split(b"\n", 1)[0].strip()
+    return len(
+        first_line.split(delimiter.encode()) if delimiter else first_line.split()
+    )
+
+
+def _split_ranges(buffer: mmap.mmap, block_size: int) -> list[tuple[int, int]]:
+    ranges = []
+    start = 0
+    while start < len(buffer):
+        line_end = buffer.find(b"\n", min(start + block_size, len(buffer)) - 1)
+        stop = len(buffer) if line_end == -1 else line_end + 1
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def _line_contents(block: np.array) -> np.array:
+    # A line holds a row once it has any byte above the space, blank lines are skipped.
+    if block.size == 0:
+        return np.empty(0, dtype=bool)
+    line_starts = np.flatnonzero(block == ord("\n")) + 1
+    line_starts = np.concatenate(([0], line_starts[line_starts < len(block)]))
+    return np.logical_or.reduceat(block > ord(" "), line_starts)
+
+
+def _only_bytes(block: np.array, allowed: bytes) -> bool:
+    table = np.zeros(256, dtype=bool)
+    table[np.frombuffer(allowed, dtype="uint8")] = True
+    return bool(table[block].all())
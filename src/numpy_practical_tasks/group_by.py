@@ -0,0 +1,80 @@
+import numpy as np
+
+
+class GroupBy:
+    def __init__(self, keys: np.array):
+        keys = np.asarray(keys)
+        self.keys, self.first_index, self.codes = np.unique(
+            keys, return_index=True, return_inverse=True
+        )
+        self.codes = self.codes.reshape(-1)
+        self._order = None
+
+    @property
+    def n_groups(self) -> int:
+        return len(self.keys)
+
+    def count(self) -> np.array:
+        return np.bincount(self.codes, minlength=self.n_groups)
+
+    def sum(self, values: np.array) -> np.array:
+        values = self._check_values(values)
+        if np.issubdtype(values.dtype, np.integer) or values.dtype == np.bool_:
+            result = np.zeros(self.n_groups, dtype="int64")
+            np.add.at(result, self.codes, values)
+            return result
+        return np.bincount(self.codes, weights=values, minlength=self.n_groups)
+
+    def mean(self, values: np.array) -> np.array:
+        return self.sum(values) / self.count()
+
+    def min(self, values: np.array) -> np.array:
+        return self._reduce_sorted(np.minimum, values)
+
+    def max(self, values: np.array) -> np.array:
+        return self._reduce_sorted(np.maximum, values)
+
+    def top_k(
+        self, values: np.array, k: int, aggregation: str = "sum"
+    ) -> tuple[np.array, np.array]:
+        if k < 0:
+            raise ValueError(f"k should be non-negative, got {k}!")
+        if aggregation not in {"sum", "count", "mean", "min", "max"}:
+            raise ValueError(f"Invalid aggregation {aggregation}!")
+
+        aggregated = (
+            self.count()
+            if aggregation == "count"
+            else getattr(self, aggregation)(values)
+        )
+        k = min(k, self.n_groups)
+        if k == 0:
+            return self.keys[:0], aggregated[:0]
+
+        threshold = np.partition(aggregated, self.n_groups - k)[self.n_groups - k]
+        candidates = np.flatnonzero(aggregated >= threshold)
+        # Equal aggregates keep key order so the output is deterministic.
+        candidates = candidates[np.lexsort((candidates, -aggregated[candidates]))][:k]
+        return self.keys[candidates], aggregated[candidates]
+
+    def argmax_first_seen(self, aggregated: np.array) -> int:
+        # Ties resolve to the key that appeared first in the input, like Counter.
+        candidates = np.flatnonzero(aggregated == aggregated.max())
+        return candidates[np.argmin(self.first_index[candidates])]
+
+    def _check_values(self, values: np.array) -> np.array:
+        values = np.asarray(values).reshape(-1)
+        if values.size != self.codes.size:
+            raise ValueError(
+                f"Values size {values.size} doesn't match keys size {self.codes.size}!"
+            )
+        return values
+
+    def _reduce_sorted(self, ufunc: np.ufunc, values: np.array) -> np.array:
+        values = self._check_values(values)
+        if self.n_groups == 0:
+            return values[:0]
+        if self._order is None:
+            self._order = np.argsort(self.codes, kind="stable")
+        starts = np.concatenate(([0], np.cumsum(self.count())[:-1]))
+        return ufunc.reduceat(values[self._order], starts)
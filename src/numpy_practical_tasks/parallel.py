@@ -0,0 +1,118 @@
+import os
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from src.numpy_practical_tasks.group_by import GroupBy
+
+
+class ShardedExecutor:
+    def __init__(self, max_workers: int | None = None, n_shards: int | None = None):
+        if (max_workers is not None and max_workers < 1) or (
+            n_shards is not None and n_shards < 1
+        ):
+            raise ValueError(
+                f"Workers and shards should be positive, got {max_workers} "
+                f"workers and {n_shards} shards!"
+            )
+        self.max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        self.n_shards = self.max_workers if n_shards is None else n_shards
+
+    def total_revenue(self, arr: np.array) -> np.float64:
+        partials = self._map(
+            lambda shard: np.sum(shard["quantity"] * shard["price"]),
+            arr,
+            ("quantity", "price"),
+        )
+        return np.sum(partials, dtype="float64")
+
+    def product_quantities(self, arr: np.array) -> tuple[np.array, np.array]:
+        keys, totals, _ = self._merge_sums(
+            self._map(
+                lambda shard: _partial_sums(shard["product_id"], shard["quantity"]),
+                arr,
+                ("product_id", "quantity"),
+            )
+        )
+        return keys, totals
+
+    def most_purchased_product(self, arr: np.array) -> int:
+        keys, totals, first_seen = self._merge_sums(
+            self._map(
+                lambda shard: _partial_sums(
+                    shard["product_id"], shard["quantity"], shard["offset"]
+                ),
+                arr,
+                ("product_id", "quantity"),
+            )
+        )
+        candidates = np.flatnonzero(totals == totals.max())
+        return int(keys[candidates[np.argmin(first_seen[candidates])]])
+
+    def transaction_count_per_user(self, arr: np.array) -> np.array:
+        keys, counts, first_seen = self._merge_sums(
+            self._map(
+                lambda shard: _partial_sums(
+                    shard["user_id"],
+                    np.ones(len(shard["user_id"]), dtype="int64"),
+                    shard["offset"],
+                ),
+                arr,
+                ("user_id",),
+            )
+        )
+        order = np.argsort(first_seen)
+        return np.rec.fromarrays(
+            [keys[order], counts[order]],
+            dtype=[
+                ("user_id", arr.dtype["user_id"].name),
+                ("transaction_count", "int64"),
+            ],
+        )
+
+    def top_n_products_by_revenue(self, arr: np.array, top: int) -> np.array:
+        keys, revenue, _ = self._merge_sums(
+            self._map(
+                lambda shard: _partial_sums(
+                    shard["product_id"], shard["quantity"] * shard["price"]
+                ),
+                arr,
+                ("product_id", "quantity", "price"),
+            )
+        )
+        product_ids, _ = GroupBy(keys).top_k(revenue, top)
+        return product_ids
+
+    def _map(
+        self,
+        function: typing.Callable[[dict[str, np.array]], typing.Any],
+        arr: np.array,
+        columns: tuple[str, ...],
+    ) -> list:
+        bounds = np.linspace(0, len(arr), self.n_shards + 1).astype("int64")
+        # Slices of the columns are views, shards never copy the input.
+        shards = [
+            {
+                "offset": start,
+                **{name: getattr(arr, name)[start:stop] for name in columns},
+            }
+            for start, stop in zip(bounds[:-1].tolist(), bounds[1:].tolist())
+        ]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(function, shards))
+
+    @staticmethod
+    def _merge_sums(
+        partials: list[tuple[np.array, np.array, np.array]],
+    ) -> tuple[np.array, np.array, np.array]:
+        keys, sums, first_seen = (np.concatenate(part) for part in zip(*partials))
+        group_by = GroupBy(keys)
+        return group_by.keys, group_by.sum(sums), group_by.min(first_seen)
+
+
+def _partial_sums(
+    keys: np.array, values: np.array, offset: int = 0
+) -> tuple[np.array, np.array, np.array]:
+    group_by = GroupBy(keys)
+    return group_by.keys, group_by.sum(values), group_by.first_index + offset
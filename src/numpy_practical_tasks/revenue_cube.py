@@ -0,0 +1,209 @@
+import typing
+
+import numpy as np
+
+from src.numpy_practical_tasks.array_builder import ArrayBuilder
+
+EPOCH = np.datetime64("1970-01-01T00:00:00")
+# A row is found by one int64 code, its key in the high bits and its second in the
+# low ones, so a window of one key is a range of codes.
+TIME_BITS = 34
+TIME_OFFSET = 1 << (TIME_BITS - 1)
+MAX_TIME = (1 << TIME_BITS) - 1
+MAX_KEY = (1 << (63 - TIME_BITS)) - 1
+
+
+class RevenueCube:
+    # Revenue is kept as running sums over rows sorted by (key, time), the total
+    # under one key and optionally a copy per product or user. Any window, bucket
+    # aligned or not, is the difference of two running sums found by binary search,
+    # so the memory is about two floats and two ints per transaction.
+    def __init__(self, by: typing.Literal["product_id", "user_id"] | None = None):
+        self.by = by
+        self.keys = np.array([], dtype="int64")
+        self.total = _RunningSums()
+        self.per_key = _RunningSums()
+
+    @classmethod
+    def from_array(
+        cls,
+        arr: np.array,
+        by: typing.Literal["product_id", "user_id"] | None = None,
+    ) -> "RevenueCube":
+        cube = cls(by=by)
+        cube.append(arr)
+        return cube
+
+    def __len__(self) -> int:
+        return len(self.total)
+
+    def append(self, arr: np.array):
+        if len(arr) == 0:
+            return
+
+        timestamps = np.asarray(arr.timestamp)
+        seconds = timestamps.astype("datetime64[s]")
+        if np.any(seconds != timestamps):
+            raise ValueError("Revenue cube keeps timestamps in whole seconds!")
+        times = (seconds - EPOCH).astype("int64") + TIME_OFFSET
+        if times.min() < 0 or times.max() > MAX_TIME:
+            raise ValueError(
+                f"Timestamps should be between {_timestamp(0)} and "
+                f"{_timestamp(MAX_TIME)}!"
+            )
+        revenues = np.asarray(arr.quantity * arr.price, dtype="float64")
+
+        self.total.append(times, revenues)
+        if self.by:
+            keys = np.asarray(getattr(arr, self.by), dtype="int64")
+            if keys.min() < 0 or keys.max() > MAX_KEY:
+                raise ValueError(
+                    f"Keys of {self.by} should be between 0 and {MAX_KEY}!"
+                )
+            self.keys = np.union1d(self.keys, keys)
+            self.per_key.append((keys << TIME_BITS) | times, revenues)
+
+    def revenue(
+        self,
+        start: np.datetime64 | np.ndarray,
+        end: np.datetime64 | np.ndarray,
+        key: int | None = None,
+    ) -> np.floating | np.ndarray:
+        if key is None:
+            revenue = self.total.window(0, *_time_bounds(start, end))
+        else:
+            index = np.searchsorted(self.keys, key)
+            if index == len(self.keys) or self.keys[index] != key:
+                return np.zeros(np.shape(start))[()]
+            revenue = self.per_key.window(key, *_time_bounds(start, end))
+        return np.where(np.asarray(start) > np.asarray(end), 0.0, revenue)[()]
+
+    def revenue_per_key(
+        self, start: np.datetime64, end: np.datetime64
+    ) -> tuple[np.array, np.array]:
+        if not self.by:
+            raise ValueError("Revenue cube isn't kept by key!")
+        revenue = self.per_key.window(self.keys, *_time_bounds(start, end))
+        return self.keys, revenue if start <= end else np.zeros_like(revenue)
+
+    def compare(
+        self,
+        periods_one: np.array,
+        periods_two: np.array,
+        function_to_compare: typing.Callable[[np.array, np.array], np.array],
+    ) -> np.array:
+        periods_one = np.asarray(periods_one, dtype="datetime64[s]")
+        periods_two = np.asarray(periods_two, dtype="datetime64[s]")
+
+        return np.asarray(
+            function_to_compare(
+                self.revenue(periods_one[:, 0], periods_one[:, 1]),
+                self.revenue(periods_two[:, 0], periods_two[:, 1]),
+            )
+        )
+
+
+class _RunningSums:
+    # Sorted codes and, for each of them, the revenue of its key up to and including
+    # it. Rows later than every kept code extend the buffers in place, others are
+    # merged in with one insert, and only the sums of the keys they land in change.
+    def __init__(self):
+        self._codes = ArrayBuilder(dtype="int64")
+        self._sums = ArrayBuilder(dtype="float64")
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    @property
+    def codes(self) -> np.array:
+        return self._codes.result()
+
+    @property
+    def sums(self) -> np.array:
+        return self._sums.result()
+
+    def append(self, codes: np.array, revenues: np.array):
+        order = np.argsort(codes, kind="stable")
+        codes, revenues = codes[order], revenues[order]
+        kept_codes, kept_sums = self.codes, self.sums
+
+        if len(kept_codes) == 0 or codes[0] >= kept_codes[-1]:
+            carry = (
+                kept_sums[-1]
+                if len(kept_codes) and _key(codes[0]) == _key(kept_codes[-1])
+                else 0.0
+            )
+            sums = _running_sums(_key(codes), revenues)
+            sums[_key(codes) == _key(codes[0])] += carry
+            self._codes.append(codes)
+            self._sums.append(sums)
+            return
+
+        positions = np.searchsorted(kept_codes, codes, side="right")
+        merged_codes = np.insert(kept_codes, positions, codes)
+        # New rows start from the running sum of the row of the same key before them.
+        previous = np.maximum(positions - 1, 0)
+        same_key = (positions > 0) & (_key(kept_codes[previous]) == _key(codes))
+        merged_sums = np.insert(
+            kept_sums, positions, np.where(same_key, kept_sums[previous], 0.0)
+        )
+        # Rows after an insert gain its revenue, up to the end of their key.
+        inserted = positions + np.arange(len(codes))
+        first = inserted[0]
+        added = np.zeros(len(merged_codes) - first)
+        added[inserted - first] = revenues
+        merged_sums[first:] += _running_sums(_key(merged_codes[first:]), added)
+
+        self._codes.clear().append(merged_codes)
+        self._sums.clear().append(merged_sums)
+
+    def window(
+        self,
+        key: int | np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray,
+    ) -> np.floating | np.ndarray:
+        key = np.asarray(key, dtype="int64") << TIME_BITS
+        return self._sum_before(key, key + upper, "right") - self._sum_before(
+            key, key + lower, "left"
+        )
+
+    def _sum_before(
+        self,
+        key_start: np.ndarray,
+        bound: np.ndarray,
+        side: typing.Literal["left", "right"],
+    ) -> np.ndarray:
+        codes, sums = self.codes, self.sums
+        position = np.searchsorted(codes, bound, side=side)
+        # The running sum restarts at every key, nothing is before its first row.
+        inside = position > np.searchsorted(codes, key_start, side="left")
+        return np.where(inside, sums[np.maximum(position - 1, 0)], 0.0)
+
+
+def _key(codes: np.array) -> np.array:
+    return codes >> TIME_BITS
+
+
+def _running_sums(keys: np.array, revenues: np.array) -> np.array:
+    sums = np.cumsum(revenues)
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    before = np.concatenate(([0.0], sums))[starts]
+    return sums - np.repeat(before, np.diff(np.append(starts, len(keys))))
+
+
+def _time_bounds(
+    start: np.datetime64 | np.ndarray, end: np.datetime64 | np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    # Rows have whole seconds, so a start inside a second begins at the next one.
+    start, end = np.asarray(start), np.asarray(end)
+    start_seconds = start.astype("datetime64[s]")
+    start_seconds = np.where(start_seconds < start, start_seconds + 1, start_seconds)
+    lower = (start_seconds - EPOCH).astype("int64") + TIME_OFFSET
+    upper = (end.astype("datetime64[s]") - EPOCH).astype("int64") + TIME_OFFSET
+    # Bounds past the representable range select nothing or everything of a key.
+    return np.clip(lower, 0, MAX_TIME + 1), np.clip(upper, -1, MAX_TIME)
+
+
+def _timestamp(time: int) -> np.datetime64:
+    return EPOCH + np.timedelta64(time - TIME_OFFSET, "s")
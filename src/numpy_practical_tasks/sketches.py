@@ -0,0 +1,167 @@
+import numpy as np
+
+HLL_MIN_PRECISION = 4
+HLL_MAX_PRECISION = 18
+
+
+def hash_values(values: np.array) -> np.array:
+    values = np.ascontiguousarray(values).reshape(-1)
+    if np.issubdtype(values.dtype, np.integer) or values.dtype == np.bool_:
+        hashed = values.astype("int64").view("uint64")
+    elif np.issubdtype(values.dtype, np.floating):
+        hashed = values.astype("float64").view("uint64")
+    else:
+        raise TypeError(f"Can't hash values with dtype {values.dtype}!")
+
+    # splitmix64 finalizer, uint64 arithmetic wraps around as intended.
+    hashed = hashed + np.uint64(0x9E3779B97F4A7C15)
+    hashed = (hashed ^ (hashed >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    hashed = (hashed ^ (hashed >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return hashed ^ (hashed >> np.uint64(31))
+
+
+def _bit_length(values: np.array) -> np.array:
+    high = (values >> np.uint64(32)).astype("float64")
+    low = (values & np.uint64(0xFFFFFFFF)).astype("float64")
+    return np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+
+
+class HyperLogLog:
+    def __init__(self, precision: int = 14):
+        if not HLL_MIN_PRECISION <= precision <= HLL_MAX_PRECISION:
+            raise ValueError(
+                f"Precision should be between {HLL_MIN_PRECISION} and "
+                f"{HLL_MAX_PRECISION}, got {precision}!"
+            )
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype="uint8")
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / np.sqrt(len(self.registers))
+
+    def update(self, values: np.array) -> "HyperLogLog":
+        hashed = hash_values(values)
+        if hashed.size == 0:
+            return self
+
+        shift = np.uint64(64 - self.precision)
+        register_index = (hashed >> shift).astype("intp")
+        remaining = hashed << np.uint64(self.precision)
+        rank = np.minimum(64 - _bit_length(remaining) + 1, 64 - self.precision + 1)
+
+        np.maximum.at(self.registers, register_index, rank.astype("uint8"))
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.precision != self.precision:
+            raise ValueError(
+                f"Can't merge sketches with precision {self.precision} "
+                f"and {other.precision}!"
+            )
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw_estimate = (
+            alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype("int64")))
+        )
+
+        empty_registers = np.count_nonzero(self.registers == 0)
+        if raw_estimate <= 2.5 * m and empty_registers:
+            # Linear counting is more accurate while many registers are empty.
+            return float(m * np.log(m / empty_registers))
+        return float(raw_estimate)
+
+
+class SpaceSaving:
+    def __init__(self, capacity: int = 1000):
+        if capacity < 1:
+            raise ValueError(f"Capacity should be positive, got {capacity}!")
+        self.capacity = capacity
+        self.keys = np.array([], dtype="int64")
+        self.counts = np.array([], dtype="int64")
+        self.errors = np.array([], dtype="int64")
+        self.total = 0
+
+    @property
+    def max_error(self) -> float:
+        return self.total / self.capacity
+
+    def update(
+        self, keys: np.array, weights: np.ndarray | None = None
+    ) -> "SpaceSaving":
+        keys = np.asarray(keys).reshape(-1)
+        chunk_keys, codes = np.unique(keys, return_inverse=True)
+        weights = np.ones(keys.size, dtype="int64") if weights is None else weights
+        chunk_counts = np.zeros(len(chunk_keys), dtype="int64")
+        np.add.at(chunk_counts, codes.reshape(-1), np.asarray(weights).reshape(-1))
+
+        # A chunk summary is exact, so keys missing from it have a zero count.
+        self._combine(
+            chunk_keys,
+            chunk_counts,
+            np.zeros_like(chunk_counts),
+            floor=0,
+            total=int(chunk_counts.sum()),
+        )
+        return self
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        self._combine(
+            other.keys,
+            other.counts,
+            other.errors,
+            floor=other._floor(),
+            total=other.total,
+        )
+        return self
+
+    def most_common(self, n: int | None = None) -> list[tuple[int, int, int]]:
+        order = np.lexsort((self.keys, -self.counts))[:n]
+        return [
+            (int(key), int(count), int(error))
+            for key, count, error in zip(
+                self.keys[order], self.counts[order], self.errors[order]
+            )
+        ]
+
+    def _floor(self) -> int:
+        # Any key that is not monitored occurred at most this many times.
+        return int(self.counts.min()) if len(self.keys) >= self.capacity else 0
+
+    def _combine(
+        self,
+        keys: np.array,
+        counts: np.array,
+        errors: np.array,
+        floor: int,
+        total: int,
+    ):
+        own_floor = self._floor()
+        all_keys = np.union1d(self.keys, keys)
+        all_counts = np.full(len(all_keys), own_floor + floor, dtype="int64")
+        all_errors = all_counts.copy()
+
+        own_positions = np.searchsorted(all_keys, self.keys)
+        all_counts[own_positions] += self.counts - own_floor
+        all_errors[own_positions] += self.errors - own_floor
+
+        positions = np.searchsorted(all_keys, keys)
+        all_counts[positions] += counts - floor
+        all_errors[positions] += errors - floor
+
+        if len(all_keys) > self.capacity:
+            kept = np.sort(
+                np.argpartition(-all_counts, self.capacity - 1)[: self.capacity]
+            )
+            all_keys, all_counts, all_errors = (
+                all_keys[kept],
+                all_counts[kept],
+                all_errors[kept],
+            )
+
+        self.total += total
+        self.keys, self.counts, self.errors = all_keys, all_counts, all_errors
@@ -0,0 +1,237 @@
+import typing
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+
+DEFAULT_CHUNK_ROWS = 1 << 16
+DEFAULT_SKETCH_SIZE = 200
+
+
+def iter_row_chunks(
+    data: np.ndarray | Iterable[np.ndarray], chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> Iterator[np.array]:
+    if not isinstance(data, np.ndarray):
+        yield from data
+        return
+
+    # Slicing a memmap only pages in the rows of the current chunk.
+    data = np.atleast_1d(data)
+    for start in range(0, len(data), chunk_rows):
+        yield data[start : start + chunk_rows]
+
+
+class StreamingMoments:
+    def __init__(self, axis: typing.Literal[0] | None = None):
+        if axis not in (None, 0):
+            raise ValueError(f"Moments can be merged over axis 0 or None, got {axis}!")
+        self.axis = axis
+        self.count = 0
+        self.total = None
+        self.mean = None
+        self.m2 = None
+        self.min = None
+        self.max = None
+
+    def update(self, chunk: np.array) -> "StreamingMoments":
+        chunk = np.asarray(chunk)
+        chunk = chunk.reshape(-1) if self.axis is None else np.atleast_1d(chunk)
+        if len(chunk) == 0:
+            return self
+
+        other = StreamingMoments(axis=self.axis)
+        other.count = len(chunk)
+        other.total = chunk.sum(axis=0)
+        other.mean = chunk.mean(axis=0)
+        other.m2 = np.sum(np.square(chunk - other.mean), axis=0)
+        other.min = chunk.min(axis=0)
+        other.max = chunk.max(axis=0)
+        return self.merge(other)
+
+    def merge(self, other: "StreamingMoments") -> "StreamingMoments":
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.total, self.mean = other.count, other.total, other.mean
+            self.m2, self.min, self.max = other.m2, other.min, other.max
+            return self
+
+        # Chan et al. pairwise update keeps the variance numerically stable.
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * other.count / count
+        self.m2 = (
+            self.m2 + other.m2 + np.square(delta) * self.count * other.count / count
+        )
+        self.total = self.total + other.total
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        self.count = count
+        return self
+
+    def variance(self, ddof: int = 0) -> np.floating | np.ndarray:
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof: int = 0) -> np.floating | np.ndarray:
+        return np.sqrt(self.variance(ddof=ddof))
+
+
+class KLLSketch:
+    def __init__(self, k: int = DEFAULT_SKETCH_SIZE, seed: int | None = None):
+        if k < 8:
+            raise ValueError(f"Sketch size should be at least 8, got {k}!")
+        self.k = k
+        self.count = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def rank_error(self) -> float:
+        # Empirical normalized rank error of KLL for a single quantile query.
+        return 2.296 / self.k**0.9723
+
+    def update(self, values: np.array) -> "KLLSketch":
+        values = np.asarray(values, dtype="float64").reshape(-1)
+        values = values[~np.isnan(values)]
+        self.levels[0] = np.concatenate((self.levels[0], values))
+        self.count += len(values)
+        self._compress()
+        return self
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        if other.k != self.k:
+            raise ValueError(f"Can't merge sketches of size {self.k} and {other.k}!")
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate((self.levels[level], items))
+        self.count += other.count
+        self._compress()
+        return self
+
+    def quantile(self, q: float | np.ndarray) -> np.floating | np.ndarray:
+        if self.count == 0:
+            return np.full(np.shape(q), np.nan)[()]
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(level), 2.0**depth) for depth, level in enumerate(self.levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        positions = np.searchsorted(
+            cumulative, np.asarray(q) * cumulative[-1], side="left"
+        )
+        return items[order][np.clip(positions, 0, len(items) - 1)][()]
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        while True:
+            level = next(
+                (
+                    level
+                    for level, items in enumerate(self.levels)
+                    if len(items) > self._capacity(level)
+                ),
+                None,
+            )
+            if level is None:
+                return
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+
+            items = np.sort(self.levels[level])
+            kept, items = items[: len(items) % 2], items[len(items) % 2 :]
+            promoted = items[self._rng.integers(2) :: 2]
+            self.levels[level] = kept
+            self.levels[level + 1] = np.concatenate((self.levels[level + 1], promoted))
+
+
+def streaming_sum(
+    data: np.ndarray | Iterable[np.ndarray], axis: int | None = None
+) -> np.floating | np.ndarray:
+    if axis not in (None, 0):
+        return _apply_per_chunk(np.sum, data, axis)
+    return _moments(data, axis).total
+
+
+def streaming_mean(
+    data: np.ndarray | Iterable[np.ndarray], axis: int | None = None
+) -> np.floating | np.ndarray:
+    if axis not in (None, 0):
+        return _apply_per_chunk(np.mean, data, axis)
+    return _moments(data, axis).mean
+
+
+def streaming_std(
+    data: np.ndarray | Iterable[np.ndarray], axis: int | None = None
+) -> np.floating | np.ndarray:
+    if axis not in (None, 0):
+        return _apply_per_chunk(np.std, data, axis)
+    return _moments(data, axis).std()
+
+
+def streaming_quantile(
+    data: np.ndarray | Iterable[np.ndarray],
+    q: float | np.ndarray,
+    axis: int | None = None,
+    k: int = DEFAULT_SKETCH_SIZE,
+) -> np.floating | np.ndarray:
+    if axis not in (None, 0):
+        # Quantile levels lead the result, rows have to lead while concatenating.
+        result = _apply_per_chunk(
+            lambda chunk, axis: (
+                np.moveaxis(np.quantile(chunk, q, axis=axis), 0, -1)
+                if np.ndim(q)
+                else np.quantile(chunk, q, axis=axis)
+            ),
+            data,
+            axis,
+        )
+        return np.moveaxis(result, -1, 0) if np.ndim(q) else result
+
+    sketches, row_shape = None, ()
+    for chunk in iter_row_chunks(data):
+        chunk = np.asarray(chunk)
+        if axis is None:
+            chunk = chunk.reshape(-1, 1)
+        else:
+            row_shape = chunk.shape[1:]
+            chunk = chunk.reshape(len(chunk), -1)
+        if sketches is None:
+            sketches = [KLLSketch(k=k, seed=column) for column in range(chunk.shape[1])]
+        for column, sketch in enumerate(sketches):
+            sketch.update(chunk[:, column])
+
+    if sketches is None:
+        return np.nan
+    result = np.stack([np.asarray(sketch.quantile(q)) for sketch in sketches], axis=-1)
+    return result.reshape(np.shape(q) + row_shape)[()]
+
+
+def streaming_median(
+    data: np.ndarray | Iterable[np.ndarray], axis: int | None = None
+) -> np.floating | np.ndarray:
+    return streaming_quantile(data, 0.5, axis=axis)
+
+
+def _moments(
+    data: np.ndarray | Iterable[np.ndarray], axis: typing.Literal[0] | None
+) -> StreamingMoments:
+    moments = StreamingMoments(axis=axis)
+    for chunk in iter_row_chunks(data):
+        moments.update(chunk)
+    return moments
+
+
+def _apply_per_chunk(
+    function: typing.Callable[[np.array, int], np.array],
+    data: np.ndarray | Iterable[np.ndarray],
+    axis: int,
+) -> np.array:
+    # Reductions over other axes are local to each row, chunks don't interact.
+    return np.concatenate(
+        [np.atleast_1d(function(chunk, axis)) for chunk in iter_row_chunks(data)]
+    )
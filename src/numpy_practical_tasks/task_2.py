@@ -1,10 +1,14 @@
 import operator
 import typing
-from collections import Counter, defaultdict
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 
 import numpy as np
 
+from src.numpy_practical_tasks.group_by import GroupBy
+from src.numpy_practical_tasks.revenue_cube import RevenueCube
+from src.numpy_practical_tasks.sketches import HyperLogLog, SpaceSaving
+from src.numpy_practical_tasks.time_index import TimeIndex
+from src.numpy_practical_tasks.user_index import UserIndex
 from src.numpy_practical_tasks.utils import print_array
 
 
@@ -23,10 +27,10 @@ def create_array() -> np.array:
             (10, 6, 1, 10, 100.1, "2024-08-01T00:00:00+0000"),
         ],
         dtype=[
-            ("transaction_id", "int8"),
-            ("user_id", "int8"),
-            ("product_id", "int8"),
-            ("quantity", "int8"),
+            ("transaction_id", "int64"),
+            ("user_id", "int64"),
+            ("product_id", "int64"),
+            ("quantity", "int64"),
             ("price", "float64"),
             ("timestamp", "datetime64[s]"),
         ],
@@ -34,7 +38,8 @@ def create_array() -> np.array:
 
 
 def calculate_total_revenue(arr: np.array) -> np.float64:
-    return sum(arr.quantity * arr.price)
+    # dot promotes narrow quantity columns to float64 before multiplying.
+    return np.dot(arr.quantity, arr.price)
 
 
 def calculate_unique_users(arr: np.array) -> int:
@@ -42,12 +47,28 @@ def calculate_unique_users(arr: np.array) -> int:
 
 
 def calculate_most_purchased_product(arr: np.array) -> int:
-    result_quantity = defaultdict(int)
+    group_by = GroupBy(arr.product_id)
+    total_quantity = group_by.sum(arr.quantity)
 
-    for product, quantity in zip(arr.product_id, arr.quantity):
-        result_quantity[product] += quantity
+    return int(group_by.keys[group_by.argmax_first_seen(total_quantity)])
 
-    return int(Counter(result_quantity).most_common(1)[0][0])
+
+def estimate_unique_users(
+    chunks: Iterable[np.array], precision: int = 14
+) -> HyperLogLog:
+    sketch = HyperLogLog(precision=precision)
+    for chunk in chunks:
+        sketch.update(chunk.user_id)
+    return sketch
+
+
+def estimate_most_purchased_product(
+    chunks: Iterable[np.array], capacity: int = 1000
+) -> SpaceSaving:
+    sketch = SpaceSaving(capacity=capacity)
+    for chunk in chunks:
+        sketch.update(chunk.product_id, chunk.quantity)
+    return sketch
 
 
 def cast_float_to_int(arr: np.array) -> np.array:
@@ -60,28 +81,25 @@ def check_dtype_of_each_column(arr: np.array) -> dict:
     return {name: dtype[0].name for name, dtype in arr.dtype.fields.items()}
 
 
+def project_columns(arr: np.array, names: Sequence[str]) -> np.array:
+    return arr[list(names)]
+
+
 def create_product_quantity_array(arr: np.array) -> np.array:
-    return np.rec.array(
-        [arr.product_id, arr.quantity],
-        dtype=[
-            ("product_id", arr.dtype["product_id"].name),
-            ("quantity", arr.dtype["quantity"].name),
-        ],
-    )
+    return project_columns(arr, ("product_id", "quantity"))
 
 
 def calculate_transaction_count_per_user(arr: np.array) -> np.array:
-    user_transactions = defaultdict(int)
+    group_by = GroupBy(arr.user_id)
+    # Users keep the order they first appear in, like the counts did before grouping.
+    first_seen = np.argsort(group_by.first_index)
 
-    for user_id, _ in zip(arr.user_id, arr.transaction_id):
-        user_transactions[user_id] += 1
-
-    return np.rec.array(
-        [
-            (user, transaction_count)
-            for user, transaction_count in user_transactions.items()
+    return np.rec.fromarrays(
+        [group_by.keys[first_seen], group_by.count()[first_seen]],
+        dtype=[
+            ("user_id", arr.dtype["user_id"].name),
+            ("transaction_count", "int64"),
         ],
-        dtype=[("user_id", "int8"), ("transaction_count", "int8")],
     )
 
 
@@ -92,7 +110,7 @@ def create_masked_array_quantity_zero(arr: np.array) -> np.array:
 def increase_price(arr: np.array, percentage_to_increase: float) -> np.array:
     if percentage_to_increase < 0 or percentage_to_increase > 1:
         raise ValueError("Percentage to increase should be between 0 and 1!")
-    arr.price += arr.price * percentage_to_increase
+    np.multiply(arr.price, 1 + percentage_to_increase, out=arr.price)
     return arr
 
 
@@ -105,13 +123,15 @@ def compare_revenue(
     period_one: Sequence[np.datetime64, np.datetime64],
     period_two: Sequence[np.datetime64, np.datetime64],
     function_to_compare: typing.Callable[[np.floating, np.floating], bool],
+    time_index: TimeIndex | None = None,
+    revenue_cube: RevenueCube | None = None,
 ) -> bool:
-    revenue_period_one = calculate_total_revenue(
-        arr[(arr.timestamp >= period_one[0]) & (arr.timestamp <= period_one[1])]
-    )
-    revenue_period_two = calculate_total_revenue(
-        arr[(arr.timestamp >= period_two[0]) & (arr.timestamp <= period_two[1])]
-    )
+    if revenue_cube is not None:
+        revenue_period_one = revenue_cube.revenue(*period_one)
+        revenue_period_two = revenue_cube.revenue(*period_two)
+    else:
+        revenue_period_one = _period_revenue(arr, period_one, time_index)
+        revenue_period_two = _period_revenue(arr, period_two, time_index)
 
     result = function_to_compare(revenue_period_one, revenue_period_two)
     if not isinstance(result, np.bool):
@@ -119,29 +139,43 @@ def compare_revenue(
     return bool(result)
 
 
-def get_user_transactions(arr: np.array, user_id: int) -> np.array:
+def get_user_transactions(
+    arr: np.array, user_id: int, user_index: UserIndex | None = None
+) -> np.array:
+    if user_index is not None:
+        return user_index.transactions(user_id)
     return arr[arr.user_id == user_id].transaction_id
 
 
 def filter_array_by_date_range(
-    arr: np.array, period: Sequence[np.datetime64, np.datetime64]
+    arr: np.array,
+    period: Sequence[np.datetime64, np.datetime64],
+    time_index: TimeIndex | None = None,
 ) -> np.array:
-    return arr[
-        (arr.timestamp >= period[0]) & (arr.timestamp <= period[1])
-    ].transaction_id
-
+    if time_index is None:
+        return arr[
+            (arr.timestamp >= period[0]) & (arr.timestamp <= period[1])
+        ].transaction_id
+    return arr.transaction_id[time_index.rows_in_input_order(period)]
 
-def get_top_n_products_by_revenue(arr: np.array, top: int) -> np.array:
-    revenue = arr.price * arr.quantity
-    product_ids = np.unique(arr.product_id)
 
-    total_revenues = np.zeros_like(product_ids, dtype=float)
+def _period_revenue(
+    arr: np.array,
+    period: Sequence[np.datetime64, np.datetime64],
+    time_index: TimeIndex | None = None,
+) -> np.floating:
+    if time_index is None:
+        return calculate_total_revenue(
+            arr[(arr.timestamp >= period[0]) & (arr.timestamp <= period[1])]
+        )
+    # Revenue doesn't depend on row order, the slice of the permutation is enough.
+    rows = time_index.rows(period)
+    return np.dot(arr.quantity[rows], arr.price[rows])
 
-    for i, product_id in enumerate(product_ids):
-        total_revenues[i] = np.sum(revenue[arr.product_id == product_id])
 
-    top = min(top, len(total_revenues))
-    return arr[np.argsort(total_revenues)[-top:][::-1]].product_id
+def get_top_n_products_by_revenue(arr: np.array, top: int) -> np.array:
+    product_ids, _ = GroupBy(arr.product_id).top_k(arr.price * arr.quantity, top)
+    return product_ids
 
 
 if __name__ == "__main__":
@@ -1,7 +1,10 @@
 import numpy as np
 
+from src.numpy_practical_tasks.array_builder import ArrayBuilder
 from src.numpy_practical_tasks.utils import print_array
 
+TILE_BYTES = 1 << 14
+
 
 def create_array() -> np.array:
     return np.random.randint(0, 100, size=(6, 6))
@@ -11,6 +14,24 @@ def transpose(arr: np.array) -> np.array:
     return arr.transpose()
 
 
+def blocked_transpose(arr: np.array, tile_size: int | None = None) -> np.array:
+    if arr.ndim != 2:
+        return np.ascontiguousarray(arr.transpose())
+    tile_size = tile_size or _tile_size(arr.dtype)
+    if tile_size < 1:
+        raise ValueError(f"Tile size should be positive, got {tile_size}!")
+
+    rows, columns = arr.shape
+    result = np.empty((columns, rows), dtype=arr.dtype)
+    # Both the read and the written tile stay in cache, unlike a strided copy.
+    for row in range(0, rows, tile_size):
+        for column in range(0, columns, tile_size):
+            result[column : column + tile_size, row : row + tile_size] = arr[
+                row : row + tile_size, column : column + tile_size
+            ].transpose()
+    return result
+
+
 def reshape_array(arr: np.array, new_shape: tuple) -> np.array:
     return arr.reshape(new_shape)
 
@@ -25,6 +46,11 @@ def combine_arrays(*args, axis: int = 0) -> np.array:
     return np.concatenate(args, axis=axis)
 
 
+def _tile_size(dtype: np.dtype) -> int:
+    side = int(np.sqrt(TILE_BYTES / dtype.itemsize))
+    return 1 << max(side.bit_length() - 1, 0)
+
+
 if __name__ == "__main__":
     initial_array = create_array()
     assert initial_array.shape == (6, 6)
@@ -34,6 +60,10 @@ if __name__ == "__main__":
     assert transposed_array.shape == (6, 6)
     print_array(transposed_array, message="Transposed array:")
 
+    blocked_transposed_array = blocked_transpose(initial_array, tile_size=4)
+    assert np.array_equal(blocked_transposed_array, transposed_array)
+    print_array(blocked_transposed_array, message="Blocked transposed array:")
+
     reshaped_array = reshape_array(initial_array, (3, 12))
     assert reshaped_array.shape == (3, 12)
     print_array(reshaped_array, message="Reshaped array:")
@@ -45,3 +75,9 @@ if __name__ == "__main__":
     combined_array = combine_arrays(initial_array, initial_array)
     assert combined_array.shape == (12, 6)
     print_array(combined_array, message="Combined arrays:")
+
+    builder = ArrayBuilder()
+    for row in initial_array:
+        builder.append(row[np.newaxis])
+    assert np.array_equal(builder.result(), initial_array)
+    print_array(builder.result(), message="Array built row by row:")
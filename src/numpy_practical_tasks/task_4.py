@@ -1,8 +1,13 @@
 import typing
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
 
+from src.numpy_practical_tasks.chunked_store import ChunkedArrayStore
+from src.numpy_practical_tasks.compression import Codec, save_arrays_compressed
+from src.numpy_practical_tasks.csv_reader import read_delimited
 from src.numpy_practical_tasks.utils import print_array
 
 
@@ -12,8 +17,10 @@ def create_array():
 
 def save_array(
     arr: np.array,
-    file_format: typing.Literal["csv", "txt", "npy", "npz"],
+    file_format: typing.Literal["csv", "txt", "npy", "npz", "chunked"],
     file_path: Path | str | None = None,
+    codec: Codec | None = None,
+    compression_level: int | None = None,
 ) -> Path:
     file_path = (
         Path(file_path)
@@ -29,31 +36,106 @@ def save_array(
             np.savetxt(file_path, arr, fmt="%s")
         case "npy":
             np.save(file_path, arr)
+        case "npz" if codec is not None:
+            save_arrays_compressed(
+                {"arr_0": arr}, file_path, codec=codec, level=compression_level
+            )
         case "npz":
             np.savez(file_path, arr)
+        case "chunked":
+            ChunkedArrayStore(
+                file_path, codec=codec or "zlib", compression_level=compression_level
+            ).clear().append(arr)
         case _:
             raise ValueError(f"Invalid format {file_format}!")
 
     return file_path
 
 
-def load_array_from_file(file_path: Path | str) -> np.array:
+class LazyNpzArchive(Mapping):
+    def __init__(self, file_path: Path | str, cache: bool = True):
+        self.file_path = Path(file_path)
+        self.cache = cache
+        with np.load(self.file_path) as npz_file:
+            self._files = tuple(npz_file.files)
+        self._loaded = {}
+
+    def __getitem__(self, name: str) -> np.array:
+        if name in self._loaded:
+            return self._loaded[name]
+        if name not in self._files:
+            raise KeyError(name)
+
+        # The archive is reopened per member so no file handle outlives the call.
+        with np.load(self.file_path) as npz_file:
+            arr = npz_file[name]
+        if self.cache:
+            self._loaded[name] = arr
+        return arr
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._files)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+
+def load_array_from_file(
+    file_path: Path | str,
+    mmap_mode: typing.Literal["r", "r+", "c"] | None = None,
+    lazy: bool = False,
+    max_workers: int | None = None,
+) -> np.ndarray | LazyNpzArchive:
     file_format = Path(file_path).suffix.lower().replace(".", "")
 
+    if mmap_mode is not None and file_format != "npy":
+        raise ValueError(f"mmap_mode isn't supported for {file_format} files!")
+    if lazy and file_format != "npz":
+        raise ValueError(f"Lazy loading isn't supported for {file_format} files!")
+
+    if max_workers is not None and file_format not in {"csv", "txt"}:
+        raise ValueError(f"max_workers isn't supported for {file_format} files!")
+
     match file_format:
+        # The threaded reader only pays off with several cores, see bench_suite.
+        case "csv" if max_workers is not None:
+            return read_delimited(
+                file_path, delimiter=",", dtype="float64", max_workers=max_workers
+            )
+        case "txt" if max_workers is not None:
+            return read_delimited(file_path, dtype="float64", max_workers=max_workers)
         case "csv":
             return np.loadtxt(file_path, delimiter=",")
         case "txt":
             return np.loadtxt(file_path)
         case "npy":
-            return np.load(Path(file_path))
+            return np.load(Path(file_path), mmap_mode=mmap_mode)
         case "npz":
-            npz_file = np.load(file_path)
-            return npz_file[npz_file.files[0]]
+            if lazy:
+                return LazyNpzArchive(file_path)
+            with np.load(file_path) as npz_file:
+                return npz_file[npz_file.files[0]]
+        case "chunked":
+            return ChunkedArrayStore(file_path).read()
         case _:
             raise ValueError(f"Invalid format {file_format}!")
 
 
+def load_arrays_from_directory(
+    directory: Path | str, pattern: str = "*", max_workers: int | None = None
+) -> dict[str, np.array]:
+    supported_formats = {".csv", ".txt", ".npy", ".npz"}
+    file_paths = sorted(
+        file_path
+        for file_path in Path(directory).glob(pattern)
+        if file_path.is_file() and file_path.suffix.lower() in supported_formats
+    )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        arrays = pool.map(load_array_from_file, file_paths)
+        return {file_path.name: arr for file_path, arr in zip(file_paths, arrays)}
+
+
 def summarize_array(arr: np.array, axis: int | None = None) -> np.floating:
     return np.sum(arr, axis=axis)
 
@@ -71,8 +153,10 @@ def std_array_value(arr: np.array, axis: int | None = None) -> np.floating:
 
 
 def apply_aggregate_function_by_axis(
-    arr: np.array,
-    agg_function: typing.Callable[[np.array, int | None], np.array],
+    arr: np.ndarray | Iterable[np.ndarray],
+    agg_function: typing.Callable[
+        [np.ndarray | Iterable[np.ndarray], int | None], np.array
+    ],
     axis: int,
 ) -> list[np.array]:
     return agg_function(arr, axis)
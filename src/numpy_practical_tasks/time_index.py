@@ -0,0 +1,29 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+
+class TimeIndex:
+    def __init__(self, timestamps: np.array):
+        self.order = np.argsort(timestamps, kind="stable")
+        self.sorted_timestamps = timestamps[self.order]
+
+    @classmethod
+    def from_array(cls, arr: np.array) -> "TimeIndex":
+        return cls(np.asarray(arr.timestamp))
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def bounds(self, period: Sequence[np.datetime64, np.datetime64]) -> slice:
+        start = np.searchsorted(self.sorted_timestamps, period[0], side="left")
+        stop = np.searchsorted(self.sorted_timestamps, period[1], side="right")
+        return slice(int(start), int(max(start, stop)))
+
+    def rows(self, period: Sequence[np.datetime64, np.datetime64]) -> np.array:
+        return self.order[self.bounds(period)]
+
+    def rows_in_input_order(
+        self, period: Sequence[np.datetime64, np.datetime64]
+    ) -> np.array:
+        return np.sort(self.rows(period))
@@ -0,0 +1,125 @@
+import json
+import typing
+from pathlib import Path
+
+import numpy as np
+
+COLUMNS_FILE_NAME = "columns.json"
+SIGNED_INTEGER_DTYPES = ("int8", "int16", "int32", "int64")
+UNSIGNED_INTEGER_DTYPES = ("uint8", "uint16", "uint32", "uint64")
+
+
+def narrowest_dtype(column: np.array) -> np.dtype:
+    if not np.issubdtype(column.dtype, np.integer) or column.size == 0:
+        return column.dtype
+
+    candidates = (
+        UNSIGNED_INTEGER_DTYPES
+        if np.issubdtype(column.dtype, np.unsignedinteger)
+        else SIGNED_INTEGER_DTYPES
+    )
+    min_value, max_value = column.min(), column.max()
+    for candidate in candidates:
+        info = np.iinfo(candidate)
+        if info.min <= min_value and max_value <= info.max:
+            return np.dtype(candidate)
+    return column.dtype
+
+
+class TransactionTable:
+    def __init__(self, columns: dict[str, np.array]):
+        sizes = {name: len(column) for name, column in columns.items()}
+        if len(set(sizes.values())) > 1:
+            raise ValueError(f"All columns should have the same size, got {sizes}!")
+        object.__setattr__(self, "_columns", dict(columns))
+
+    @classmethod
+    def from_records(
+        cls, arr: np.array, directory: Path | str, narrow: bool = True
+    ) -> "TransactionTable":
+        directory = Path(directory)
+        directory.mkdir(exist_ok=True, parents=True)
+
+        for name in arr.dtype.names:
+            column = np.ascontiguousarray(arr[name])
+            if narrow:
+                column = column.astype(narrowest_dtype(column), copy=False)
+            np.save(directory / f"{name}.npy", column)
+
+        (directory / COLUMNS_FILE_NAME).write_text(json.dumps(list(arr.dtype.names)))
+        return cls.open(directory)
+
+    @classmethod
+    def open(
+        cls,
+        directory: Path | str,
+        mode: typing.Literal["r", "r+", "c"] = "r",
+    ) -> "TransactionTable":
+        directory = Path(directory)
+        names = json.loads((directory / COLUMNS_FILE_NAME).read_text())
+
+        return cls(
+            {name: np.load(directory / f"{name}.npy", mmap_mode=mode) for name in names}
+        )
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self._columns)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(
+            [(name, column.dtype) for name, column in self._columns.items()]
+        )
+
+    @property
+    def size(self) -> int:
+        return len(self)
+
+    @property
+    def shape(self) -> tuple[int]:
+        return (len(self),)
+
+    def __len__(self) -> int:
+        return len(next(iter(self._columns.values()), ()))
+
+    def __getattr__(self, name: str) -> np.array:
+        try:
+            return self.__dict__["_columns"][name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+
+    def __setattr__(self, name: str, value: np.array):
+        if name not in self._columns:
+            raise AttributeError(f"Can't set unknown column {name!r}!")
+        column = self._columns[name]
+        # In-place operators hand back the column itself, nothing to copy then.
+        if value is not column:
+            column[...] = value
+
+    def __getitem__(self, key) -> "np.array | TransactionTable":
+        if isinstance(key, str):
+            return self._columns[key]
+        if isinstance(key, list) and all(isinstance(name, str) for name in key):
+            return TransactionTable({name: self._columns[name] for name in key})
+        if isinstance(key, slice):
+            return TransactionTable(
+                {name: column[key] for name, column in self._columns.items()}
+            )
+        return np.rec.fromarrays(
+            [np.asarray(column[key]) for column in self._columns.values()],
+            dtype=self.dtype,
+        )
+
+    def to_records(self) -> np.array:
+        return np.rec.fromarrays(
+            [np.asarray(column) for column in self._columns.values()],
+            dtype=self.dtype,
+        )
+
+    def flush(self):
+        for column in self._columns.values():
+            if isinstance(column, np.memmap):
+                column.flush()
@@ -0,0 +1,47 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+
+class UserIndex:
+    def __init__(self, user_ids: np.array, transaction_ids: np.array):
+        user_ids = np.asarray(user_ids)
+        self.order = np.argsort(user_ids, kind="stable")
+        self.users, counts = np.unique(user_ids[self.order], return_counts=True)
+        self.offsets = np.concatenate(([0], np.cumsum(counts)))
+        self.transaction_ids = np.asarray(transaction_ids)[self.order]
+
+    @classmethod
+    def from_array(cls, arr: np.array) -> "UserIndex":
+        return cls(arr.user_id, arr.transaction_id)
+
+    def __len__(self) -> int:
+        return len(self.users)
+
+    def bounds(self, user_id: int) -> slice:
+        position = np.searchsorted(self.users, user_id)
+        if position == len(self.users) or self.users[position] != user_id:
+            return slice(0, 0)
+        return slice(int(self.offsets[position]), int(self.offsets[position + 1]))
+
+    def rows(self, user_id: int) -> np.array:
+        return self.order[self.bounds(user_id)]
+
+    def transactions(self, user_id: int) -> np.array:
+        return self.transaction_ids[self.bounds(user_id)]
+
+    def batch_transactions(self, user_ids: Sequence[int]) -> list[np.array]:
+        user_ids = np.asarray(user_ids)
+        positions = np.clip(np.searchsorted(self.users, user_ids), 0, len(self) - 1)
+        found = (
+            self.users[positions] == user_ids
+            if len(self)
+            else np.zeros(user_ids.shape, dtype=bool)
+        )
+        starts = np.where(found, self.offsets[positions], 0)
+        stops = np.where(found, self.offsets[positions + 1], 0)
+
+        return [
+            self.transaction_ids[start:stop]
+            for start, stop in zip(starts.tolist(), stops.tolist())
+        ]
@@ -0,0 +1,45 @@
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+
+
+class Bins:
+    def __init__(
+        self,
+        edges: Sequence[float],
+        labels: Sequence[str],
+        right: bool | Sequence[bool] = True,
+    ):
+        self.edges = np.asarray(edges, dtype="float64")
+        self.labels = list(labels)
+        # right[i] tells whether a value equal to edges[i] falls into the lower bin.
+        self.right = np.broadcast_to(np.asarray(right, dtype=bool), self.edges.shape)
+        if len(self.labels) != len(self.edges) + 1:
+            raise ValueError(
+                f"{len(self.edges)} edges need {len(self.edges) + 1} labels, "
+                f"got {len(self.labels)}!"
+            )
+        if np.any(np.diff(self.edges) <= 0):
+            raise ValueError(f"Edges should be strictly increasing, got {edges}!")
+
+    def codes(self, values: np.ndarray | pd.Series) -> np.array:
+        values = np.asarray(values, dtype="float64")
+        codes = np.searchsorted(self.edges, values, side="left")
+        on_edge = codes < len(self.edges)
+        on_edge[on_edge] = self.edges[codes[on_edge]] == values[on_edge]
+        codes[on_edge & ~self.right[np.minimum(codes, len(self.edges) - 1)]] += 1
+        codes[np.isnan(values)] = -1
+        return codes
+
+    def apply(self, values: np.ndarray | pd.Series) -> pd.Categorical | pd.Series:
+        categorical = pd.Categorical.from_codes(
+            self.codes(values), categories=self.labels, ordered=True
+        )
+        if isinstance(values, pd.Series):
+            return pd.Series(categorical, index=values.index, name=values.name)
+        return categorical
+
+    def label(self, value: float) -> str | float:
+        code = self.codes(np.array([value]))[0]
+        return self.labels[code] if code >= 0 else np.nan
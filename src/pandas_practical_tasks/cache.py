@@ -0,0 +1,112 @@
+import hashlib
+import inspect
+import json
+import typing
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+import pandas as pd
+
+FINGERPRINT_LENGTH = 16
+FILE_DIGESTS_NAME = "file_digests.json"
+READ_BLOCK_SIZE = 1 << 20
+# Small row groups give readers min/max statistics to skip data with.
+ROW_GROUP_SIZE = 1 << 16
+
+
+_file_digests: dict[str, dict] = {}
+
+
+def fingerprint(
+    file_paths: Iterable[Path | str],
+    code: Iterable[object] = (),
+    digests_path: Path | str | None = None,
+) -> str:
+    digest = hashlib.sha256(pd.__version__.encode())
+    for file_path in file_paths:
+        digest.update(file_digest(file_path, digests_path).encode())
+    for obj in code:
+        digest.update(inspect.getsource(obj).encode())
+    return digest.hexdigest()[:FINGERPRINT_LENGTH]
+
+
+def file_digest(file_path: Path | str, digests_path: Path | str | None = None) -> str:
+    # Hashing the whole file on every load costs about as much as parsing it, so
+    # the digest is reused while the file keeps its size and modification time.
+    file_path = Path(file_path).resolve()
+    stat = file_path.stat()
+    signature = [stat.st_size, stat.st_mtime_ns]
+    digests = _file_digests if digests_path is None else _read_digests(digests_path)
+    entry = digests.get(str(file_path))
+    if entry is not None and entry["signature"] == signature:
+        return entry["digest"]
+
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        while block := file.read(READ_BLOCK_SIZE):
+            digest.update(block)
+    digests[str(file_path)] = {"signature": signature, "digest": digest.hexdigest()}
+    if digests_path is not None:
+        _write_digests(digests_path, digests)
+    return digest.hexdigest()
+
+
+def _read_digests(digests_path: Path | str) -> dict[str, dict]:
+    try:
+        return json.loads(Path(digests_path).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        # The digests only save work, a missing or broken file means hashing again.
+        return {}
+
+
+def _write_digests(digests_path: Path | str, digests: dict[str, dict]):
+    digests_path = Path(digests_path)
+    digests_path.parent.mkdir(exist_ok=True, parents=True)
+    tmp_path = digests_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(digests, indent=2))
+    tmp_path.replace(digests_path)
+
+
+class ParquetCache:
+    def __init__(self, directory: Path | str):
+        self.directory = Path(directory)
+
+    def path(self, name: str, key: str) -> Path:
+        return self.directory / f"{name}.{key}.parquet"
+
+    def ensure(
+        self, name: str, key: str, build: typing.Callable[[], pd.DataFrame]
+    ) -> Path:
+        path = self.path(name, key)
+        if not path.exists():
+            self.write(name, key, build())
+        return path
+
+    def read(
+        self,
+        name: str,
+        key: str,
+        build: typing.Callable[[], pd.DataFrame],
+        columns: Sequence[str] | None = None,
+    ) -> pd.DataFrame:
+        return pd.read_parquet(
+            self.ensure(name, key, build),
+            columns=None if columns is None else list(columns),
+        )
+
+    def write(self, name: str, key: str, df: pd.DataFrame) -> Path:
+        self.directory.mkdir(exist_ok=True, parents=True)
+        path = self.path(name, key)
+        # Writing aside and renaming never leaves a half written entry behind.
+        tmp_path = path.with_suffix(".tmp")
+        df.to_parquet(tmp_path, index=False, row_group_size=ROW_GROUP_SIZE)
+        tmp_path.replace(path)
+
+        for stale_path in self.directory.glob(f"{name}.*.parquet"):
+            if stale_path != path:
+                stale_path.unlink(missing_ok=True)
+        return path
+
+    def clear(self, name: str):
+        for path in self.directory.glob(f"{name}.*.parquet"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,176 @@
+from collections import OrderedDict
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+
+AGGREGATIONS = ("size", "count", "sum", "mean", "min", "max", "var", "std")
+MAX_GROUP_CODE = np.iinfo("int64").max
+
+
+class GroupedAggregates:
+    def __init__(self, df: pd.DataFrame, maxsize: int = 32):
+        if maxsize < 1:
+            raise ValueError(f"Cache size should be positive, got {maxsize}!")
+        self.df = df
+        self.maxsize = maxsize
+        self._column_codes: dict[str, tuple[np.array, pd.Index]] = {}
+        self._group_codes: dict[tuple[str, ...], tuple[np.array, pd.Index]] = {}
+        self._results: OrderedDict[tuple, pd.DataFrame] = OrderedDict()
+
+    def factorize(self, keys: str | Sequence[str]) -> tuple[np.array, pd.Index]:
+        keys = _as_tuple(keys)
+        if keys not in self._group_codes:
+            self._group_codes[keys] = self._factorize_groups(keys)
+        return self._group_codes[keys]
+
+    def aggregate(
+        self, keys: str | Sequence[str], **aggregations: tuple[str, str]
+    ) -> pd.DataFrame:
+        for name, (column, function) in aggregations.items():
+            if function not in AGGREGATIONS:
+                raise ValueError(
+                    f"Invalid aggregation {function} for {name}, "
+                    f"choose one of {', '.join(AGGREGATIONS)}!"
+                )
+        cache_key = (_as_tuple(keys), tuple(aggregations.items()))
+        if cache_key in self._results:
+            self._results.move_to_end(cache_key)
+            return self._results[cache_key].copy()
+
+        codes, groups = self.factorize(keys)
+        # Moments are shared between aggregations of the same column.
+        moments: dict[str, dict[str, np.array]] = {}
+        result = pd.DataFrame(
+            {
+                name: self._aggregate_column(
+                    codes, len(groups), column, function, moments
+                )
+                for name, (column, function) in aggregations.items()
+            },
+            index=groups,
+        )
+
+        self._results[cache_key] = result
+        if len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+        return result.copy()
+
+    def mean(self, keys: str | Sequence[str], columns: Sequence[str]) -> pd.DataFrame:
+        return self.aggregate(keys, **{column: (column, "mean") for column in columns})
+
+    def clear(self):
+        self._results.clear()
+
+    def _factorize_column(self, column: str) -> tuple[np.array, pd.Index]:
+        if column not in self._column_codes:
+            self._column_codes[column] = pd.factorize(self.df[column], sort=True)
+        return self._column_codes[column]
+
+    def _factorize_groups(self, keys: tuple[str, ...]) -> tuple[np.array, pd.Index]:
+        factorized = [self._factorize_column(key) for key in keys]
+        # Rows with a missing key are dropped like groupby(dropna=True) does.
+        present = np.ones(len(self.df), dtype=bool)
+        for codes, _ in factorized:
+            present &= codes >= 0
+
+        combined = np.zeros(np.count_nonzero(present), dtype="int64")
+        span, prefix_codes, radices = 1, [], []
+        for codes, uniques in factorized:
+            if span * len(uniques) - 1 > MAX_GROUP_CODE:
+                # Renumbering the combinations seen so far keeps the code in int64.
+                observed, combined = np.unique(combined, return_inverse=True)
+                prefix_codes = _decode(observed, prefix_codes, radices)
+                combined, span, radices = combined.reshape(-1), len(observed), []
+            combined = combined * len(uniques) + codes[present]
+            span *= len(uniques)
+            radices.append(len(uniques))
+
+        observed, codes = np.unique(combined, return_inverse=True)
+        full_codes = np.full(len(self.df), -1, dtype="int64")
+        full_codes[present] = codes.reshape(-1)
+        levels = [
+            uniques.take(level_codes)
+            for level_codes, (_, uniques) in zip(
+                _decode(observed, prefix_codes, radices), factorized
+            )
+        ]
+
+        if len(keys) == 1:
+            return full_codes, pd.Index(levels[0], name=keys[0])
+        return full_codes, pd.MultiIndex.from_arrays(levels, names=list(keys))
+
+    def _aggregate_column(
+        self,
+        codes: np.array,
+        n_groups: int,
+        column: str,
+        function: str,
+        moments: dict[str, dict[str, np.array]],
+    ) -> np.array:
+        present = codes >= 0
+        if function == "size":
+            return np.bincount(codes[present], minlength=n_groups)
+
+        values = self.df[column].to_numpy(dtype="float64", na_value=np.nan)
+        valid = present & ~np.isnan(values)
+        group_codes, values = codes[valid], values[valid]
+
+        if function in ("min", "max"):
+            result = np.full(n_groups, np.inf if function == "min" else -np.inf)
+            ufunc = np.minimum if function == "min" else np.maximum
+            ufunc.at(result, group_codes, values)
+            result[np.bincount(group_codes, minlength=n_groups) == 0] = np.nan
+            return self._restore_dtype(column, result, keep_width=True)
+
+        column_moments = moments.setdefault(column, {})
+        if "count" not in column_moments:
+            column_moments["count"] = np.bincount(group_codes, minlength=n_groups)
+            column_moments["sum"] = np.bincount(
+                group_codes, weights=values, minlength=n_groups
+            )
+        count, total = column_moments["count"], column_moments["sum"]
+
+        match function:
+            case "count":
+                return count
+            case "sum":
+                return self._restore_dtype(column, total)
+            case "mean":
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    return total / count
+        if "m2" not in column_moments:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                mean = total / count
+            column_moments["m2"] = np.bincount(
+                group_codes,
+                weights=np.square(values - mean[group_codes]),
+                minlength=n_groups,
+            )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            variance = np.where(count > 1, column_moments["m2"] / (count - 1), np.nan)
+        return variance if function == "var" else np.sqrt(variance)
+
+    def _restore_dtype(
+        self, column: str, result: np.array, keep_width: bool = False
+    ) -> np.array:
+        dtype = self.df[column].dtype
+        if not pd.api.types.is_integer_dtype(dtype) or np.isnan(result).any():
+            return result
+        # Sums widen like pandas does, extremes fit in the column's own dtype.
+        return result.astype(dtype if keep_width else "int64")
+
+
+def _decode(
+    values: np.array, prefix_codes: list[np.array], radices: list[int]
+) -> list[np.array]:
+    # Splits combined codes back into the codes of each key, last key first.
+    digits = []
+    for radix in reversed(radices):
+        digits.append(values % radix)
+        values = values // radix
+    return [codes[values] for codes in prefix_codes] + digits[::-1]
+
+
+def _as_tuple(keys: str | Sequence[str]) -> tuple[str, ...]:
+    return (keys,) if isinstance(keys, str) else tuple(keys)
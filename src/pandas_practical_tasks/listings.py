@@ -0,0 +1,144 @@
+import importlib.util
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+
+import pandas as pd
+
+CATEGORICAL_COLUMNS = (
+    "neighbourhood_group",
+    "neighbourhood",
+    "room_type",
+    "price_category",
+    "length_of_stay_category",
+)
+PRICE_CATEGORIES = ("Low", "Middle", "High")
+LENGTH_OF_STAY_CATEGORIES = ("short-term", "medium-term", "long-term")
+COUNT_COLUMNS = (
+    "price",
+    "minimum_nights",
+    "number_of_reviews",
+    "calculated_host_listings_count",
+    "availability_365",
+)
+DATE_COLUMNS = ("last_review",)
+DATE_DTYPE = "datetime64[us]"
+# pandas 3 reads text into its string dtype, earlier versions keep Python objects.
+TEXT_DTYPE = "str" if pd.get_option("future.infer_string") else "object"
+LISTINGS_SCHEMA = {
+    "id": "int64",
+    "name": TEXT_DTYPE,
+    "host_id": "int64",
+    "host_name": TEXT_DTYPE,
+    **{column: "category" for column in CATEGORICAL_COLUMNS},
+    # Derived categories keep their order when the cleaned file is read back.
+    "price_category": pd.CategoricalDtype(PRICE_CATEGORIES, ordered=True),
+    "length_of_stay_category": pd.CategoricalDtype(
+        LENGTH_OF_STAY_CATEGORIES, ordered=True
+    ),
+    # Nullable, so a chunk with a missing count gets the same dtype as the rest.
+    **{column: "Int64" for column in COUNT_COLUMNS},
+    "latitude": "float64",
+    "longitude": "float64",
+    "reviews_per_month": "float64",
+}
+MEMORY_SAMPLE_ROWS = 10_000
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+# Round-trip parsing reads floats exactly like pyarrow, so both engines agree.
+_C_ENGINE_OPTIONS = {"engine": "c", "float_precision": "round_trip"}
+
+
+def read_header(file_path: Path | str) -> list[str]:
+    return pd.read_csv(file_path, nrows=0).columns.to_list()
+
+
+def downcast_integers(df: pd.DataFrame) -> pd.DataFrame:
+    for column in df.select_dtypes(include="integer").columns:
+        values = df[column]
+        # Nullable columns without missing values go back to numpy integers.
+        nullable = isinstance(values.dtype, pd.api.extensions.ExtensionDtype)
+        if nullable and not values.hasnans:
+            values = values.astype(values.dtype.numpy_dtype)
+        df[column] = pd.to_numeric(values, downcast="integer")
+    return df
+
+
+def memory_usage(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(deep=True).sum())
+
+
+def load_listings(
+    file_path: Path | str,
+    columns: Sequence[str] | None = None,
+    report_memory: bool = False,
+) -> pd.DataFrame:
+    columns = _select_columns(file_path, columns)
+    df = pd.read_csv(
+        file_path,
+        **_read_options(columns),
+        **({"engine": "pyarrow"} if PYARROW_AVAILABLE else _C_ENGINE_OPTIONS),
+    )
+    df = downcast_integers(_with_date_dtype(df))
+
+    if report_memory:
+        # Parsing the whole file again without the schema would double the load time.
+        sample = pd.read_csv(file_path, usecols=columns, nrows=MEMORY_SAMPLE_ROWS)
+        before = memory_usage(sample) * len(df) / max(len(sample), 1)
+        print(
+            f"Memory usage of {Path(file_path).name}: ~{before / 2**20:.2f} MiB "
+            f"(estimated from {len(sample)} rows) -> "
+            f"{memory_usage(df) / 2**20:.2f} MiB"
+        )
+    return df
+
+
+def empty_listings(
+    file_path: Path | str, columns: Sequence[str] | None = None
+) -> pd.DataFrame:
+    return _with_date_dtype(
+        pd.read_csv(
+            file_path,
+            nrows=0,
+            **_read_options(_select_columns(file_path, columns)),
+            **_C_ENGINE_OPTIONS,
+        )
+    )
+
+
+def iter_listings(
+    file_path: Path | str, chunk_size: int, columns: Sequence[str] | None = None
+) -> Iterator[pd.DataFrame]:
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size should be positive, got {chunk_size}!")
+
+    # The pyarrow engine can't read in chunks, the C engine streams the file.
+    # Chunks keep the schema dtypes, downcasting each one could give them different
+    # dtypes depending on the values that happen to be in it.
+    with pd.read_csv(
+        file_path,
+        chunksize=chunk_size,
+        **_read_options(_select_columns(file_path, columns)),
+        **_C_ENGINE_OPTIONS,
+    ) as reader:
+        for chunk in reader:
+            yield _with_date_dtype(chunk)
+
+
+def _select_columns(file_path: Path | str, columns: Sequence[str] | None) -> list[str]:
+    header = read_header(file_path)
+    return header if columns is None else [c for c in header if c in columns]
+
+
+def _with_date_dtype(df: pd.DataFrame) -> pd.DataFrame:
+    # Dates are parsed here rather than with parse_dates, which the pyarrow engine of
+    # pandas 2 ignores, and get one resolution even when a chunk has none of them.
+    for column in DATE_COLUMNS:
+        if column in df:
+            df[column] = pd.to_datetime(df[column]).astype(DATE_DTYPE)
+    return df
+
+
+def _read_options(columns: list[str]) -> dict:
+    return {
+        "usecols": columns,
+        "dtype": {c: t for c, t in LISTINGS_SCHEMA.items() if c in columns},
+    }
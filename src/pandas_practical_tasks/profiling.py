@@ -0,0 +1,164 @@
+import typing
+from collections.abc import Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+from src.numpy_practical_tasks.sketches import HyperLogLog
+
+METRICS = (
+    "dtype",
+    "count",
+    "null_count",
+    "invalid_count",
+    "min",
+    "max",
+    "distinct_estimate",
+    "memory_bytes",
+)
+DEFAULT_VALIDATORS = {"price": lambda values: values <= 0}
+
+
+class ColumnProfile:
+    def __init__(self, precision: int = 14):
+        self.dtype = None
+        self.count = 0
+        self.null_count = 0
+        self.invalid_count = 0
+        self.min = None
+        self.max = None
+        self.memory_bytes = 0
+        self.sketch = HyperLogLog(precision=precision)
+
+    def update(
+        self,
+        values: pd.Series,
+        validator: typing.Callable[[pd.Series], pd.Series] | None = None,
+    ) -> "ColumnProfile":
+        self.dtype = str(values.dtype)
+        self.memory_bytes += int(values.memory_usage(deep=True, index=False))
+
+        present = values[values.notna().to_numpy()]
+        self.null_count += len(values) - len(present)
+        self.count += len(present)
+        if present.empty:
+            return self
+
+        if validator is not None:
+            self.invalid_count += int(validator(present).sum())
+        if _is_orderable(present):
+            self.min = (
+                present.min() if self.min is None else min(self.min, present.min())
+            )
+            self.max = (
+                present.max() if self.max is None else max(self.max, present.max())
+            )
+        # Value based hashes keep the sketch consistent between chunks and dtypes.
+        self.sketch.update(
+            pd.util.hash_pandas_object(present, index=False).to_numpy().view("int64")
+        )
+        return self
+
+    def to_dict(self) -> dict:
+        return {
+            "dtype": self.dtype,
+            "count": self.count,
+            "null_count": self.null_count,
+            "invalid_count": self.invalid_count,
+            "min": _to_builtin(self.min),
+            "max": _to_builtin(self.max),
+            "distinct_estimate": round(self.sketch.estimate()) if self.count else 0,
+            "memory_bytes": self.memory_bytes,
+        }
+
+
+class DataProfile:
+    def __init__(
+        self,
+        validators: Mapping[str, typing.Callable[[pd.Series], pd.Series]] | None = None,
+        precision: int = 14,
+    ):
+        self.validators = DEFAULT_VALIDATORS if validators is None else validators
+        self.precision = precision
+        self.rows = 0
+        self.columns: dict[str, ColumnProfile] = {}
+
+    def update(self, df: pd.DataFrame) -> "DataProfile":
+        self.rows += len(df)
+        for name, values in df.items():
+            profile = self.columns.setdefault(name, ColumnProfile(self.precision))
+            profile.update(values, self.validators.get(name))
+        return self
+
+    @property
+    def missing_values(self) -> pd.Series:
+        null_counts = self.to_frame()["null_count"]
+        return null_counts[null_counts > 0]
+
+    @property
+    def invalid_values(self) -> pd.Series:
+        invalid_counts = self.to_frame()["invalid_count"]
+        return invalid_counts[invalid_counts > 0]
+
+    def to_dict(self) -> dict:
+        return {
+            "rows": self.rows,
+            "columns": {name: p.to_dict() for name, p in self.columns.items()},
+        }
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame.from_dict(
+            self.to_dict()["columns"], orient="index", columns=list(METRICS)
+        )
+
+    def compare(self, other: "DataProfile | dict") -> pd.DataFrame:
+        baseline = other if isinstance(other, dict) else other.to_dict()
+        current, previous = self.to_frame().align(
+            pd.DataFrame.from_dict(
+                baseline["columns"], orient="index", columns=list(METRICS)
+            ),
+            join="outer",
+        )
+        changed = (current != previous) & ~(current.isna() & previous.isna())
+        changed_rows = changed.any(axis=1)
+        return pd.concat(
+            {
+                "current": current.where(changed)[changed_rows],
+                "baseline": previous.where(changed)[changed_rows],
+            },
+            axis=1,
+        ).swaplevel(axis=1)[list(_metric_pairs())]
+
+
+def profile_dataframe(
+    data: pd.DataFrame | Iterable[pd.DataFrame],
+    validators: Mapping[str, typing.Callable[[pd.Series], pd.Series]] | None = None,
+) -> DataProfile:
+    profile = DataProfile(validators=validators)
+    for chunk in [data] if isinstance(data, pd.DataFrame) else data:
+        profile.update(chunk)
+    return profile
+
+
+def _is_orderable(values: pd.Series) -> bool:
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.ordered
+    return (
+        pd.api.types.is_numeric_dtype(values.dtype)
+        or pd.api.types.is_datetime64_any_dtype(values.dtype)
+        or pd.api.types.is_timedelta64_dtype(values.dtype)
+    )
+
+
+def _to_builtin(value: typing.Any) -> typing.Any:
+    if isinstance(value, pd.Timestamp | pd.Timedelta):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _metric_pairs() -> Iterable[tuple[str, str]]:
+    for metric in METRICS:
+        yield metric, "current"
+        yield metric, "baseline"
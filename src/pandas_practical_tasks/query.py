@@ -0,0 +1,203 @@
+import operator
+from collections.abc import Sequence
+from functools import reduce
+from pathlib import Path
+
+import pandas as pd
+
+from src.pandas_practical_tasks.grouping import GroupedAggregates
+from src.pandas_practical_tasks.listings import iter_listings, read_header
+from src.pandas_practical_tasks.ranking import top_k_rows
+
+OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda values, options: values.isin(options),
+    "not in": lambda values, options: ~values.isin(options),
+}
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+class LazyFrame:
+    def __init__(
+        self,
+        source: Path | str,
+        file_format: str,
+        steps: tuple[tuple, ...] = (),
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        if file_format not in ("parquet", "csv"):
+            raise ValueError(f"Invalid format {file_format}!")
+        self.source = Path(source)
+        self.file_format = file_format
+        self.steps = steps
+        self.chunk_size = chunk_size
+
+    @classmethod
+    def scan_parquet(cls, source: Path | str) -> "LazyFrame":
+        return cls(source, "parquet")
+
+    @classmethod
+    def scan_csv(
+        cls, source: Path | str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> "LazyFrame":
+        return cls(source, "csv", chunk_size=chunk_size)
+
+    @property
+    def source_columns(self) -> list[str]:
+        if self.file_format == "parquet":
+            import pyarrow.parquet
+
+            return pyarrow.parquet.read_schema(self.source).names
+        return read_header(self.source)
+
+    def filter(self, column: str, op: str, value) -> "LazyFrame":
+        if op not in OPERATORS:
+            raise ValueError(
+                f"Invalid operator {op}, choose one of {', '.join(OPERATORS)}!"
+            )
+        return self._then(("filter", column, op, value))
+
+    def select(self, *columns: str) -> "LazyFrame":
+        return self._then(("select", columns))
+
+    def groupby(
+        self, keys: str | Sequence[str], **aggregations: tuple[str, str]
+    ) -> "LazyFrame":
+        keys = (keys,) if isinstance(keys, str) else tuple(keys)
+        return self._then(("groupby", keys, aggregations))
+
+    def sort(
+        self, by: str | Sequence[str], ascending: bool | Sequence[bool] = True
+    ) -> "LazyFrame":
+        return self._then(("sort", by, ascending))
+
+    def head(self, n: int) -> "LazyFrame":
+        return self._then(("head", n))
+
+    def top_k(
+        self,
+        k: int,
+        by: str | Sequence[str],
+        ascending: bool | Sequence[bool] = True,
+    ) -> "LazyFrame":
+        return self._then(("top_k", k, by, ascending))
+
+    def plan(self) -> tuple[list[str] | None, list[tuple], list[tuple]]:
+        # Filters commute with selects and sorts, but not with head, top_k or groupby.
+        barrier = next(
+            (
+                i
+                for i, step in enumerate(self.steps)
+                if step[0] in ("head", "top_k", "groupby")
+            ),
+            len(self.steps),
+        )
+        pushed = [step[1:] for step in self.steps[:barrier] if step[0] == "filter"]
+        remaining = [
+            step
+            for i, step in enumerate(self.steps)
+            if i >= barrier or step[0] != "filter"
+        ]
+
+        required = None
+        for step in reversed(self.steps):
+            match step:
+                case ("select", columns):
+                    required = (
+                        set(columns) if required is None else required & set(columns)
+                    )
+                case ("groupby", keys, aggregations):
+                    required = set(keys) | {c for c, _ in aggregations.values()}
+                case ("filter", column, _, _) if required is not None:
+                    required.add(column)
+                case ("sort", by, _) | ("top_k", _, by, _) if required is not None:
+                    required.update([by] if isinstance(by, str) else by)
+
+        columns = self.source_columns
+        if required is not None:
+            missing = required - set(columns)
+            if missing:
+                raise ValueError(f"Unknown columns {sorted(missing)} in {self.source}!")
+            columns = [column for column in columns if column in required]
+        return columns, pushed, remaining
+
+    def explain(self) -> str:
+        columns, pushed, remaining = self.plan()
+        lines = [
+            f"scan {self.file_format} {self.source.name}",
+            f"  columns: {', '.join(columns)}",
+            f"  filters: {', '.join(f'{c} {op} {v!r}' for c, op, v in pushed) or '-'}",
+        ]
+        lines += [f"then {step[0]} {step[1:]!r}" for step in remaining]
+        return "\n".join(lines)
+
+    def collect(self) -> pd.DataFrame:
+        columns, pushed, remaining = self.plan()
+        df = self._read(columns, pushed)
+        for step in remaining:
+            df = _apply(df, step)
+        return df
+
+    def _then(self, step: tuple) -> "LazyFrame":
+        return LazyFrame(
+            self.source, self.file_format, (*self.steps, step), self.chunk_size
+        )
+
+    def _read(self, columns: list[str], filters: list[tuple]) -> pd.DataFrame:
+        if self.file_format == "parquet":
+            # pyarrow skips row groups whose statistics can't match the filters.
+            df = pd.read_parquet(self.source, columns=columns, filters=filters or None)
+            if not filters:
+                return df
+            # pyarrow keeps nulls for not in, applying the filters again drops them
+            # like the CSV path does.
+            for filter_step in filters:
+                df = _apply(df, ("filter", *filter_step))
+            return df.reset_index(drop=True)
+
+        chunks = []
+        for chunk in iter_listings(self.source, self.chunk_size, columns=columns):
+            for filter_step in filters:
+                chunk = _apply(chunk, ("filter", *filter_step))
+            chunks.append(chunk)
+        if not chunks:
+            return pd.DataFrame(columns=columns)
+        return _concat_chunks(chunks)
+
+
+def _apply(df: pd.DataFrame, step: tuple) -> pd.DataFrame:
+    match step:
+        case ("filter", column, op, value):
+            # Nulls never match, not even != or not in, like the Parquet filters.
+            values = df[column]
+            mask = OPERATORS[op](values, value).fillna(False) & values.notna()
+            return df[mask.to_numpy(bool)]
+        case ("select", columns):
+            return df[list(columns)]
+        case ("groupby", keys, aggregations):
+            return GroupedAggregates(df).aggregate(keys, **aggregations)
+        case ("sort", by, ascending):
+            return df.sort_values(by=by, ascending=ascending, kind="stable")
+        case ("head", n):
+            return df.head(n)
+        case ("top_k", k, by, ascending):
+            return top_k_rows(df, k, by, ascending)
+    raise ValueError(f"Invalid step {step}!")
+
+
+def _concat_chunks(chunks: list[pd.DataFrame]) -> pd.DataFrame:
+    # Each chunk infers its own categories, concat falls back to object when they
+    # differ, so the chunks are given the union of them first.
+    for column in chunks[0].select_dtypes("category").columns:
+        if len({chunk[column].dtype for chunk in chunks}) > 1:
+            categories = reduce(
+                pd.Index.union, (chunk[column].cat.categories for chunk in chunks)
+            )
+            dtype = pd.CategoricalDtype(categories)
+            chunks = [chunk.astype({column: dtype}) for chunk in chunks]
+    return pd.concat(chunks, ignore_index=True)
@@ -0,0 +1,91 @@
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+def top_k_rows(
+    df: pd.DataFrame,
+    k: int,
+    by: str | Sequence[str],
+    ascending: bool | Sequence[bool] = True,
+) -> pd.DataFrame:
+    by, ascending = _normalize_keys(by, ascending)
+    if k < 0:
+        raise ValueError(f"k should be non-negative, got {k}!")
+    k = min(k, len(df))
+    if k == 0:
+        return df.iloc[:0]
+
+    first = _order_values(df[by[0]])
+    if not ascending[0]:
+        first = -first
+    valid = np.flatnonzero(~np.isnan(first))
+    if k < len(valid):
+        # Rows beyond the k-th value of the first key can't reach the top.
+        threshold = np.partition(first[valid], k - 1)[k - 1]
+        candidates = valid[first[valid] <= threshold]
+    else:
+        candidates = np.arange(len(df))
+
+    sort_keys = [candidates]
+    for column, column_ascending in zip(reversed(by), reversed(ascending)):
+        sort_keys.append(_rank_codes(df[column].iloc[candidates], column_ascending))
+    # lexsort is stable, positions as the last resort keep the input order on ties.
+    return df.iloc[candidates[np.lexsort(sort_keys)[:k]]]
+
+
+def top_k_rows_in_chunks(
+    chunks: Iterable[pd.DataFrame],
+    k: int,
+    by: str | Sequence[str],
+    ascending: bool | Sequence[bool] = True,
+) -> pd.DataFrame:
+    top = None
+    for chunk in chunks:
+        top = top_k_rows(
+            chunk if top is None else pd.concat([top, chunk]), k, by, ascending
+        )
+    if top is None:
+        raise ValueError("Can't rank rows of an empty chunk iterator!")
+    return top
+
+
+def _normalize_keys(
+    by: str | Sequence[str], ascending: bool | Sequence[bool]
+) -> tuple[list[str], list[bool]]:
+    by = [by] if isinstance(by, str) else list(by)
+    ascending = (
+        [ascending] * len(by) if isinstance(ascending, bool) else list(ascending)
+    )
+    if not by or len(by) != len(ascending):
+        raise ValueError(
+            f"Got {len(by)} sort keys and {len(ascending)} ascending flags!"
+        )
+    return by, ascending
+
+
+def _order_values(values: pd.Series) -> np.array:
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = values.cat.codes.to_numpy().astype("float64")
+        codes[codes < 0] = np.nan
+        return codes
+    if pd.api.types.is_numeric_dtype(values.dtype) and not (
+        pd.api.types.is_bool_dtype(values.dtype)
+    ):
+        return values.to_numpy(dtype="float64", na_value=np.nan)
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        order = values.to_numpy().view("int64").astype("float64")
+        order[values.isna().to_numpy()] = np.nan
+        return order
+    codes = pd.factorize(values, sort=True)[0].astype("float64")
+    codes[codes < 0] = np.nan
+    return codes
+
+
+def _rank_codes(values: pd.Series, ascending: bool) -> np.array:
+    codes, uniques = pd.factorize(values, sort=True)
+    if not ascending:
+        codes = np.where(codes >= 0, len(uniques) - 1 - codes, codes)
+    # Missing values sort last whichever the direction, like sort_values.
+    return np.where(codes >= 0, codes, len(uniques))
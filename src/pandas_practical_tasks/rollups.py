@@ -0,0 +1,138 @@
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PARTIALS = ("count", "sum", "sum_sq")
+ROLLUP_FUNCTIONS = ("count", "sum", "mean", "var", "std")
+MONTH_COLUMN = "month"
+
+
+class MonthlyRollupStore:
+    def __init__(
+        self, path: Path | str, columns: Sequence[str], date_column: str = "last_review"
+    ):
+        self.path = Path(path)
+        self.columns = list(columns)
+        self.date_column = date_column
+        self.rollups = self._read()
+
+    @property
+    def batches(self) -> list[str]:
+        return list(self.rollups.attrs.get("batches", []))
+
+    def update(
+        self, df: pd.DataFrame, batch: str | None = None
+    ) -> "MonthlyRollupStore":
+        # A batch applied before is skipped, so retried loads don't count twice.
+        if batch is not None and batch in self.batches:
+            return self
+        batches = self.batches + ([] if batch is None else [batch])
+
+        # Only the months present in the new rows change, partials just add up.
+        rollups = self._partials(df)
+        if len(self.rollups):
+            rollups = pd.concat([self.rollups, rollups]).groupby(level=0).sum()
+        rollups.attrs["batches"] = batches
+        self._write(rollups)
+        self.rollups = rollups
+        return self
+
+    def query(self, aggregations: Mapping[str, str]) -> pd.DataFrame:
+        for column, function in aggregations.items():
+            if column not in self.columns:
+                raise ValueError(
+                    f"Column {column} is not rolled up, choose one of "
+                    f"{', '.join(self.columns)}!"
+                )
+            if function not in ROLLUP_FUNCTIONS:
+                raise ValueError(
+                    f"Invalid aggregation {function} for {column}, "
+                    f"choose one of {', '.join(ROLLUP_FUNCTIONS)}!"
+                )
+
+        months = pd.DatetimeIndex([], name=self.date_column)
+        if len(self.rollups):
+            # Empty months in between are kept, like resample does.
+            months = pd.date_range(
+                self.rollups.index.min(),
+                self.rollups.index.max(),
+                freq="ME",
+                name=self.date_column,
+            )
+        rollups = self.rollups.reindex(months, fill_value=0)
+        return pd.DataFrame(
+            {
+                column: _aggregate(rollups, column, function)
+                for column, function in aggregations.items()
+            },
+            index=months,
+        )
+
+    def clear(self) -> "MonthlyRollupStore":
+        self.path.unlink(missing_ok=True)
+        self.rollups = self._read()
+        return self
+
+    def _partials(self, df: pd.DataFrame) -> pd.DataFrame:
+        dates = pd.to_datetime(df[self.date_column])
+        present = dates.notna()
+        months = (
+            dates[present]
+            .dt.to_period("M")
+            .dt.to_timestamp(how="end")
+            .dt.normalize()
+            .rename(MONTH_COLUMN)
+        )
+        values = df.loc[present, self.columns]
+        grouped = values.groupby(months)
+        squares = values.astype("float64").pow(2).groupby(months)
+        return pd.concat(
+            [
+                grouped.count().add_suffix("_count"),
+                grouped.sum().add_suffix("_sum"),
+                squares.sum().add_suffix("_sum_sq"),
+            ],
+            axis=1,
+        )
+
+    def _read(self) -> pd.DataFrame:
+        expected = [
+            f"{column}_{partial}" for partial in PARTIALS for column in self.columns
+        ]
+        if not self.path.exists():
+            return pd.DataFrame(
+                columns=expected,
+                index=pd.DatetimeIndex([], name=MONTH_COLUMN),
+                dtype="float64",
+            )
+        rollups = pd.read_parquet(self.path)
+        if sorted(rollups.columns) != sorted(expected):
+            raise ValueError(
+                f"Store {self.path} rolls up {', '.join(rollups.columns)}, "
+                f"expected {', '.join(expected)}!"
+            )
+        return rollups
+
+    def _write(self, rollups: pd.DataFrame):
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        # Replacing the file keeps the store valid if the process dies mid-write.
+        tmp_path = self.path.with_suffix(".tmp")
+        rollups.to_parquet(tmp_path)
+        tmp_path.replace(self.path)
+
+
+def _aggregate(rollups: pd.DataFrame, column: str, function: str) -> pd.Series:
+    count, total, sum_sq = (rollups[f"{column}_{partial}"] for partial in PARTIALS)
+    if function == "count":
+        return count
+    if function == "sum":
+        return total
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if function == "mean":
+            return total / count
+        total = total.astype("float64")
+        variance = ((sum_sq - total * total / count) / (count - 1)).clip(lower=0)
+    variance = variance.where(count > 1)
+    return variance if function == "var" else np.sqrt(variance)
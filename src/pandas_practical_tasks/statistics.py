@@ -0,0 +1,254 @@
+from collections.abc import Iterable, Iterator, Sequence
+
+import numpy as np
+import pandas as pd
+
+from src.numpy_practical_tasks.streaming_stats import (
+    DEFAULT_SKETCH_SIZE,
+    KLLSketch,
+    StreamingMoments,
+)
+from src.pandas_practical_tasks.grouping import GroupedAggregates
+
+STATISTICS = ("count", "sum", "mean", "var", "std", "min", "max", "median")
+DEFAULT_STATISTICS = ("mean", "median", "std")
+ORDER_STATISTICS = {"min": 0.0, "median": 0.5, "max": 1.0}
+
+
+def describe(
+    data: pd.DataFrame | Iterable[pd.DataFrame],
+    columns: Sequence[str],
+    statistics: Sequence[str | float] = DEFAULT_STATISTICS,
+    by: str | Sequence[str] | None = None,
+    approximate: bool = False,
+    sketch_size: int = DEFAULT_SKETCH_SIZE,
+) -> pd.DataFrame:
+    statistics = _check_statistics(statistics)
+    by = None if by is None else [by] if isinstance(by, str) else list(by)
+    if isinstance(data, pd.DataFrame) and not approximate:
+        codes, groups = _factorize(data, by)
+        results = {
+            column: _exact_statistics(
+                data[column].to_numpy(dtype="float64", na_value=np.nan),
+                codes,
+                len(groups),
+                statistics,
+            )
+            for column in columns
+        }
+    else:
+        if not approximate and any(map(_needs_sketch, statistics)):
+            raise ValueError(
+                "Exact quantiles need the whole frame, pass approximate=True "
+                "for chunked data!"
+            )
+        data = [data] if isinstance(data, pd.DataFrame) else data
+        groups, results = _streaming_statistics(
+            data, list(columns), statistics, by, sketch_size
+        )
+
+    labels = [_label(statistic) for statistic in statistics]
+    if by is None:
+        return pd.DataFrame(
+            [[results[c][s][0] for s in statistics] for c in columns],
+            index=list(columns),
+            columns=labels,
+        )
+    return pd.DataFrame(
+        {
+            (column, label): results[column][statistic]
+            for column in columns
+            for statistic, label in zip(statistics, labels)
+        },
+        index=groups,
+    )
+
+
+def _check_statistics(statistics: Sequence[str | float]) -> list[str | float]:
+    for statistic in statistics:
+        if isinstance(statistic, str):
+            if statistic not in STATISTICS:
+                raise ValueError(
+                    f"Invalid statistic {statistic}, choose one of "
+                    f"{', '.join(STATISTICS)} or a quantile!"
+                )
+        elif not 0 <= statistic <= 1:
+            raise ValueError(f"Quantile should be between 0 and 1, got {statistic}!")
+    return list(statistics)
+
+
+def _quantile(statistic: str | float) -> float | None:
+    if isinstance(statistic, str):
+        return ORDER_STATISTICS.get(statistic)
+    return float(statistic)
+
+
+def _needs_sketch(statistic: str | float) -> bool:
+    # Streamed moments keep the exact extremes, only inner quantiles are sketched.
+    return _quantile(statistic) is not None and statistic not in ("min", "max")
+
+
+def _label(statistic: str | float) -> str:
+    return statistic if isinstance(statistic, str) else f"{statistic * 100:g}%"
+
+
+def _factorize(df: pd.DataFrame, by: list[str] | None) -> tuple[np.array, pd.Index]:
+    if by is None:
+        return np.zeros(len(df), dtype="int64"), pd.RangeIndex(1)
+    return GroupedAggregates(df).factorize(by)
+
+
+def _exact_statistics(
+    values: np.array,
+    codes: np.array,
+    n_groups: int,
+    statistics: list[str | float],
+) -> dict[str | float, np.array]:
+    valid = (codes >= 0) & ~np.isnan(values)
+    group_codes, values = codes[valid], values[valid]
+    count = np.bincount(group_codes, minlength=n_groups)
+    total = np.bincount(group_codes, weights=values, minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = total / count
+    result = {"count": count, "sum": total, "mean": mean}
+
+    if "var" in statistics or "std" in statistics:
+        m2 = np.bincount(
+            group_codes,
+            weights=np.square(values - mean[group_codes]),
+            minlength=n_groups,
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result["var"] = np.where(count > 1, m2 / (count - 1), np.nan)
+        result["std"] = np.sqrt(result["var"])
+
+    quantiles = {s: _quantile(s) for s in statistics if _quantile(s) is not None}
+    if quantiles:
+        starts = np.cumsum(count) - count
+        if n_groups == 1:
+            # Only the ranks read by the quantiles have to land in place.
+            ranks = [
+                int(rank(q * max(len(values) - 1, 0)))
+                for q in quantiles.values()
+                for rank in (np.floor, np.ceil)
+            ]
+            ordered = (
+                np.partition(values, sorted(set(ranks))) if len(values) else values
+            )
+        else:
+            # One sort per column serves every order statistic of every group.
+            ordered = values[np.lexsort((values, group_codes))]
+        for statistic, q in quantiles.items():
+            result[statistic] = _sorted_quantile(ordered, starts, count, q)
+    return {statistic: result[statistic] for statistic in statistics}
+
+
+def _sorted_quantile(
+    ordered: np.array, starts: np.array, count: np.array, q: float
+) -> np.array:
+    # Linear interpolation between the closest ranks, as pandas does by default.
+    position = q * np.maximum(count - 1, 0)
+    lower = np.floor(position).astype("int64")
+    upper = np.ceil(position).astype("int64")
+    present = count > 0
+    result = np.full(len(count), np.nan)
+    low_values = ordered[(starts + lower)[present]]
+    high_values = ordered[(starts + upper)[present]]
+    result[present] = (
+        low_values + (high_values - low_values) * (position - lower)[present]
+    )
+    return result
+
+
+def _group_positions(
+    chunk: pd.DataFrame, by: list[str] | None
+) -> Iterator[tuple[tuple, np.array]]:
+    if by is None:
+        yield (), np.arange(len(chunk))
+        return
+    for key, positions in chunk.groupby(by, observed=True, sort=False).indices.items():
+        yield (key if isinstance(key, tuple) else (key,)), positions
+
+
+def _streaming_statistics(
+    chunks: Iterable[pd.DataFrame],
+    columns: list[str],
+    statistics: list[str | float],
+    by: list[str] | None,
+    sketch_size: int,
+) -> tuple[pd.Index, dict[str, dict[str | float, np.array]]]:
+    with_sketches = any(map(_needs_sketch, statistics))
+    accumulators: dict[tuple, list[tuple[StreamingMoments, KLLSketch | None]]] = {}
+    for chunk in chunks:
+        values = chunk[columns].to_numpy(dtype="float64", na_value=np.nan)
+        for key, positions in _group_positions(chunk, by):
+            if key not in accumulators:
+                accumulators[key] = [
+                    (
+                        StreamingMoments(),
+                        (
+                            KLLSketch(k=sketch_size, seed=column)
+                            if with_sketches
+                            else None
+                        ),
+                    )
+                    for column in range(len(columns))
+                ]
+            for column, (moments, sketch) in enumerate(accumulators[key]):
+                column_values = values[positions, column]
+                column_values = column_values[~np.isnan(column_values)]
+                moments.update(column_values)
+                if sketch is not None:
+                    sketch.update(column_values)
+
+    keys = sorted(accumulators)
+    if by is None:
+        groups = pd.RangeIndex(1)
+        keys = keys or [()]
+    elif len(by) == 1:
+        groups = pd.Index([key[0] for key in keys], name=by[0])
+    else:
+        groups = pd.MultiIndex.from_tuples(keys, names=by)
+
+    results = {
+        name: {
+            statistic: np.array(
+                [
+                    (
+                        _streaming_statistic(*accumulators[key][column], statistic)
+                        if key in accumulators
+                        else np.nan
+                    )
+                    for key in keys
+                ]
+            )
+            for statistic in statistics
+        }
+        for column, name in enumerate(columns)
+    }
+    return groups, results
+
+
+def _streaming_statistic(
+    moments: StreamingMoments, sketch: KLLSketch | None, statistic: str | float
+) -> float:
+    if statistic == "count":
+        return moments.count
+    if moments.count == 0:
+        return 0.0 if statistic == "sum" else np.nan
+    match statistic:
+        case "sum":
+            return moments.total
+        case "mean":
+            return moments.mean
+        case "var" | "std" if moments.count < 2:
+            return np.nan
+        case "var":
+            return moments.variance(ddof=1)
+        case "std":
+            return moments.std(ddof=1)
+        case "min":
+            return moments.min
+        case "max":
+            return moments.max
+    return sketch.quantile(_quantile(statistic))
@@ -1,7 +1,38 @@
+import argparse
+import sys
+from collections.abc import Sequence
 from pathlib import Path
 
 import pandas as pd
 
+from src.pandas_practical_tasks import binning, cache, listings
+from src.pandas_practical_tasks.binning import Bins
+from src.pandas_practical_tasks.cache import (
+    FILE_DIGESTS_NAME,
+    ParquetCache,
+    fingerprint,
+)
+from src.pandas_practical_tasks.listings import (
+    LENGTH_OF_STAY_CATEGORIES,
+    PRICE_CATEGORIES,
+    empty_listings,
+    iter_listings,
+    load_listings,
+)
+from src.pandas_practical_tasks.profiling import profile_dataframe
+from src.pandas_practical_tasks.query import LazyFrame
+
+DATA_FOLDER = Path(__file__).parent.parent.parent / "data"
+RAW_LISTINGS_PATH = DATA_FOLDER / "AB_NYC_2019.csv"
+CACHE_FOLDER = DATA_FOLDER / "cache"
+CLEANED_LISTINGS_CACHE_NAME = "cleaned_airbnb_data"
+
+MINIMUM_NIGHTS_BINS = Bins(
+    edges=[3, 14],
+    labels=LENGTH_OF_STAY_CATEGORIES,
+    right=[True, False],
+)
+
 
 def print_dataframe_info(df: pd.DataFrame, message: str | None):
     if message:
@@ -26,23 +57,17 @@ def handle_missing_values_for_df(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def categorize_by_minimum_nights(minimum_nights: int) -> str:
-    if minimum_nights <= 3:
-        return "short-term"
-    elif 14 > minimum_nights > 3:
-        return "medium-term"
-    else:
-        return "long-term"
+    return MINIMUM_NIGHTS_BINS.label(minimum_nights)
 
 
 def transform_data(df: pd.DataFrame) -> pd.DataFrame:
     bins = [-float("inf"), 100, 300, float("inf")]
-    labels = ["Low", "Middle", "High"]
-    df["price_category"] = pd.cut(df["price"], bins=bins, labels=labels, right=False)
-
-    df["length_of_stay_category"] = df["minimum_nights"].apply(
-        categorize_by_minimum_nights
+    df["price_category"] = pd.cut(
+        df["price"], bins=bins, labels=list(PRICE_CATEGORIES), right=False
     )
 
+    df["length_of_stay_category"] = MINIMUM_NIGHTS_BINS.apply(df["minimum_nights"])
+
     return df
 
 
@@ -50,40 +75,113 @@ def get_invalid_rows_by_price(df: pd.DataFrame) -> pd.Series:
     return df[~(df["price"].isnull()) & (df["price"] <= 0)].index
 
 
-if __name__ == "__main__":
-    root_folder = Path(__file__).parent.parent.parent
-    data_folder = root_folder / "data"
+def clean_listings(df: pd.DataFrame) -> pd.DataFrame:
+    df = handle_missing_values_for_df(df=df)
+    df = transform_data(df=df)
+
+    return df.drop(index=get_invalid_rows_by_price(df), axis=0)
 
-    file_to_load = data_folder / "AB_NYC_2019.csv"
-    file_to_save = data_folder / "cleaned_airbnb_data.csv"
 
-    input_df = pd.read_csv(file_to_load)
+def clean_listings_in_chunks(
+    input_file_path: Path | str, output_file_path: Path | str, chunk_size: int
+) -> Path:
+    output_file_path = Path(output_file_path)
+    output_file_path.parent.mkdir(exist_ok=True, parents=True)
+
+    # The header comes from the schema, so it's written even when no rows follow.
+    with output_file_path.open("w", newline="") as file:
+        clean_listings(empty_listings(input_file_path)).to_csv(file, index=False)
+        # Every cleaning step is row-local, so chunks are cleaned like the whole.
+        for chunk in iter_listings(input_file_path, chunk_size=chunk_size):
+            clean_listings(chunk).to_csv(file, header=False, index=False)
+
+    return output_file_path
+
+
+def cleaned_listings_key(
+    input_file_path: Path | str = RAW_LISTINGS_PATH,
+    cache_folder: Path | str = CACHE_FOLDER,
+) -> str:
+    # Any change to the raw file or to the cleaning code gives a new cache entry.
+    return fingerprint(
+        [input_file_path],
+        code=[sys.modules[__name__], listings, binning, cache],
+        digests_path=Path(cache_folder) / FILE_DIGESTS_NAME,
+    )
+
 
-    print_dataframe_info(input_df, "Loaded df:")
+def load_cleaned_listings(
+    input_file_path: Path | str = RAW_LISTINGS_PATH,
+    columns: Sequence[str] | None = None,
+    cache_folder: Path | str = CACHE_FOLDER,
+) -> pd.DataFrame:
+    return ParquetCache(cache_folder).read(
+        CLEANED_LISTINGS_CACHE_NAME,
+        cleaned_listings_key(input_file_path, cache_folder),
+        build=lambda: clean_listings(load_listings(input_file_path)),
+        columns=columns,
+    )
+
+
+def scan_cleaned_listings(
+    input_file_path: Path | str = RAW_LISTINGS_PATH,
+    cache_folder: Path | str = CACHE_FOLDER,
+) -> LazyFrame:
+    return LazyFrame.scan_parquet(
+        ParquetCache(cache_folder).ensure(
+            CLEANED_LISTINGS_CACHE_NAME,
+            cleaned_listings_key(input_file_path, cache_folder),
+            build=lambda: clean_listings(load_listings(input_file_path)),
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        help="Clean the file in chunks of this many rows to bound memory usage",
+    )
+    args = parser.parse_args()
+
+    file_to_load = RAW_LISTINGS_PATH
+    file_to_save = DATA_FOLDER / "cleaned_airbnb_data.csv"
+
+    if args.chunk_size:
+        clean_listings_in_chunks(file_to_load, file_to_save, args.chunk_size)
+        print(f"Cleaned {file_to_load.name} in chunks of {args.chunk_size} rows")
+    else:
+        input_df = load_listings(file_to_load)
 
-    print("\nFirst 5 rows:")
-    print(input_df.head(5).to_string())
-    print("\nDataframe info:")
-    print(input_df.info())
+        print_dataframe_info(input_df, "Loaded df:")
 
-    print("\nColumns with missing values:")
-    print(columns_with_missing_values(df=input_df))
+        print("\nFirst 5 rows:")
+        print(input_df.head(5).to_string())
 
-    input_df = handle_missing_values_for_df(df=input_df)
-    print_dataframe_info(input_df, "\nDataFrame after handling missing values:")
+        loaded_profile = profile_dataframe(input_df)
+        print("\nData profile:")
+        print(loaded_profile.to_frame().to_string())
 
-    input_df = transform_data(df=input_df)
-    print_dataframe_info(input_df, "\nTransformed DataFrame:")
-    print(input_df.sample(5).to_string())
+        print("\nColumns with missing values:")
+        print(loaded_profile.missing_values)
 
-    input_df_columns_with_missing_values = columns_with_missing_values(df=input_df)
-    assert "name" not in input_df_columns_with_missing_values
-    assert "host_name" not in input_df_columns_with_missing_values
+        input_df = handle_missing_values_for_df(df=input_df)
+        input_df = transform_data(df=input_df)
+        print("\nTransformed DataFrame:")
+        print(input_df.sample(5).to_string())
 
-    input_df = input_df.drop(index=get_invalid_rows_by_price(input_df), axis=0)
+        input_df = input_df.drop(index=get_invalid_rows_by_price(input_df), axis=0)
 
-    print_dataframe_info(input_df, "\nDataFrame with valid price:")
+        cleaned_profile = profile_dataframe(input_df)
+        assert "name" not in cleaned_profile.missing_values
+        assert "host_name" not in cleaned_profile.missing_values
+        assert cleaned_profile.invalid_values.empty
 
-    assert get_invalid_rows_by_price(input_df).empty
+        print("\nProfile changes after cleaning:")
+        print(cleaned_profile.compare(loaded_profile).to_string())
 
-    input_df.to_csv(file_to_save, index=False)
+        input_df.to_csv(file_to_save, index=False)
+        ParquetCache(CACHE_FOLDER).write(
+            CLEANED_LISTINGS_CACHE_NAME, cleaned_listings_key(file_to_load), input_df
+        )
@@ -2,6 +2,20 @@ from pathlib import Path
 
 import pandas as pd
 
+from src.pandas_practical_tasks.grouping import GroupedAggregates
+from src.pandas_practical_tasks.ranking import top_k_rows
+from src.pandas_practical_tasks.task_1 import scan_cleaned_listings
+
+COLUMNS = (
+    "neighbourhood_group",
+    "price",
+    "minimum_nights",
+    "number_of_reviews",
+    "price_category",
+    "availability_365",
+)
+TOP_LISTINGS = 300
+
 
 def print_grouped_data(df: pd.DataFrame, message: str | None = None):
     if message:
@@ -9,17 +23,24 @@ def print_grouped_data(df: pd.DataFrame, message: str | None = None):
     print(df.to_string())
 
 
-def rank_neighborhoods(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.reset_index(drop=False)
-    neighborhood_summary = (
-        df.groupby("neighbourhood_group")
-        .agg(total_listings=("index", "count"), average_price=("price", "mean"))
-        .reset_index()
-    )
+def rank_neighborhoods(
+    df: pd.DataFrame,
+    grouped: GroupedAggregates | None = None,
+    top: int | None = None,
+) -> pd.DataFrame:
+    grouped = grouped or GroupedAggregates(df)
+    neighborhood_summary = grouped.aggregate(
+        "neighbourhood_group",
+        total_listings=("neighbourhood_group", "size"),
+        average_price=("price", "mean"),
+    ).reset_index()
 
     # Sort by total number of listings in descending order, then by average price in ascending order
-    neighborhood_ranking = neighborhood_summary.sort_values(
-        by=["total_listings", "average_price"], ascending=[False, True]
+    neighborhood_ranking = top_k_rows(
+        neighborhood_summary,
+        len(neighborhood_summary) if top is None else top,
+        by=["total_listings", "average_price"],
+        ascending=[False, True],
     )
 
     return neighborhood_ranking
@@ -27,13 +48,15 @@ def rank_neighborhoods(df: pd.DataFrame) -> pd.DataFrame:
 
 if __name__ == "__main__":
     root_folder = Path(__file__).parent.parent.parent
-    input_file_path = root_folder / "data" / "cleaned_airbnb_data.csv"
     output_file_path = root_folder / "data" / "aggregated_airbnb_data.csv"
-    dataset = pd.read_csv(input_file_path)
-
-    dataset = dataset.loc[
-        (dataset["price"] > 100) & (dataset["number_of_reviews"] > 10)
-    ]
+    query = (
+        scan_cleaned_listings()
+        .filter("price", ">", 100)
+        .filter("number_of_reviews", ">", 10)
+        .select(*COLUMNS)
+    )
+    print(query.explain())
+    dataset = query.collect()
 
     print(dataset.iloc[1].to_string())
     print(dataset.loc[dataset["neighbourhood_group"] == "Manhattan"].info())
@@ -55,26 +78,33 @@ if __name__ == "__main__":
     ]
     print(dataset.info())
 
+    grouped = GroupedAggregates(dataset)
     print_grouped_data(
-        dataset.groupby(by=["neighbourhood_group", "price_category"])[
-            ["price", "minimum_nights"]
-        ].mean(),
+        grouped.mean(
+            ["neighbourhood_group", "price_category"], ["price", "minimum_nights"]
+        ),
         message="\nGrouped and mean price, minimum_nights:",
     )
 
     print_grouped_data(
-        dataset.groupby(by=["neighbourhood_group", "price_category"])[
-            ["number_of_reviews", "availability_365"]
-        ].mean(),
+        grouped.mean(
+            ["neighbourhood_group", "price_category"],
+            ["number_of_reviews", "availability_365"],
+        ),
         message="\nGrouped and mean number_of_reviews, availability_365:",
     )
 
     print_grouped_data(
-        dataset.sort_values(by=["price", "number_of_reviews"], ascending=[False, True]),
-        message="\nSorted by price and number_of_reviews",
+        top_k_rows(
+            dataset,
+            TOP_LISTINGS,
+            by=["price", "number_of_reviews"],
+            ascending=[False, True],
+        ),
+        message=f"\nTop {TOP_LISTINGS} sorted by price and number_of_reviews",
     )
 
-    dataset = rank_neighborhoods(dataset)
+    dataset = rank_neighborhoods(dataset, grouped)
     print_grouped_data(df=dataset, message="\nRanked by neighbourhood:")
 
     dataset.to_csv(output_file_path, index=False)
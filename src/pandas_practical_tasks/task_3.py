@@ -2,6 +2,32 @@ from pathlib import Path
 
 import pandas as pd
 
+from src.pandas_practical_tasks.binning import Bins
+from src.pandas_practical_tasks.rollups import MonthlyRollupStore
+from src.pandas_practical_tasks.statistics import describe
+from src.pandas_practical_tasks.task_1 import (
+    CACHE_FOLDER,
+    cleaned_listings_key,
+    load_cleaned_listings,
+)
+
+COLUMNS = (
+    "neighbourhood_group",
+    "room_type",
+    "price",
+    "minimum_nights",
+    "number_of_reviews",
+    "last_review",
+    "availability_365",
+)
+
+AVAILABILITY_BINS = Bins(
+    edges=[50, 200],
+    labels=["Rarely Available", "Occasionally Available", "Highly Available"],
+    right=[False, True],
+)
+MONTHLY_ROLLUPS_PATH = CACHE_FOLDER / "monthly_reviews.parquet"
+
 
 def print_analysis_results(df: pd.DataFrame | pd.Series, message: str):
     if message:
@@ -14,19 +40,13 @@ def print_analysis_results(df: pd.DataFrame | pd.Series, message: str):
 
 
 def classify_by_availability(availability: int) -> str:
-    if availability < 50:
-        return "Rarely Available"
-    elif availability > 200:
-        return "Highly Available"
-    else:
-        return "Occasionally Available"
+    return AVAILABILITY_BINS.label(availability)
 
 
 if __name__ == "__main__":
     root_folder = Path(__file__).parent.parent.parent
-    input_file_path = root_folder / "data" / "cleaned_airbnb_data.csv"
     output_file_path = root_folder / "data" / "time_series_airbnb_data.csv"
-    dataset = pd.read_csv(input_file_path)
+    dataset = load_cleaned_listings(columns=COLUMNS)
 
     print_analysis_results(
         pd.pivot_table(
@@ -36,6 +56,7 @@ if __name__ == "__main__":
             columns="room_type",
             aggfunc="mean",
             fill_value=0,
+            observed=True,
         ),
         message="Analyze Pricing Trends Across Neighborhoods and Room Types:",
     )
@@ -53,56 +74,42 @@ if __name__ == "__main__":
     )
 
     dataset_with_new_column = dataset.copy()
-    dataset_with_new_column["availability_status"] = dataset_with_new_column[
-        "availability_365"
-    ].apply(classify_by_availability)
-
-    print_analysis_results(
-        dataset_with_new_column.head(5), message="\nClassify Listings by Availability:"
+    dataset_with_new_column["availability_status"] = AVAILABILITY_BINS.apply(
+        dataset_with_new_column["availability_365"]
     )
 
-    print_analysis_results(df=dataset["price"].mean(), message="\nPrice mean:")
-    print_analysis_results(df=dataset["price"].median(), message="\nPrice median:")
-    print_analysis_results(
-        df=dataset["price"].std(), message="\nPrice standard deviation:"
-    )
-
-    print_analysis_results(
-        df=dataset["minimum_nights"].mean(), message="\nminimum_nights mean:"
-    )
     print_analysis_results(
-        df=dataset["minimum_nights"].median(), message="\nminimum_nights median:"
-    )
-    print_analysis_results(
-        df=dataset["minimum_nights"].std(),
-        message="\nminimum_nights standard deviation:",
+        dataset_with_new_column.head(5), message="\nClassify Listings by Availability:"
     )
 
     print_analysis_results(
-        df=dataset["number_of_reviews"].mean(), message="\nnumber_of_reviews mean:"
-    )
-    print_analysis_results(
-        df=dataset["number_of_reviews"].median(), message="\nnumber_of_reviews median:"
-    )
-    print_analysis_results(
-        df=dataset["number_of_reviews"].std(),
-        message="\nnumber_of_reviews standard deviation:",
+        describe(
+            dataset,
+            ["price", "minimum_nights", "number_of_reviews"],
+            statistics=["mean", "median", "std"],
+        ),
+        message="\nMean, median and standard deviation:",
     )
 
-    dataset["last_review"] = pd.to_datetime(dataset["last_review"])
     dataset.set_index("last_review", drop=True, inplace=True)
     print(dataset.info())
 
-    time_series_data = dataset.resample("ME").agg(
-        {"number_of_reviews": "sum", "price": "mean"}
+    rollups = MonthlyRollupStore(
+        MONTHLY_ROLLUPS_PATH, columns=["number_of_reviews", "price"]
     )
+    key = cleaned_listings_key()
+    if key not in rollups.batches:
+        # The cleaned listings are a full snapshot, not new rows on top of the store.
+        rollups.clear().update(dataset.reset_index(), batch=key)
+
+    time_series_data = rollups.query({"number_of_reviews": "sum", "price": "mean"})
     print_analysis_results(
         time_series_data,
         message="\nIdentify Monthly Trends:",
     )
 
     print_analysis_results(
-        dataset.resample("ME").agg({"number_of_reviews": "mean", "price": "mean"}),
+        rollups.query({"number_of_reviews": "mean", "price": "mean"}),
         message="\nAnalyze Seasonal Patterns:",
     )
 
@@ -0,0 +1,109 @@
+import json
+
+import numpy as np
+import pytest
+
+from benchmarks.numpy_practical_tasks.bench_suite import main, make_transactions
+from benchmarks.numpy_practical_tasks.harness import (
+    Benchmark,
+    compare_results,
+    load_results,
+    run_benchmarks,
+)
+
+
+def create_results(seconds: float, peak_memory: int = 1000) -> dict:
+    return {
+        "results": [
+            {
+                "benchmark": "task.function",
+                "size": 1000,
+                "seconds": seconds,
+                "throughput": 1000 / seconds,
+                "peak_memory": peak_memory,
+            }
+        ]
+    }
+
+
+def test_run_benchmarks__should_record_every_size():
+    benchmark = Benchmark("sum", np.sum, lambda size, directory: (np.ones(size),))
+
+    results = run_benchmarks([benchmark], [10, 100], repeat=1)
+
+    assert [result["size"] for result in results["results"]] == [10, 100]
+    assert all(result["seconds"] > 0 for result in results["results"])
+    assert "numpy" in results["metadata"]
+
+
+def test_compare_results__should_report_slowdown_beyond_threshold():
+    regressions = compare_results(create_results(0.2), create_results(0.1), 0.5)
+
+    assert len(regressions) == 1
+    assert regressions[0]["metric"] == "seconds"
+    assert regressions[0]["change"] == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize(
+    "current, baseline",
+    [(0.14, 0.1), (0.00002, 0.00001), (0.05, 0.1)],
+)
+def test_compare_results__should_ignore_small_changes(current, baseline):
+    assert compare_results(create_results(current), create_results(baseline), 0.5) == []
+
+
+def test_compare_results__should_report_memory_growth_when_enabled():
+    current, baseline = create_results(0.1, 3000), create_results(0.1, 1000)
+
+    assert compare_results(current, baseline) == []
+    assert compare_results(current, baseline, memory_threshold=1)[0]["metric"] == (
+        "peak_memory"
+    )
+
+
+def test_compare_results__should_raise_value_error_for_negative_threshold():
+    with pytest.raises(ValueError):
+        compare_results(create_results(0.1), create_results(0.1), -1)
+
+
+def test_make_transactions__should_create_requested_number_of_rows():
+    arr = make_transactions(1000)
+
+    assert len(arr) == 1000
+    assert arr.dtype.names == (
+        "transaction_id",
+        "user_id",
+        "product_id",
+        "quantity",
+        "price",
+        "timestamp",
+    )
+
+
+def test_main__should_fail_on_regression(tmp_path):
+    args = ["--min-exponent", "2", "--max-exponent", "2", "--filter", "task_3.*"]
+    args += ["--noise-floor", "0"]
+    assert main([*args, "--output", str(tmp_path / "results.json")]) == 0
+
+    baseline = load_results(tmp_path / "results.json")
+    for result in baseline["results"]:
+        result["seconds"] /= 1000
+    (tmp_path / "baseline.json").write_text(json.dumps(baseline))
+
+    assert main([*args, "--baseline", str(tmp_path / "baseline.json")]) == 1
+
+
+def test_run__should_give_each_call_fresh_inputs_when_mutating(tmp_path):
+    arr = np.ones(10)
+    calls = []
+
+    def double_in_place(values):
+        calls.append(values.sum())
+        values *= 2
+
+    Benchmark("double", double_in_place, lambda size, directory: (arr,), True).run(
+        10, tmp_path, repeat=3
+    )
+
+    assert calls == [10] * 5
+    assert np.array_equal(arr, np.ones(10))
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from src.numpy_practical_tasks.array_builder import ArrayBuilder
+
+
+def test_append__should_match_concatenate():
+    arrays = [np.arange(6).reshape(3, 2), np.arange(2).reshape(1, 2)] * 20
+
+    result = ArrayBuilder(capacity=1).extend(arrays).result()
+
+    np.testing.assert_array_equal(result, np.concatenate(arrays))
+
+
+def test_append__should_grow_geometrically():
+    builder = ArrayBuilder(capacity=4)
+    capacities = {builder.append(np.array([i])).capacity for i in range(100)}
+
+    assert capacities == {4, 8, 16, 32, 64, 128}
+    assert len(builder) == 100
+
+
+def test_append__should_combine_along_axis():
+    arrays = [np.ones((2, 3)), np.zeros((2, 1))]
+
+    result = ArrayBuilder(axis=1).extend(arrays).result()
+
+    np.testing.assert_array_equal(result, np.concatenate(arrays, axis=1))
+
+
+def test_append__should_promote_dtype_like_concatenate():
+    result = ArrayBuilder().extend([np.array([1, 2]), np.array([0.5])]).result()
+
+    assert result.dtype == np.float64
+    np.testing.assert_array_equal(result, [1, 2, 0.5])
+
+
+def test_append__should_raise_value_error_for_different_row_shape():
+    builder = ArrayBuilder().append(np.ones((2, 3)))
+
+    with pytest.raises(ValueError):
+        builder.append(np.ones((2, 4)))
+
+
+def test_result__should_return_empty_array_before_append():
+    assert ArrayBuilder(dtype="int8").result().shape == (0,)
+
+
+def test_result__should_copy_when_requested():
+    builder = ArrayBuilder().append(np.arange(3))
+    result = builder.result(copy=True)
+    builder.clear().append(np.zeros(3, dtype="int64"))
+
+    np.testing.assert_array_equal(result, [0, 1, 2])
+
+
+def test_result__should_keep_views_valid_after_clear():
+    builder = ArrayBuilder().append(np.arange(3))
+    result = builder.result()
+    builder.clear().append(np.zeros(3, dtype="int64"))
+
+    np.testing.assert_array_equal(result, [0, 1, 2])
+    np.testing.assert_array_equal(builder.result(), [0, 0, 0])
+
+
+def test_clear__should_reuse_buffer_only_without_views():
+    builder = ArrayBuilder(capacity=8).append(np.arange(3))
+
+    builder.result(copy=True)
+    assert builder.clear().capacity == 8
+
+    builder.append(np.arange(3)).result()
+    assert builder.clear().capacity == 0
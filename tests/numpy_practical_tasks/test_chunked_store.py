@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from src.numpy_practical_tasks.chunked_store import ChunkedArrayStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ChunkedArrayStore(tmp_path / "store.chunked", chunk_rows=2)
+    store.append(np.array([[1, 2], [3, 4], [5, 6]]))
+    store.append(np.array([[10, 20]]))
+    return store
+
+
+def test_append__should_write_compressed_chunks_and_index(store):
+    assert len(store) == 4
+    assert [chunk["rows"] for chunk in store.chunks] == [2, 1, 1]
+    assert [(chunk["min"], chunk["max"], chunk["sum"]) for chunk in store.chunks] == [
+        (1, 4, 10),
+        (5, 6, 11),
+        (10, 20, 30),
+    ]
+
+
+def test_read__should_restore_appended_rows(store):
+    reopened = ChunkedArrayStore(store.directory)
+
+    np.testing.assert_array_equal(
+        reopened.read(), np.array([[1, 2], [3, 4], [5, 6], [10, 20]])
+    )
+
+
+def test_read__should_skip_chunks_outside_of_value_range(store):
+    result = store.read(min_value=5, max_value=8)
+
+    np.testing.assert_array_equal(result, np.array([[5, 6]]))
+
+
+def test_statistics__should_be_answered_from_index(store):
+    assert (store.sum(), store.min(), store.max()) == (51, 1, 20)
+
+
+def test_append__should_raise_value_error_for_different_row_shape(store):
+    with pytest.raises(ValueError):
+        store.append(np.array([[1, 2, 3]]))
+
+
+def test_append__should_raise_type_error_for_non_numeric_array(tmp_path):
+    with pytest.raises(TypeError):
+        ChunkedArrayStore(tmp_path / "store").append(np.array(["a", "b"]))
+
+
+def test_clear__should_remove_chunks(store):
+    store.clear()
+
+    assert len(store) == 0
+    assert list(store.directory.iterdir()) == []
+
+
+def test_append__should_use_selected_codec(tmp_path):
+    store = ChunkedArrayStore(tmp_path / "store", codec="lzma")
+    store.append(np.arange(6).reshape(3, 2))
+
+    assert store.chunks[0]["file"].endswith(".lzma")
+    np.testing.assert_array_equal(
+        ChunkedArrayStore(tmp_path / "store").read(), np.arange(6).reshape(3, 2)
+    )
@@ -0,0 +1,115 @@
+import threading
+import zipfile
+
+import numpy as np
+import pytest
+
+from src.numpy_practical_tasks import compression
+from src.numpy_practical_tasks.compression import (
+    ZIP_COMPRESSION,
+    compress,
+    decompress,
+    save_arrays_compressed,
+)
+
+
+@pytest.mark.parametrize("codec", ["zlib", "bz2", "lzma"])
+def test_compress__should_round_trip(codec):
+    data = b"0123456789" * 100
+
+    result = compress(data, codec=codec, level=1)
+
+    assert len(result) < len(data)
+    assert decompress(result, codec=codec) == data
+
+
+def test_compress__should_raise_value_error_for_unknown_codec():
+    with pytest.raises(ValueError):
+        compress(b"data", codec="zstd")
+
+
+@pytest.mark.parametrize("codec", ["zlib", "bz2", "lzma"])
+def test_save_arrays_compressed__should_be_readable_by_np_load(codec, tmp_path):
+    arrays = {
+        "first": np.arange(10_000).reshape(100, 100),
+        "second": np.zeros(5_000, dtype="float32"),
+        "empty": np.empty((0, 3)),
+    }
+
+    file_path = save_arrays_compressed(
+        arrays, tmp_path / "arrays.npz", codec=codec, max_workers=3
+    )
+
+    with zipfile.ZipFile(file_path) as archive:
+        assert {info.compress_type for info in archive.infolist()} == {
+            ZIP_COMPRESSION[codec]
+        }
+        assert archive.testzip() is None
+    with np.load(file_path) as npz_file:
+        assert npz_file.files == list(arrays)
+        for name, arr in arrays.items():
+            np.testing.assert_array_equal(npz_file[name], arr)
+
+
+def test_save_arrays_compressed__should_keep_member_order_past_the_window(tmp_path):
+    arrays = {f"arr_{i}": np.full(100, i) for i in range(10)}
+
+    file_path = save_arrays_compressed(arrays, tmp_path / "arrays.npz", max_workers=2)
+
+    with np.load(file_path) as npz_file:
+        assert npz_file.files == list(arrays)
+        assert [int(npz_file[name][0]) for name in npz_file.files] == list(range(10))
+
+
+def test_save_arrays_compressed__should_compress_members_in_the_pool(
+    tmp_path, monkeypatch
+):
+    threads = []
+    compress_member = compression._compress_member
+
+    def record_thread(*args):
+        threads.append(threading.current_thread())
+        return compress_member(*args)
+
+    monkeypatch.setattr(compression, "_compress_member", record_thread)
+    save_arrays_compressed(
+        {f"arr_{i}": np.arange(100) for i in range(4)}, tmp_path / "arrays.npz"
+    )
+
+    assert len(threads) == 4
+    assert threading.main_thread() not in threads
+
+
+@pytest.mark.parametrize("codec", ["zlib", "bz2", "lzma"])
+def test_save_arrays_compressed__should_write_zip64_records(
+    codec, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(compression, "ZIP64_LIMIT", 0)
+    arrays = {"first": np.arange(1000), "ünicode": np.ones((3, 3))}
+
+    file_path = save_arrays_compressed(arrays, tmp_path / "arrays.npz", codec=codec)
+
+    with zipfile.ZipFile(file_path) as archive:
+        assert archive.testzip() is None
+    with np.load(file_path) as npz_file:
+        assert npz_file.files == list(arrays)
+        for name, arr in arrays.items():
+            np.testing.assert_array_equal(npz_file[name], arr)
+
+
+def test_save_arrays_compressed__should_apply_lzma_preset(tmp_path):
+    arrays = {"arr_0": np.arange(200_000) % 1000}
+
+    fast = save_arrays_compressed(arrays, tmp_path / "fast.npz", "lzma", level=0)
+    small = save_arrays_compressed(arrays, tmp_path / "small.npz", "lzma", level=9)
+
+    assert small.stat().st_size < fast.stat().st_size
+    with np.load(fast) as npz_file:
+        np.testing.assert_array_equal(npz_file["arr_0"], arrays["arr_0"])
+
+
+def test_save_arrays_compressed__should_raise_value_error_for_invalid_lzma_preset(
+    tmp_path,
+):
+    with pytest.raises(ValueError):
+        save_arrays_compressed({"arr_0": np.ones(3)}, tmp_path / "a.npz", "lzma", 10)
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from src.numpy_practical_tasks.csv_reader import (
+    infer_dtype,
+    iter_delimited_blocks,
+    parse_block,
+    read_delimited,
+)
+
+
+@pytest.fixture
+def float_csv(tmp_path):
+    arr = np.random.default_rng(0).random((257, 4))
+    file_path = tmp_path / "array.csv"
+    np.savetxt(file_path, arr, delimiter=",")
+    return file_path, arr
+
+
+@pytest.mark.parametrize(
+    "sample,expected", [(b"1,2\n-3,4\n", "int64"), (b"1,2.5\n3,4\n", "float64")]
+)
+def test_infer_dtype__should_detect_integers_and_floats(sample, expected):
+    assert infer_dtype(sample, delimiter=",") == np.dtype(expected)
+
+
+def test_parse_block__should_raise_value_error_for_ragged_rows():
+    with pytest.raises(ValueError):
+        parse_block(b"1,2\n3\n", np.dtype("int64"), n_columns=2, delimiter=",")
+
+
+@pytest.mark.parametrize("block_size", [1, 100, 1 << 20])
+def test_read_delimited__should_match_loadtxt(float_csv, block_size):
+    file_path, _ = float_csv
+
+    result = read_delimited(
+        file_path, delimiter=",", max_workers=3, block_size=block_size
+    )
+
+    np.testing.assert_array_equal(result, np.loadtxt(file_path, delimiter=","))
+
+
+def test_read_delimited__should_read_whitespace_separated_integers(tmp_path):
+    file_path = tmp_path / "array.txt"
+    np.savetxt(file_path, np.arange(12).reshape(3, 4), fmt="%s")
+
+    result = read_delimited(file_path, block_size=5)
+
+    assert result.dtype == np.dtype("int64")
+    np.testing.assert_array_equal(result, np.arange(12).reshape(3, 4))
+
+
+def test_read_delimited__should_widen_integers_seen_after_the_sample(tmp_path):
+    file_path = tmp_path / "array.csv"
+    rows = [f"{value},{value}" for value in range(20_000)] + ["1.5,2"]
+    file_path.write_text("\n".join(rows) + "\n")
+
+    result = read_delimited(file_path, delimiter=",", block_size=1 << 12)
+
+    assert result.dtype == np.dtype("float64")
+    np.testing.assert_array_equal(result, np.loadtxt(file_path, delimiter=","))
+
+
+@pytest.mark.parametrize("delimiter, suffix", [(None, "txt"), (",", "csv")])
+def test_read_delimited__should_skip_blank_lines(tmp_path, delimiter, suffix):
+    file_path = tmp_path / f"array.{suffix}"
+    separator = delimiter or " "
+    file_path.write_text(
+        f"\n1{separator}2{separator}3\n\n4{separator}5{separator}6\n\n"
+    )
+
+    result = read_delimited(file_path, delimiter=delimiter, block_size=4)
+
+    np.testing.assert_array_equal(result, np.loadtxt(file_path, delimiter=delimiter))
+
+
+def test_read_delimited__should_return_empty_array_for_empty_file(tmp_path):
+    file_path = tmp_path / "empty.csv"
+    file_path.touch()
+
+    assert read_delimited(file_path, delimiter=",").size == 0
+
+
+def test_iter_delimited_blocks__should_yield_row_blocks(float_csv):
+    file_path, _ = float_csv
+
+    blocks = list(iter_delimited_blocks(file_path, delimiter=",", block_size=1000))
+
+    assert len(blocks) > 1
+    np.testing.assert_array_equal(
+        np.concatenate(blocks), np.loadtxt(file_path, delimiter=",")
+    )
+
+
+def test_iter_delimited_blocks__should_widen_to_floats_from_the_first_float_block(
+    tmp_path,
+):
+    file_path = tmp_path / "array.csv"
+    file_path.write_text("1,2\n3,4\n5,6.5\n7,8\n")
+
+    blocks = list(iter_delimited_blocks(file_path, delimiter=",", block_size=8))
+
+    assert [block.dtype for block in blocks] == ["int64", "float64", "float64"]
+    np.testing.assert_array_equal(
+        np.concatenate(blocks), np.loadtxt(file_path, delimiter=",")
+    )
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from src.numpy_practical_tasks.group_by import GroupBy
+
+
+@pytest.fixture
+def group_by():
+    return GroupBy(np.array([3, 1, 3, 2, 1, 3], dtype="int8"))
+
+
+def test_group_by__should_factorize_keys(group_by):
+    np.testing.assert_array_equal(group_by.keys, np.array([1, 2, 3], dtype="int8"))
+    np.testing.assert_array_equal(group_by.count(), np.array([2, 1, 3]))
+
+
+def test_sum__should_not_overflow_small_integer_values(group_by):
+    result = group_by.sum(np.array([100, 1, 100, 5, 1, 100], dtype="int8"))
+
+    np.testing.assert_array_equal(result, np.array([2, 5, 300]))
+
+
+def test_mean_min_max__should_aggregate_per_key(group_by):
+    values = np.array([1.0, 2.0, 3.0, 4.0, 6.0, 5.0])
+
+    np.testing.assert_array_almost_equal(group_by.mean(values), [4.0, 4.0, 3.0])
+    np.testing.assert_array_equal(group_by.min(values), [2.0, 4.0, 1.0])
+    np.testing.assert_array_equal(group_by.max(values), [6.0, 4.0, 5.0])
+
+
+def test_top_k__should_return_keys_with_largest_aggregates(group_by):
+    keys, totals = group_by.top_k(np.array([1, 5, 1, 7, 5, 1]), 2)
+
+    np.testing.assert_array_equal(keys, np.array([1, 2], dtype="int8"))
+    np.testing.assert_array_equal(totals, np.array([10, 7]))
+
+
+def test_top_k__should_raise_value_error_for_unknown_aggregation(group_by):
+    with pytest.raises(ValueError):
+        group_by.top_k(np.ones(6), 1, aggregation="median")
+
+
+def test_sum__should_raise_value_error_for_wrong_size(group_by):
+    with pytest.raises(ValueError):
+        group_by.sum(np.ones(3))
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from src.numpy_practical_tasks import task_2
+from src.numpy_practical_tasks.parallel import ShardedExecutor
+
+
+@pytest.fixture
+def executor():
+    return ShardedExecutor(max_workers=2, n_shards=3)
+
+
+def test_total_revenue__should_match_single_threaded(executor):
+    result = executor.total_revenue(task_2.create_array())
+
+    assert result == pytest.approx(2288.5)
+
+
+def test_product_quantities__should_sum_across_shards(executor):
+    keys, totals = executor.product_quantities(task_2.create_array())
+
+    np.testing.assert_array_equal(keys, [1, 2, 3])
+    np.testing.assert_array_equal(totals, [20, 25, 28])
+
+
+def test_most_purchased_product__should_match_single_threaded(executor):
+    assert executor.most_purchased_product(task_2.create_array()) == 3
+
+
+def test_most_purchased_product__should_resolve_ties_by_first_seen():
+    arr = np.rec.fromarrays(
+        [np.array([2, 1, 1, 2]), np.array([1, 1, 1, 1])],
+        names="product_id,quantity",
+    )
+
+    assert ShardedExecutor(max_workers=2, n_shards=4).most_purchased_product(arr) == 2
+
+
+@pytest.mark.parametrize("order", [range(10), [8, 4, 0, 9, 5, 1, 6, 2, 7, 3]])
+def test_transaction_count_per_user__should_match_single_threaded(executor, order):
+    input_array = task_2.create_array()[list(order)]
+
+    np.testing.assert_array_equal(
+        executor.transaction_count_per_user(input_array),
+        task_2.calculate_transaction_count_per_user(input_array),
+    )
+
+
+def test_top_n_products_by_revenue__should_match_single_threaded(executor):
+    input_array = task_2.create_array()
+
+    np.testing.assert_array_equal(
+        executor.top_n_products_by_revenue(input_array, 2),
+        task_2.get_top_n_products_by_revenue(input_array, 2),
+    )
+
+
+def test_executor__should_handle_more_shards_than_rows():
+    result = ShardedExecutor(max_workers=4, n_shards=32).product_quantities(
+        task_2.create_array()
+    )
+
+    np.testing.assert_array_equal(result[1], [20, 25, 28])
+
+
+@pytest.mark.parametrize(
+    "max_workers, n_shards", [(2, -1), (2, 0), (0, None), (0, 4), (-3, None)]
+)
+def test_init__should_raise_value_error_for_invalid_shards(max_workers, n_shards):
+    with pytest.raises(ValueError):
+        ShardedExecutor(max_workers=max_workers, n_shards=n_shards)
+
+
+def test_init__should_keep_explicit_values():
+    executor = ShardedExecutor(max_workers=3, n_shards=1)
+
+    assert (executor.max_workers, executor.n_shards) == (3, 1)
+
+
+def test_init__should_default_to_cpu_count():
+    executor = ShardedExecutor()
+
+    assert executor.max_workers >= 1
+    assert executor.n_shards == executor.max_workers
@@ -0,0 +1,131 @@
+import operator
+
+import numpy as np
+import pytest
+
+from src.numpy_practical_tasks.revenue_cube import RevenueCube
+from src.numpy_practical_tasks.task_2 import calculate_total_revenue, create_array
+
+
+def _scan_revenue(arr, start, end):
+    return calculate_total_revenue(
+        arr[(arr.timestamp >= start) & (arr.timestamp <= end)]
+    )
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        (np.datetime64("2024-08-01"), np.datetime64("2024-08-03")),
+        (np.datetime64("2024-08-02"), np.datetime64("2024-08-06")),
+        (np.datetime64("2024-08-02T16:00:00"), np.datetime64("2024-08-06T10:19:23")),
+        (np.datetime64("2024-08-06T09:15:01"), np.datetime64("2024-08-07T00:00:00")),
+    ],
+)
+def test_revenue__should_match_scan_for_partial_buckets(start, end):
+    arr = create_array()
+    cube = RevenueCube.from_array(arr)
+
+    assert cube.revenue(start, end) == pytest.approx(_scan_revenue(arr, start, end))
+
+
+def test_revenue__should_match_scan_for_sub_second_bounds():
+    arr = create_array()
+    cube = RevenueCube.from_array(arr)
+    start = np.datetime64("2024-08-06T09:14:59.500")
+    end = np.datetime64("2024-08-06T12:00:00.500")
+
+    assert cube.revenue(start, end) == pytest.approx(_scan_revenue(arr, start, end))
+
+
+def test_revenue__should_return_zero_outside_of_history():
+    cube = RevenueCube.from_array(create_array())
+
+    assert cube.revenue(np.datetime64("2023-01-01"), np.datetime64("2023-12-31")) == 0
+
+
+def test_revenue__should_aggregate_by_key():
+    arr = create_array()
+    cube = RevenueCube.from_array(arr, by="product_id")
+    start, end = np.datetime64("2024-08-01"), np.datetime64("2024-08-07")
+
+    keys, revenue = cube.revenue_per_key(start, end)
+
+    np.testing.assert_array_equal(keys, [1, 2, 3])
+    np.testing.assert_array_almost_equal(revenue, [2002.0, 258.5, 28.0])
+    assert cube.revenue(start, end, key=2) == pytest.approx(258.5)
+    assert cube.revenue(start, end, key=42) == 0
+
+
+@pytest.mark.parametrize("by", [None, "user_id", "product_id"])
+@pytest.mark.parametrize("split", [3, 5, 8])
+def test_append__should_match_cube_built_at_once(by, split):
+    arr = create_array()
+    cube = RevenueCube.from_array(arr[split:], by=by)
+    cube.append(arr[:split])
+
+    expected = RevenueCube.from_array(arr, by=by)
+
+    np.testing.assert_array_equal(cube.keys, expected.keys)
+    for sums, expected_sums in [
+        (cube.total, expected.total),
+        (cube.per_key, expected.per_key),
+    ]:
+        np.testing.assert_array_equal(sums.codes, expected_sums.codes)
+        np.testing.assert_array_almost_equal(sums.sums, expected_sums.sums)
+
+
+def test_append__should_match_scan_after_many_batches():
+    rng = np.random.default_rng(0)
+    arr = create_array()[np.repeat(np.arange(10), 30)]
+    arr.timestamp += rng.integers(-(10**6), 10**6, len(arr)).astype("timedelta64[s]")
+    arr.user_id = rng.integers(0, 20, len(arr))
+    # Sorted batches take the in-place path, the last shuffled ones are merged in.
+    arr[:200] = np.sort(arr[:200], order="timestamp")
+    cube = RevenueCube(by="user_id")
+    for batch in np.array_split(arr, 30):
+        cube.append(batch)
+
+    for start, end in [
+        ("2024-07-25", "2024-08-03T12:00:00"),
+        ("2024-08-05", "2024-08-20"),
+    ]:
+        start, end = np.datetime64(start), np.datetime64(end)
+        assert cube.revenue(start, end) == pytest.approx(_scan_revenue(arr, start, end))
+        keys, revenue = cube.revenue_per_key(start, end)
+        for key, key_revenue in zip(keys, revenue):
+            assert key_revenue == pytest.approx(
+                _scan_revenue(arr[arr.user_id == key], start, end)
+            )
+            assert cube.revenue(start, end, key=key) == pytest.approx(key_revenue)
+
+
+def test_append__should_extend_in_place_when_later_than_history():
+    arr = np.sort(create_array(), order="timestamp")
+    cube = RevenueCube.from_array(arr[:4])
+    capacity = cube.total._codes.capacity
+
+    cube.append(arr[4:6])
+
+    assert cube.total._codes.capacity == capacity
+    assert len(cube) == 6
+
+
+def test_append__should_raise_value_error_for_negative_keys():
+    arr = create_array()
+    arr.user_id[0] = -1
+
+    with pytest.raises(ValueError):
+        RevenueCube.from_array(arr, by="user_id")
+
+
+def test_compare__should_compare_many_periods_at_once():
+    cube = RevenueCube.from_array(create_array())
+    periods_one = np.array(
+        [["2024-08-01", "2024-08-03"], ["2024-08-06", "2024-08-06T23:59:59"]]
+    )
+    periods_two = np.array([["2024-08-04", "2024-08-07"], ["2024-08-01", "2024-08-01"]])
+
+    result = cube.compare(periods_one, periods_two, operator.le)
+
+    np.testing.assert_array_equal(result, [True, False])
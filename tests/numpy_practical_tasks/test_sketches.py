@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from src.numpy_practical_tasks.sketches import HyperLogLog, SpaceSaving, hash_values
+
+
+def test_hash_values__should_be_deterministic_and_spread_values():
+    result = hash_values(np.arange(1000))
+
+    np.testing.assert_array_equal(result, hash_values(np.arange(1000)))
+    assert np.unique(result).size == 1000
+
+
+def test_hash_values__should_raise_type_error_for_strings():
+    with pytest.raises(TypeError):
+        hash_values(np.array(["a", "b"]))
+
+
+@pytest.mark.parametrize("n_unique", [10, 1_000, 100_000])
+def test_hyper_log_log__should_estimate_within_error_bound(n_unique):
+    sketch = HyperLogLog(precision=12)
+    for chunk in np.array_split(np.arange(n_unique).repeat(3), 7):
+        sketch.update(chunk)
+
+    assert abs(sketch.estimate() - n_unique) <= 4 * sketch.relative_error * n_unique
+
+
+def test_hyper_log_log__merge_should_equal_single_sketch():
+    values = np.random.default_rng(0).integers(0, 50_000, size=20_000)
+    merged = (
+        HyperLogLog(10)
+        .update(values[:5_000])
+        .merge(HyperLogLog(10).update(values[5_000:]))
+    )
+
+    np.testing.assert_array_equal(
+        merged.registers, HyperLogLog(10).update(values).registers
+    )
+
+
+def test_hyper_log_log__should_raise_value_error_for_invalid_precision():
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=2)
+
+
+def test_space_saving__should_be_exact_below_capacity():
+    sketch = SpaceSaving(capacity=10)
+    sketch.update(np.array([1, 2, 2, 3]), np.array([5, 1, 1, 10]))
+    sketch.update(np.array([1]), np.array([7]))
+
+    assert sketch.most_common(2) == [(1, 12, 0), (3, 10, 0)]
+    assert sketch.total == 24
+
+
+def test_space_saving__should_find_heavy_hitters_within_error_bound():
+    rng = np.random.default_rng(1)
+    keys = np.concatenate([rng.integers(100, 10_000, size=50_000), np.full(5_000, 7)])
+    rng.shuffle(keys)
+    sketch = SpaceSaving(capacity=100)
+    for chunk in np.array_split(keys, 20):
+        sketch.update(chunk)
+
+    key, count, error = sketch.most_common(1)[0]
+    assert key == 7
+    assert count - error <= 5_000 <= count
+    assert error <= sketch.max_error
+
+
+def test_space_saving__merge_should_keep_totals():
+    first = SpaceSaving(capacity=2).update(np.array([1, 1, 2, 3]))
+    second = SpaceSaving(capacity=2).update(np.array([1, 4, 4, 4]))
+
+    merged = first.merge(second)
+
+    assert merged.total == 8
+    assert merged.most_common(1)[0][0] in {1, 4}
+    assert len(merged.keys) == 2
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from src.numpy_practical_tasks.streaming_stats import (
+    KLLSketch,
+    StreamingMoments,
+    iter_row_chunks,
+    streaming_mean,
+    streaming_median,
+    streaming_quantile,
+    streaming_std,
+    streaming_sum,
+)
+from src.numpy_practical_tasks.task_4 import apply_aggregate_function_by_axis
+
+
+@pytest.fixture
+def matrix():
+    return np.random.default_rng(0).normal(loc=5, size=(20_000, 3))
+
+
+def test_iter_row_chunks__should_split_arrays_and_pass_iterables_through():
+    chunks = list(iter_row_chunks(np.arange(10), chunk_rows=4))
+
+    assert [chunk.tolist() for chunk in chunks] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    assert list(iter_row_chunks(iter(chunks))) == chunks
+
+
+@pytest.mark.parametrize("axis", [None, 0, 1])
+def test_streaming_moments__should_match_numpy(matrix, axis):
+    chunks = np.array_split(matrix, 7)
+
+    np.testing.assert_allclose(streaming_sum(chunks, axis), np.sum(matrix, axis))
+    np.testing.assert_allclose(streaming_mean(chunks, axis), np.mean(matrix, axis))
+    np.testing.assert_allclose(streaming_std(chunks, axis), np.std(matrix, axis))
+
+
+def test_streaming_moments__merge_should_combine_workers(matrix):
+    first = StreamingMoments(axis=0).update(matrix[:5_000])
+    second = StreamingMoments(axis=0).update(matrix[5_000:])
+
+    merged = first.merge(second)
+
+    assert merged.count == len(matrix)
+    np.testing.assert_allclose(merged.variance(ddof=1), np.var(matrix, axis=0, ddof=1))
+    np.testing.assert_array_equal(merged.min, matrix.min(axis=0))
+
+
+def test_streaming_moments__should_raise_value_error_for_axis():
+    with pytest.raises(ValueError):
+        StreamingMoments(axis=1)
+
+
+@pytest.mark.parametrize("axis", [None, 0])
+def test_streaming_median__should_be_within_rank_error(matrix, axis):
+    result = streaming_median(np.array_split(matrix, 11), axis=axis)
+
+    ranks = np.mean(matrix <= result, axis=0 if axis == 0 else None)
+    np.testing.assert_array_less(np.abs(ranks - 0.5), 3 * KLLSketch().rank_error)
+
+
+def test_streaming_quantile__should_be_exact_for_row_axis(matrix):
+    np.testing.assert_allclose(
+        streaming_quantile(np.array_split(matrix, 3), [0.25, 0.75], axis=1),
+        np.quantile(matrix, [0.25, 0.75], axis=1),
+    )
+
+
+def test_kll_sketch__should_keep_bounded_memory_and_merge():
+    values = np.random.default_rng(1).random(200_000)
+    first = KLLSketch(k=100, seed=0).update(values[:100_000])
+    second = KLLSketch(k=100, seed=1).update(values[100_000:])
+
+    merged = first.merge(second)
+
+    assert merged.count == len(values)
+    assert sum(len(level) for level in merged.levels) < 1_000
+    assert merged.quantile(0.9) == pytest.approx(0.9, abs=3 * merged.rank_error)
+
+
+def test_kll_sketch__should_ignore_nan():
+    assert KLLSketch().update(np.array([1.0, np.nan, 3.0])).count == 2
+
+
+def test_apply_aggregate_function_by_axis__should_accept_streaming_aggregator(matrix):
+    result = apply_aggregate_function_by_axis(
+        arr=iter_row_chunks(matrix, chunk_rows=1_000),
+        agg_function=streaming_mean,
+        axis=0,
+    )
+
+    np.testing.assert_allclose(result, matrix.mean(axis=0))
@@ -19,7 +19,13 @@ from src.numpy_practical_tasks.task_2 import (
     get_user_transactions,
     filter_array_by_date_range,
     get_top_n_products_by_revenue,
+    estimate_unique_users,
+    estimate_most_purchased_product,
+    project_columns,
 )
+from src.numpy_practical_tasks.revenue_cube import RevenueCube
+from src.numpy_practical_tasks.time_index import TimeIndex
+from src.numpy_practical_tasks.user_index import UserIndex
 
 
 def test_create_array__return_array():
@@ -58,11 +64,11 @@ def test_cast_float_to_int__should_work_correctly():
 def test_check_dtype_of_each_column__should_work_correctly():
     expected = {
         "price": "float64",
-        "product_id": "int8",
-        "quantity": "int8",
+        "product_id": "int64",
+        "quantity": "int64",
         "timestamp": "datetime64[s]",
-        "transaction_id": "int8",
-        "user_id": "int8",
+        "transaction_id": "int64",
+        "user_id": "int64",
     }
     assert check_dtype_of_each_column(create_array()) == expected
 
@@ -73,6 +79,7 @@ def test_create_product_quantity_array__should_create_array():
 
     assert result_arr.size == input_array.size
     assert set(result_arr.dtype.names) == {"product_id", "quantity"}
+    assert np.shares_memory(result_arr, input_array)
 
 
 def test_calculate_transaction_count_per_user__should_return_correct_array():
@@ -85,6 +92,16 @@ def test_calculate_transaction_count_per_user__should_return_correct_array():
     np.testing.assert_array_equal(result_array, expected)
 
 
+def test_calculate_transaction_count_per_user__should_keep_first_seen_order():
+    input_array = create_array()[[8, 4, 0, 9, 5, 1, 6, 2, 7, 3]]
+    result_array = calculate_transaction_count_per_user(input_array)
+    expected = np.rec.array(
+        [(5, 1), (2, 2), (1, 4), (6, 1), (3, 1), (4, 1)],
+        dtype=result_array.dtype,
+    )
+    np.testing.assert_array_equal(result_array, expected)
+
+
 def test_create_masked_array_quantity_zero__should_filter_array():
     input_array = create_array()
     result_array = create_masked_array_quantity_zero(input_array)
@@ -154,3 +171,139 @@ def test_get_top_n_products_by_revenue__should_return_correct_values():
     result = get_top_n_products_by_revenue(create_array(), 1)
 
     np.testing.assert_array_equal(result, np.array([1], dtype=result.dtype))
+
+
+def test_get_top_n_products_by_revenue__should_return_product_ids_in_order():
+    result = get_top_n_products_by_revenue(create_array(), 5)
+
+    np.testing.assert_array_equal(result, np.array([1, 2, 3], dtype=result.dtype))
+
+
+def test_filter_array_by_date_range__should_use_time_index():
+    input_array = create_array()
+
+    result = filter_array_by_date_range(
+        input_array,
+        (np.datetime64("2024-08-01"), np.datetime64("2024-08-03")),
+        time_index=TimeIndex.from_array(input_array),
+    )
+
+    np.testing.assert_array_equal(result, np.array([6, 10], dtype=result.dtype))
+
+
+def test_compare_revenue__should_use_time_index():
+    input_array = create_array()
+
+    result = compare_revenue(
+        arr=input_array,
+        period_one=(np.datetime64("2024-08-01"), np.datetime64("2024-08-03")),
+        period_two=(np.datetime64("2024-08-04"), np.datetime64("2024-08-07")),
+        function_to_compare=operator.le,
+        time_index=TimeIndex.from_array(input_array),
+    )
+
+    assert result is True
+
+
+@pytest.mark.parametrize(
+    "period",
+    [
+        (np.datetime64("2024-08-01"), np.datetime64("2024-08-03")),
+        (np.datetime64("2024-08-02"), np.datetime64("2024-08-06T12:00:00")),
+        (np.datetime64("2024-08-07"), np.datetime64("2024-08-01")),
+    ],
+)
+def test_compare_revenue__should_match_scan_with_indexes(period):
+    input_array = create_array()
+    revenues = []
+
+    def record(revenue_one, revenue_two):
+        revenues.extend([revenue_one, revenue_two])
+        return np.bool(True)
+
+    compare_revenue(input_array, period, period, record)
+    compare_revenue(
+        input_array,
+        period,
+        period,
+        record,
+        time_index=TimeIndex.from_array(input_array),
+    )
+    compare_revenue(
+        input_array,
+        period,
+        period,
+        record,
+        revenue_cube=RevenueCube.from_array(input_array),
+    )
+
+    assert revenues[2:4] == pytest.approx(revenues[:2])
+    assert revenues[4:] == pytest.approx(revenues[:2])
+
+
+def test_compare_revenue__should_use_revenue_cube():
+    input_array = create_array()
+
+    result = compare_revenue(
+        arr=input_array,
+        period_one=(np.datetime64("2024-08-01"), np.datetime64("2024-08-03")),
+        period_two=(np.datetime64("2024-08-04"), np.datetime64("2024-08-07")),
+        function_to_compare=operator.le,
+        revenue_cube=RevenueCube.from_array(input_array),
+    )
+
+    assert result is True
+
+
+def test_get_user_transactions__should_use_user_index():
+    input_array = create_array()
+
+    result = get_user_transactions(
+        input_array, user_id=1, user_index=UserIndex.from_array(input_array)
+    )
+
+    np.testing.assert_array_equal(result, np.array([1, 2, 3, 4], dtype=result.dtype))
+
+
+def test_estimate_unique_users__should_consume_chunks():
+    input_array = create_array()
+
+    result = estimate_unique_users(np.array_split(input_array, 3))
+
+    assert result.estimate() == pytest.approx(6, abs=1)
+
+
+def test_estimate_most_purchased_product__should_consume_chunks():
+    input_array = create_array()
+
+    result = estimate_most_purchased_product(np.array_split(input_array, 3))
+
+    assert result.most_common(1)[0][0] == 3
+
+
+def test_project_columns__should_return_view_of_selected_columns():
+    input_array = create_array()
+
+    result = project_columns(input_array, ["user_id", "price"])
+
+    assert result.dtype.names == ("user_id", "price")
+    assert np.shares_memory(result, input_array)
+    np.testing.assert_array_equal(result.user_id, input_array.user_id)
+
+
+def test_increase_price__should_update_prices_in_place():
+    input_array = create_array()
+    price_buffer = input_array.price
+
+    increase_price(input_array, 0.5)
+
+    np.testing.assert_array_almost_equal(price_buffer[:2], [150.15, 15.75])
+
+
+def test_calculate_total_revenue__should_not_overflow_narrow_columns():
+    arr = np.rec.fromarrays(
+        [np.full(1000, 100, dtype="int8"), np.full(1000, 2.5)],
+        names=["quantity", "price"],
+    )
+
+    assert calculate_total_revenue(arr) == np.float64(250000.0)
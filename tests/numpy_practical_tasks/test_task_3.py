@@ -1,8 +1,10 @@
 import numpy as np
+import pytest
 
 from src.numpy_practical_tasks.task_3 import (
     create_array,
     transpose,
+    blocked_transpose,
     reshape_array,
     split_array_by_axis,
     combine_arrays,
@@ -20,6 +22,19 @@ def test_transpose__should_return_transposed_array():
     np.testing.assert_array_equal(result, expected)
 
 
+@pytest.mark.parametrize(
+    "shape, dtype, tile_size",
+    [((300, 170), "float64", None), ((7, 5), "int8", 2), ((0, 4), "int64", None)],
+)
+def test_blocked_transpose__should_match_transpose(shape, dtype, tile_size):
+    arr = np.arange(np.prod(shape), dtype=dtype).reshape(shape)
+
+    result = blocked_transpose(arr, tile_size=tile_size)
+
+    np.testing.assert_array_equal(result, transpose(arr))
+    assert result.flags.c_contiguous
+
+
 def test_reshape_array__should_reshape_array():
     shape = (3, 12)
     result = reshape_array(create_array(), shape)
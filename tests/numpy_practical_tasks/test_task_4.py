@@ -13,6 +13,8 @@ from src.numpy_practical_tasks.task_4 import (
     median_array_value,
     mean_array_value,
     apply_aggregate_function_by_axis,
+    LazyNpzArchive,
+    load_arrays_from_directory,
 )
 
 
@@ -39,7 +41,7 @@ def test_save_array__should_raise_value_error(temp_folder_for_files_folder):
         )
 
 
-@pytest.mark.parametrize(("file_format"), ["csv", "txt", "npy", "npz"])
+@pytest.mark.parametrize(("file_format"), ["csv", "txt", "npy", "npz", "chunked"])
 def test_save_array__should_save_to_csv(file_format, temp_folder_for_files_folder):
     input_array = create_array()
     result = save_array(
@@ -50,7 +52,7 @@ def test_save_array__should_save_to_csv(file_format, temp_folder_for_files_folde
     assert result.exists()
 
 
-@pytest.mark.parametrize(("file_format"), ["csv", "txt", "npy", "npz"])
+@pytest.mark.parametrize(("file_format"), ["csv", "txt", "npy", "npz", "chunked"])
 def test_load_array_from_file__should_load_file(
     file_format, temp_folder_for_files_folder
 ):
@@ -66,6 +68,111 @@ def test_load_array_from_file__should_load_file(
     assert loaded_array.shape == (10, 10)
 
 
+def test_load_array_from_file__should_memory_map_npy(temp_folder_for_files_folder):
+    input_array = create_array()
+    file_path = save_array(
+        arr=input_array,
+        file_path=temp_folder_for_files_folder / "tmp_file.npy",
+        file_format="npy",
+    )
+
+    loaded_array = load_array_from_file(file_path, mmap_mode="r")
+
+    assert isinstance(loaded_array, np.memmap)
+    np.testing.assert_array_equal(loaded_array, input_array)
+
+
+@pytest.mark.parametrize(("file_format"), ["csv", "txt", "npz"])
+def test_load_array_from_file__should_raise_value_error_for_mmap_mode(
+    file_format, temp_folder_for_files_folder
+):
+    file_path = save_array(
+        arr=create_array(),
+        file_path=temp_folder_for_files_folder / f"tmp_file.{file_format}",
+        file_format=file_format,
+    )
+
+    with pytest.raises(ValueError):
+        load_array_from_file(file_path, mmap_mode="r")
+
+
+@pytest.mark.parametrize("file_format", ["csv", "txt"])
+def test_load_array_from_file__should_match_loadtxt_with_threads(
+    file_format, temp_folder_for_files_folder
+):
+    file_path = save_array(
+        arr=create_array(),
+        file_path=temp_folder_for_files_folder / f"tmp_file.{file_format}",
+        file_format=file_format,
+    )
+
+    loaded_array = load_array_from_file(file_path, max_workers=2)
+
+    assert loaded_array.dtype == np.dtype("float64")
+    np.testing.assert_array_equal(loaded_array, load_array_from_file(file_path))
+
+
+def test_load_array_from_file__should_raise_value_error_for_max_workers(
+    temp_folder_for_files_folder,
+):
+    file_path = save_array(
+        arr=create_array(),
+        file_path=temp_folder_for_files_folder / "tmp_file.npy",
+        file_format="npy",
+    )
+
+    with pytest.raises(ValueError):
+        load_array_from_file(file_path, max_workers=2)
+
+
+def test_load_array_from_file__should_load_npz_lazily(temp_folder_for_files_folder):
+    file_path = temp_folder_for_files_folder / "tmp_file.npz"
+    np.savez(file_path, first=np.arange(3), second=np.ones((2, 2)))
+
+    archive = load_array_from_file(file_path, lazy=True)
+
+    assert isinstance(archive, LazyNpzArchive)
+    assert list(archive) == ["first", "second"]
+    np.testing.assert_array_equal(archive["second"], np.ones((2, 2)))
+    assert archive["second"] is archive["second"]
+    with pytest.raises(KeyError):
+        archive["third"]
+
+
+@pytest.mark.parametrize("codec", ["zlib", "bz2", "lzma"])
+def test_save_array__should_compress_npz(codec, temp_folder_for_files_folder):
+    input_array = np.zeros((100, 100), dtype="int64")
+    file_path = save_array(
+        arr=input_array,
+        file_path=temp_folder_for_files_folder / "tmp_file.npz",
+        file_format="npz",
+        codec=codec,
+    )
+
+    assert file_path.stat().st_size < input_array.nbytes
+    np.testing.assert_array_equal(load_array_from_file(file_path), input_array)
+
+
+def test_load_arrays_from_directory__should_load_supported_files(
+    temp_folder_for_files_folder,
+):
+    input_array = create_array()
+    for file_format in ("csv", "npy", "npz"):
+        save_array(
+            arr=input_array,
+            file_path=temp_folder_for_files_folder / f"tmp_file.{file_format}",
+            file_format=file_format,
+        )
+    (temp_folder_for_files_folder / "notes.md").write_text("not an array")
+    save_array(input_array, "chunked", temp_folder_for_files_folder / "store.chunked")
+
+    result = load_arrays_from_directory(temp_folder_for_files_folder, max_workers=2)
+
+    assert list(result) == ["tmp_file.csv", "tmp_file.npy", "tmp_file.npz"]
+    for arr in result.values():
+        np.testing.assert_array_equal(arr, input_array)
+
+
 def test_summarize_array__should_work_correctly():
     assert summarize_array(np.array([[1, 2, 3.1], [0, 0.9, 1]])) == 8
 
@@ -0,0 +1,41 @@
+import numpy as np
+
+from src.numpy_practical_tasks.task_2 import create_array
+from src.numpy_practical_tasks.time_index import TimeIndex
+
+
+def test_from_array__should_sort_timestamps():
+    index = TimeIndex.from_array(create_array())
+
+    assert len(index) == 10
+    assert np.all(np.diff(index.sorted_timestamps) >= np.timedelta64(0, "s"))
+
+
+def test_bounds__should_include_both_ends_of_period():
+    index = TimeIndex(
+        np.array(["2024-08-01", "2024-08-02", "2024-08-03"], dtype="datetime64[s]")
+    )
+
+    assert index.bounds(
+        (np.datetime64("2024-08-02"), np.datetime64("2024-08-03"))
+    ) == slice(1, 3)
+
+
+def test_bounds__should_return_empty_slice_for_reversed_period():
+    index = TimeIndex.from_array(create_array())
+
+    result = index.rows((np.datetime64("2024-08-07"), np.datetime64("2024-08-01")))
+
+    assert result.size == 0
+
+
+def test_rows_in_input_order__should_match_scan():
+    arr = create_array()
+    period = (np.datetime64("2024-08-02"), np.datetime64("2024-08-06T12:00:00"))
+
+    result = TimeIndex.from_array(arr).rows_in_input_order(period)
+
+    np.testing.assert_array_equal(
+        result,
+        np.flatnonzero((arr.timestamp >= period[0]) & (arr.timestamp <= period[1])),
+    )
@@ -0,0 +1,97 @@
+import operator
+
+import numpy as np
+import pytest
+
+from src.numpy_practical_tasks import task_2
+from src.numpy_practical_tasks.transaction_table import (
+    TransactionTable,
+    narrowest_dtype,
+)
+
+
+@pytest.fixture
+def table(tmp_path):
+    return TransactionTable.from_records(task_2.create_array(), tmp_path / "table")
+
+
+@pytest.mark.parametrize(
+    "values,expected",
+    [
+        (np.array([1, 127]), "int8"),
+        (np.array([-1, 300]), "int16"),
+        (np.array([0, 70_000], dtype="uint64"), "uint32"),
+        (np.array([1.5, 2.5]), "float64"),
+    ],
+)
+def test_narrowest_dtype__should_pick_smallest_safe_dtype(values, expected):
+    assert narrowest_dtype(values) == np.dtype(expected)
+
+
+def test_open__should_memory_map_each_column(table, tmp_path):
+    reopened = TransactionTable.open(tmp_path / "table")
+
+    assert reopened.columns == list(task_2.create_array().dtype.names)
+    assert all(isinstance(reopened[name], np.memmap) for name in reopened.columns)
+    assert reopened.size == 10
+
+
+def test_from_records__should_not_overflow_large_ids(tmp_path):
+    records = np.rec.fromarrays(
+        [np.array([1, 100_000]), np.array([2.0, 3.0])],
+        names="user_id,price",
+    )
+    table = TransactionTable.from_records(records, tmp_path / "table")
+
+    assert table.dtype["user_id"] == np.dtype("int32")
+    np.testing.assert_array_equal(table.user_id, [1, 100_000])
+
+
+def test_task_2_functions__should_work_on_table(table):
+    assert task_2.calculate_total_revenue(table) == np.float64(2288.5)
+    assert task_2.calculate_unique_users(table) == 6
+    assert task_2.calculate_most_purchased_product(table) == 3
+    assert task_2.create_masked_array_quantity_zero(table).size == 9
+    assert task_2.filter_transactions_quantity_greater_than_one(table).size == 6
+    assert task_2.compare_revenue(
+        arr=table,
+        period_one=(np.datetime64("2024-08-01"), np.datetime64("2024-08-03")),
+        period_two=(np.datetime64("2024-08-04"), np.datetime64("2024-08-07")),
+        function_to_compare=operator.le,
+    )
+    np.testing.assert_array_equal(
+        task_2.get_user_transactions(table, user_id=1), [1, 2, 3, 4]
+    )
+    np.testing.assert_array_equal(
+        task_2.filter_array_by_date_range(
+            table, (np.datetime64("2024-08-01"), np.datetime64("2024-08-03"))
+        ),
+        [6, 10],
+    )
+    np.testing.assert_array_equal(task_2.get_top_n_products_by_revenue(table, 1), [1])
+    assert task_2.create_product_quantity_array(table).size == 10
+
+
+def test_increase_price__should_write_through_to_file(table, tmp_path):
+    writable = TransactionTable.open(tmp_path / "table", mode="r+")
+    task_2.increase_price(writable, 0.05)
+    writable.flush()
+
+    reopened = TransactionTable.open(tmp_path / "table")
+    np.testing.assert_array_almost_equal(reopened.price[:2], [105.105, 11.025])
+
+
+def test_getitem__should_slice_columns_without_copy(table):
+    result = table[2:5]
+
+    assert isinstance(result, TransactionTable)
+    assert np.shares_memory(result.price, table.price)
+    assert result.size == 3
+
+
+def test_getitem__should_project_columns_without_copy(table):
+    result = task_2.project_columns(table, ["product_id", "quantity"])
+
+    assert isinstance(result, TransactionTable)
+    assert result.columns == ["product_id", "quantity"]
+    assert result.product_id is table.product_id
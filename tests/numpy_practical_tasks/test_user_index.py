@@ -0,0 +1,42 @@
+import numpy as np
+
+from src.numpy_practical_tasks.task_2 import create_array
+from src.numpy_practical_tasks.user_index import UserIndex
+
+
+def test_from_array__should_build_offsets():
+    index = UserIndex.from_array(create_array())
+
+    np.testing.assert_array_equal(index.users, [1, 2, 3, 4, 5, 6])
+    np.testing.assert_array_equal(index.offsets, [0, 4, 6, 7, 8, 9, 10])
+
+
+def test_transactions__should_return_view_of_index():
+    index = UserIndex.from_array(create_array())
+
+    result = index.transactions(2)
+
+    np.testing.assert_array_equal(result, [5, 6])
+    assert np.shares_memory(result, index.transaction_ids)
+
+
+def test_transactions__should_return_empty_array_for_unknown_user():
+    assert UserIndex.from_array(create_array()).transactions(42).size == 0
+
+
+def test_rows__should_return_row_positions_in_input_order():
+    np.testing.assert_array_equal(
+        UserIndex.from_array(create_array()).rows(1), [0, 1, 2, 3]
+    )
+
+
+def test_batch_transactions__should_return_transactions_per_user():
+    index = UserIndex.from_array(create_array())
+
+    result = index.batch_transactions([6, 42, 1])
+
+    assert [transactions.tolist() for transactions in result] == [
+        [10],
+        [],
+        [1, 2, 3, 4],
+    ]
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pandas_practical_tasks.binning import Bins
+
+
+def test_apply__should_respect_inclusivity_of_each_edge():
+    bins = Bins(edges=[3, 14], labels=["low", "middle", "high"], right=[True, False])
+
+    result = bins.apply(pd.Series([1, 3, 3.5, 13, 14, 100], index=list("abcdef")))
+
+    assert result.dtype == "category"
+    assert result.index.to_list() == list("abcdef")
+    assert result.to_list() == ["low", "low", "middle", "middle", "high", "high"]
+
+
+def test_apply__should_return_ordered_categorical_for_arrays():
+    result = Bins(edges=[0], labels=["negative", "positive"]).apply(np.array([1, -1]))
+
+    assert isinstance(result, pd.Categorical)
+    assert result.ordered
+    assert result.categories.to_list() == ["negative", "positive"]
+    assert result.tolist() == ["positive", "negative"]
+
+
+def test_apply__should_keep_missing_values_missing():
+    result = Bins(edges=[18], labels=["Child", "Adult"]).apply(pd.Series([np.nan, 40]))
+
+    assert result.isna().to_list() == [True, False]
+
+
+@pytest.mark.parametrize(
+    "edges, labels",
+    [([1, 2], ["low", "high"]), ([2, 1], ["low", "middle", "high"])],
+)
+def test_bins__should_raise_value_error_for_invalid_definition(edges, labels):
+    with pytest.raises(ValueError):
+        Bins(edges=edges, labels=labels)
+
+
+def test_label__should_match_apply():
+    bins = Bins(edges=[50, 200], labels=["rare", "sometimes", "often"], right=False)
+
+    assert [bins.label(value) for value in (49, 50, 200)] == (
+        bins.apply(np.array([49, 50, 200])).tolist()
+    )
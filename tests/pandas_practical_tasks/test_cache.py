@@ -0,0 +1,64 @@
+import os
+
+import pandas as pd
+
+from src.pandas_practical_tasks.cache import ParquetCache, fingerprint
+
+
+def rewrite(file_path, text: str, mtime_ns: int):
+    file_path.write_text(text)
+    os.utime(file_path, ns=(mtime_ns, mtime_ns))
+
+
+def test_fingerprint__should_change_with_file_content_and_code(tmp_path):
+    file_path = tmp_path / "data.csv"
+    rewrite(file_path, "a,b\n1,2\n", 10**18)
+    key = fingerprint([file_path])
+
+    assert fingerprint([file_path]) == key
+    assert fingerprint([file_path], code=[fingerprint]) != key
+    rewrite(file_path, "a,b\n1,3\n", 10**18 + 1)
+    assert fingerprint([file_path]) != key
+
+
+def test_fingerprint__should_hash_file_only_when_size_or_mtime_change(tmp_path):
+    file_path, digests_path = tmp_path / "data.csv", tmp_path / "digests.json"
+    rewrite(file_path, "a,b\n1,2\n", 10**18)
+    key = fingerprint([file_path], digests_path=digests_path)
+
+    # Same size and mtime, the stored digest is trusted without reading the file.
+    rewrite(file_path, "a,b\n1,3\n", 10**18)
+    assert fingerprint([file_path], digests_path=digests_path) == key
+    rewrite(file_path, "a,b\n1,3\n", 10**18 + 1)
+    assert fingerprint([file_path], digests_path=digests_path) != key
+
+
+def test_read__should_build_once_and_project_columns(tmp_path):
+    calls = []
+
+    def build() -> pd.DataFrame:
+        calls.append(1)
+        return pd.DataFrame(
+            {"room_type": pd.Categorical(["Private room"]), "price": [100]}
+        )
+
+    cache = ParquetCache(tmp_path)
+    cache.read("listings", "key", build)
+    result = cache.read("listings", "key", build, columns=["room_type"])
+
+    assert len(calls) == 1
+    assert result.columns.to_list() == ["room_type"]
+    assert result["room_type"].dtype == "category"
+
+
+def test_write__should_remove_stale_entries(tmp_path):
+    cache = ParquetCache(tmp_path)
+    cache.write("listings", "old", pd.DataFrame({"price": [1]}))
+    cache.write("other", "old", pd.DataFrame({"price": [1]}))
+
+    cache.write("listings", "new", pd.DataFrame({"price": [2]}))
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "listings.new.parquet",
+        "other.old.parquet",
+    ]
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pandas_practical_tasks.grouping import GroupedAggregates
+
+
+@pytest.fixture
+def listings():
+    return pd.DataFrame(
+        {
+            "neighbourhood_group": pd.Categorical(
+                ["Queens", "Bronx", "Queens", None, "Bronx", "Queens"]
+            ),
+            "room_type": ["Shared", "Private", "Private", "Shared", "Private", None],
+            "price": [100, 250, 180, 120, 220, 130],
+            "reviews": [1.5, np.nan, 3.0, 4.0, np.nan, 6.0],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "keys", ["neighbourhood_group", "room_type", ["neighbourhood_group", "room_type"]]
+)
+def test_aggregate__should_match_pandas_groupby(listings, keys):
+    aggregations = {
+        "listings": ("price", "size"),
+        "reviews_count": ("reviews", "count"),
+        "price_sum": ("price", "sum"),
+        "price_mean": ("price", "mean"),
+        "price_min": ("price", "min"),
+        "reviews_max": ("reviews", "max"),
+        "reviews_std": ("reviews", "std"),
+        "price_var": ("price", "var"),
+    }
+
+    result = GroupedAggregates(listings).aggregate(keys, **aggregations)
+    expected = listings.groupby(keys, observed=True).agg(**aggregations)
+
+    pd.testing.assert_frame_equal(result, expected, check_index_type=False)
+
+
+def test_aggregate__should_factorize_keys_once(listings, monkeypatch):
+    grouped = GroupedAggregates(listings)
+    calls = []
+    factorize = pd.factorize
+    monkeypatch.setattr(
+        pd,
+        "factorize",
+        lambda *args, **kwargs: calls.append(1) or factorize(*args, **kwargs),
+    )
+
+    grouped.mean("neighbourhood_group", ["price"])
+    grouped.mean(["neighbourhood_group", "room_type"], ["reviews"])
+    grouped.aggregate("neighbourhood_group", total=("price", "sum"))
+
+    assert len(calls) == 2
+
+
+def test_aggregate__should_memoize_with_lru_eviction(listings):
+    grouped = GroupedAggregates(listings, maxsize=2)
+
+    first = grouped.mean("room_type", ["price"])
+    first.loc[:, "price"] = 0
+    assert grouped.mean("room_type", ["price"])["price"].to_list() == pytest.approx(
+        [650 / 3, 110.0]
+    )
+
+    grouped.mean("room_type", ["reviews"])
+    grouped.mean("room_type", ["price"])
+    grouped.mean("neighbourhood_group", ["price"])
+    listings.loc[:, ["price", "reviews"]] = 0
+
+    # Reviews were used least recently and got evicted, prices still come cached.
+    assert grouped.mean("room_type", ["price"])["price"].to_list() == pytest.approx(
+        [650 / 3, 110.0]
+    )
+    assert grouped.mean("room_type", ["reviews"])["reviews"].to_list() == [0, 0]
+
+
+def test_aggregate__should_group_keys_beyond_int64_combinations():
+    rng = np.random.default_rng(0)
+    keys = [f"key_{index}" for index in range(5)]
+    df = pd.DataFrame(
+        {key: rng.permutation(10_000) for key in keys} | {"price": np.arange(10_000)}
+    )
+    df.iloc[:5000, 2] = df.iloc[5000:, 2].to_numpy()
+
+    result = GroupedAggregates(df).aggregate(keys, total=("price", "sum"))
+    expected = df.groupby(keys).agg(total=("price", "sum"))
+
+    pd.testing.assert_frame_equal(result, expected, check_index_type=False)
+
+
+def test_aggregate__should_raise_value_error_for_unknown_function(listings):
+    with pytest.raises(ValueError):
+        GroupedAggregates(listings).aggregate("room_type", price=("price", "median"))
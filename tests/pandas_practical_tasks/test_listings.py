@@ -0,0 +1,133 @@
+import pandas as pd
+import pytest
+
+from src.pandas_practical_tasks import listings
+from src.pandas_practical_tasks.listings import (
+    downcast_integers,
+    iter_listings,
+    load_listings,
+)
+
+
+@pytest.fixture
+def listings_file(tmp_path):
+    file_path = tmp_path / "listings.csv"
+    pd.DataFrame(
+        {
+            "id": [2539, 2595, 3647],
+            "name": ["Clean & quiet apt", "Skylit Midtown Castle", None],
+            "neighbourhood_group": ["Brooklyn", "Manhattan", "Manhattan"],
+            "room_type": ["Private room", "Entire home/apt", "Private room"],
+            "price": [149, 225, 150],
+            "minimum_nights": [1, 1, 3],
+            "number_of_reviews": [9, 45, 0],
+            "last_review": ["2018-10-19", "2019-05-21", None],
+        }
+    ).to_csv(file_path, index=False)
+    return file_path
+
+
+@pytest.mark.parametrize("pyarrow_available", [True, False])
+def test_load_listings__should_apply_schema(
+    listings_file, monkeypatch, pyarrow_available
+):
+    if pyarrow_available and not listings.PYARROW_AVAILABLE:
+        pytest.skip("pyarrow is not installed")
+    monkeypatch.setattr(listings, "PYARROW_AVAILABLE", pyarrow_available)
+
+    result = load_listings(listings_file)
+
+    assert result["neighbourhood_group"].dtype == "category"
+    assert result["room_type"].cat.categories.to_list() == [
+        "Entire home/apt",
+        "Private room",
+    ]
+    assert result["price"].dtype == "int16"
+    assert result["minimum_nights"].dtype == "int8"
+    assert pd.api.types.is_datetime64_any_dtype(result["last_review"])
+    assert result["last_review"].isna().to_list() == [False, False, True]
+    assert result["name"].isna().to_list() == [False, False, True]
+
+
+def test_load_listings__should_load_selected_columns(listings_file):
+    result = load_listings(listings_file, columns=["price", "room_type", "missing"])
+
+    assert result.columns.to_list() == ["room_type", "price"]
+
+
+def test_load_listings__should_report_memory(listings_file, capsys):
+    load_listings(listings_file, report_memory=True)
+
+    assert capsys.readouterr().out.startswith("Memory usage of listings.csv: ")
+
+
+@pytest.mark.parametrize("pyarrow_available", [True, False])
+def test_load_listings__should_keep_order_of_derived_categories(
+    tmp_path, monkeypatch, pyarrow_available
+):
+    if pyarrow_available and not listings.PYARROW_AVAILABLE:
+        pytest.skip("pyarrow is not installed")
+    monkeypatch.setattr(listings, "PYARROW_AVAILABLE", pyarrow_available)
+    file_path = tmp_path / "cleaned.csv"
+    file_path.write_text("id,price_category\n1,High\n2,Low\n")
+
+    result = load_listings(file_path)
+
+    assert result["price_category"].cat.ordered
+    assert result["price_category"].cat.categories.to_list() == [
+        "Low",
+        "Middle",
+        "High",
+    ]
+    assert result["price_category"].max() == "High"
+
+
+def test_iter_listings__should_yield_chunks_with_schema(listings_file):
+    chunks = list(iter_listings(listings_file, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert chunks[1].index.to_list() == [2]
+    assert all(chunk["room_type"].dtype == "category" for chunk in chunks)
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks).astype({"room_type": str, "neighbourhood_group": str}),
+        load_listings(listings_file).astype(
+            {"room_type": str, "neighbourhood_group": str}
+        ),
+        check_dtype=False,
+    )
+
+
+def test_iter_listings__should_keep_dtypes_when_some_chunks_miss_values(
+    listings_file,
+):
+    listings_file.write_text(listings_file.read_text().replace(",150,", ",,"))
+
+    chunks = list(iter_listings(listings_file, chunk_size=2))
+
+    assert chunks[0].dtypes.astype(str).equals(chunks[1].dtypes.astype(str))
+    assert chunks[1]["price"].isna().to_list() == [True]
+
+
+def test_iter_listings__should_raise_value_error_for_invalid_chunk_size(
+    listings_file,
+):
+    with pytest.raises(ValueError):
+        next(iter_listings(listings_file, chunk_size=0))
+
+
+def test_downcast_integers__should_keep_values():
+    df = pd.DataFrame({"small": [1, -2], "large": [2**40, 0], "float": [0.5, 1.5]})
+
+    result = downcast_integers(df.copy())
+
+    assert result.dtypes.astype(str).to_list() == ["int8", "int64", "float64"]
+    pd.testing.assert_frame_equal(result, df, check_dtype=False)
+
+
+def test_downcast_integers__should_keep_missing_values_nullable():
+    df = pd.DataFrame({"full": [1, 2], "missing": [3, None]}, dtype="Int64")
+
+    result = downcast_integers(df.copy())
+
+    assert result.dtypes.astype(str).to_list() == ["int8", "Int8"]
+    assert result["missing"].isna().to_list() == [False, True]
@@ -0,0 +1,86 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pandas_practical_tasks.profiling import DataProfile, profile_dataframe
+from src.pandas_practical_tasks.task_1 import (
+    columns_with_missing_values,
+    get_invalid_rows_by_price,
+)
+
+
+@pytest.fixture
+def listings():
+    return pd.DataFrame(
+        {
+            "name": ["Loft", None, "Studio", "Loft"],
+            "room_type": pd.Categorical(["Private", "Shared", "Private", None]),
+            "price": [100, 0, -5, np.nan],
+            "last_review": pd.to_datetime(["2019-01-01", None, "2018-05-02", None]),
+        }
+    )
+
+
+def test_profile_dataframe__should_match_separate_scans(listings):
+    profile = profile_dataframe(listings)
+
+    assert profile.rows == 4
+    assert profile.missing_values.to_dict() == (
+        columns_with_missing_values(listings).to_dict()
+    )
+    assert profile.invalid_values.to_dict() == {
+        "price": len(get_invalid_rows_by_price(listings))
+    }
+
+
+def test_profile_dataframe__should_report_column_statistics(listings):
+    result = profile_dataframe(listings).to_frame()
+
+    assert result.loc["price", ["min", "max", "distinct_estimate"]].to_list() == [
+        -5,
+        100,
+        3,
+    ]
+    assert result.loc["room_type", "distinct_estimate"] == 2
+    assert result.loc["room_type", "min"] is None
+    assert result.loc["last_review", "max"] == "2019-01-01T00:00:00"
+    assert result.loc["name", "dtype"] == str(listings["name"].dtype)
+    assert (result["memory_bytes"] > 0).all()
+
+
+def test_profile_dataframe__should_merge_chunks(listings):
+    chunks = [listings.iloc[:1], listings.iloc[1:3], listings.iloc[3:]]
+
+    result = profile_dataframe(chunks).to_dict()
+    expected = profile_dataframe(listings).to_dict()
+
+    for metrics in (*result["columns"].values(), *expected["columns"].values()):
+        metrics.pop("memory_bytes")
+    assert result == expected
+
+
+def test_to_dict__should_be_json_serializable(listings):
+    result = json.loads(json.dumps(profile_dataframe(listings).to_dict()))
+
+    assert result["columns"]["price"]["count"] == 3
+
+
+def test_compare__should_return_changed_metrics_only(listings):
+    baseline = profile_dataframe(listings).to_dict()
+    listings.loc[listings["name"].isna(), "name"] = "Unknown"
+
+    result = profile_dataframe(listings).compare(baseline)
+
+    assert result.index.to_list() == ["name"]
+    assert result.loc["name", ("null_count", "current")] == 0
+    assert result.loc["name", ("null_count", "baseline")] == 1
+
+
+def test_data_profile__should_use_custom_validators():
+    profile = DataProfile(validators={"age": lambda values: values > 120})
+
+    result = profile.update(pd.DataFrame({"age": [20, 150], "price": [0, 1]}))
+
+    assert result.invalid_values.to_dict() == {"age": 1}
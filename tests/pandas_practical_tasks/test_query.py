@@ -0,0 +1,149 @@
+import pandas as pd
+import pytest
+
+from src.pandas_practical_tasks.query import LazyFrame
+
+
+@pytest.fixture
+def listings():
+    return pd.DataFrame(
+        {
+            "id": range(8),
+            "neighbourhood_group": ["Queens", "Bronx"] * 4,
+            "room_type": ["Private", "Shared", "Shared", "Private"] * 2,
+            "price": [50, 150, 250, 90, 300, 120, 80, 200],
+            "number_of_reviews": [5, 20, 30, 1, 12, 11, 40, 3],
+        }
+    )
+
+
+@pytest.fixture(params=["parquet", "csv"])
+def scan(request, listings, tmp_path):
+    if request.param == "parquet":
+        listings.to_parquet(tmp_path / "listings.parquet", row_group_size=3)
+        return LazyFrame.scan_parquet(tmp_path / "listings.parquet")
+    listings.to_csv(tmp_path / "listings.csv", index=False)
+    return LazyFrame.scan_csv(tmp_path / "listings.csv", chunk_size=3)
+
+
+@pytest.fixture
+def sources_with_nulls(tmp_path):
+    df = pd.DataFrame(
+        {
+            "id": range(6),
+            "neighbourhood_group": ["Queens", None, "Bronx", "Brooklyn", None, "Bronx"],
+            "price": [50, 150, None, 90, 300, None],
+        }
+    )
+    df.to_parquet(tmp_path / "listings.parquet", row_group_size=2)
+    df.to_csv(tmp_path / "listings.csv", index=False)
+    return [
+        LazyFrame.scan_parquet(tmp_path / "listings.parquet"),
+        LazyFrame.scan_csv(tmp_path / "listings.csv", chunk_size=2),
+    ]
+
+
+@pytest.mark.parametrize(
+    "column, op, value, expected",
+    [
+        ("neighbourhood_group", "!=", "Bronx", [0, 3]),
+        ("neighbourhood_group", "not in", ["Queens"], [2, 3, 5]),
+        ("neighbourhood_group", "in", ["Queens", "Bronx"], [0, 2, 5]),
+        ("price", "!=", 90, [0, 1, 4]),
+        ("price", "<", 100, [0, 3]),
+    ],
+)
+def test_collect__should_drop_nulls_alike_for_every_source(
+    sources_with_nulls, column, op, value, expected
+):
+    for scan in sources_with_nulls:
+        assert scan.filter(column, op, value).collect()["id"].to_list() == expected
+        # After head the filter runs in memory and must agree with the pushed one.
+        in_memory = scan.head(10).filter(column, op, value).collect()
+        assert in_memory["id"].to_list() == expected
+
+
+def test_collect__should_keep_categories_of_every_csv_chunk(sources_with_nulls):
+    _, scan = sources_with_nulls
+
+    result = scan.select("neighbourhood_group").collect()
+
+    assert result["neighbourhood_group"].dtype == "category"
+    assert result["neighbourhood_group"].cat.categories.to_list() == [
+        "Bronx",
+        "Brooklyn",
+        "Queens",
+    ]
+
+
+def test_collect__should_match_eager_pandas(scan, listings):
+    result = (
+        scan.filter("price", ">", 100)
+        .filter("number_of_reviews", ">", 10)
+        .select("neighbourhood_group", "price")
+        .sort("price", ascending=False)
+        .collect()
+    )
+
+    expected = listings.loc[
+        (listings["price"] > 100) & (listings["number_of_reviews"] > 10),
+        ["neighbourhood_group", "price"],
+    ].sort_values("price", ascending=False)
+    pd.testing.assert_frame_equal(
+        result.reset_index(drop=True).astype(expected.dtypes.to_dict()),
+        expected.reset_index(drop=True),
+    )
+
+
+def test_collect__should_group_filtered_rows(scan):
+    result = (
+        scan.filter("room_type", "in", ["Shared"])
+        .groupby("neighbourhood_group", listings=("id", "size"), price=("price", "sum"))
+        .collect()
+    )
+
+    assert result["listings"].to_dict() == {"Bronx": 2, "Queens": 2}
+    assert result["price"].to_dict() == {"Bronx": 270, "Queens": 330}
+
+
+def test_plan__should_push_down_columns_and_filters(scan):
+    columns, pushed, remaining = (
+        scan.filter("price", ">", 100)
+        .sort("number_of_reviews")
+        .select("neighbourhood_group")
+        .plan()
+    )
+
+    assert columns == ["neighbourhood_group", "price", "number_of_reviews"]
+    assert pushed == [("price", ">", 100)]
+    assert [step[0] for step in remaining] == ["sort", "select"]
+
+
+def test_plan__should_keep_filters_after_head_in_memory(scan):
+    query = scan.head(2).filter("price", ">", 100)
+
+    columns, pushed, _ = query.plan()
+
+    assert columns is not None and len(columns) == 5
+    assert pushed == []
+    assert query.collect()["id"].to_list() == [1]
+
+
+def test_plan__should_raise_value_error_for_unknown_column(scan):
+    with pytest.raises(ValueError):
+        scan.select("missing").plan()
+
+
+def test_filter__should_raise_value_error_for_unknown_operator(scan):
+    with pytest.raises(ValueError):
+        scan.filter("price", "~", 1)
+
+
+def test_collect__should_keep_top_k_rows(scan):
+    result = (
+        scan.filter("number_of_reviews", ">", 2)
+        .top_k(3, ["neighbourhood_group", "price"], [True, False])
+        .collect()
+    )
+
+    assert result["id"].to_list() == [7, 1, 5]
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pandas_practical_tasks.ranking import top_k_rows, top_k_rows_in_chunks
+
+
+@pytest.fixture
+def listings():
+    return pd.DataFrame(
+        {
+            "name": ["b", "a", None, "c", "a", "b", "c", "a"],
+            "price": [100.0, 250.0, np.nan, 100.0, 250.0, 80.0, 100.0, np.nan],
+            "number_of_reviews": [3, 1, 7, 3, 0, 9, 2, 5],
+        },
+        index=[10, 11, 12, 13, 14, 15, 16, 17],
+    )
+
+
+@pytest.mark.parametrize("k", [0, 1, 3, 5, 8, 20])
+@pytest.mark.parametrize(
+    "by, ascending",
+    [
+        ("price", True),
+        (["price", "number_of_reviews"], [False, True]),
+        (["name", "price"], [True, False]),
+        (["number_of_reviews"], [False]),
+    ],
+)
+def test_top_k_rows__should_match_stable_full_sort(listings, k, by, ascending):
+    result = top_k_rows(listings, k, by, ascending)
+
+    expected = listings.sort_values(by, ascending=ascending, kind="stable").head(k)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_top_k_rows__should_keep_ties_in_input_order(listings):
+    result = top_k_rows(listings, 2, "price", ascending=False)
+
+    assert result.index.to_list() == [11, 14]
+
+
+def test_top_k_rows__should_raise_value_error_for_mismatched_keys(listings):
+    with pytest.raises(ValueError):
+        top_k_rows(listings, 3, ["price", "name"], [True])
+
+
+def test_top_k_rows__should_raise_value_error_for_negative_k(listings):
+    with pytest.raises(ValueError):
+        top_k_rows(listings, -1, "price")
+
+
+def test_top_k_rows_in_chunks__should_match_full_sort(listings):
+    chunks = (listings.iloc[start : start + 3] for start in range(0, 8, 3))
+
+    result = top_k_rows_in_chunks(chunks, 4, ["price", "name"], [False, True])
+
+    expected = listings.sort_values(
+        ["price", "name"], ascending=[False, True], kind="stable"
+    ).head(4)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_top_k_rows_in_chunks__should_raise_value_error_for_no_chunks():
+    with pytest.raises(ValueError):
+        top_k_rows_in_chunks(iter([]), 3, "price")
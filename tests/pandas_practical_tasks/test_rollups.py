@@ -0,0 +1,82 @@
+import pandas as pd
+import pytest
+
+from src.pandas_practical_tasks.rollups import MonthlyRollupStore
+
+
+@pytest.fixture
+def listings():
+    return pd.DataFrame(
+        {
+            "last_review": pd.to_datetime(
+                [
+                    "2019-01-05",
+                    "2019-01-20",
+                    None,
+                    "2019-03-02",
+                    "2019-03-31",
+                    "2019-04-15",
+                ]
+            ),
+            "number_of_reviews": [10, 4, 7, 1, 9, 3],
+            "price": [100, 150, 90, 80, 300, 120],
+        }
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return MonthlyRollupStore(
+        tmp_path / "rollups.parquet", columns=["number_of_reviews", "price"]
+    )
+
+
+@pytest.mark.parametrize("function", ["count", "sum", "mean", "var", "std"])
+def test_query__should_match_resample(store, listings, function):
+    store.update(listings)
+
+    result = store.query({"number_of_reviews": "sum", "price": function})
+
+    expected = (
+        listings.set_index("last_review")
+        .resample("ME")
+        .agg({"number_of_reviews": "sum", "price": function})
+    )
+    pd.testing.assert_frame_equal(
+        result, expected, check_freq=False, check_index_type=False
+    )
+
+
+def test_update__should_merge_batches_and_persist(store, listings, tmp_path):
+    store.update(listings.iloc[:3], batch="first").update(listings.iloc[3:], "second")
+    store.update(listings.iloc[3:], batch="second")
+
+    reopened = MonthlyRollupStore(
+        tmp_path / "rollups.parquet", columns=["number_of_reviews", "price"]
+    )
+
+    assert reopened.batches == ["first", "second"]
+    assert reopened.query({"price": "sum"})["price"].to_list() == [250, 0, 380, 120]
+
+
+def test_clear__should_empty_the_store(store, listings):
+    store.update(listings, batch="first").clear()
+
+    assert store.batches == []
+    assert store.query({"price": "mean"}).empty
+
+
+def test_query__should_raise_value_error_for_unknown_aggregation(store, listings):
+    store.update(listings)
+
+    with pytest.raises(ValueError):
+        store.query({"price": "median"})
+    with pytest.raises(ValueError):
+        store.query({"availability_365": "sum"})
+
+
+def test_init__should_raise_value_error_for_other_columns(store, listings, tmp_path):
+    store.update(listings)
+
+    with pytest.raises(ValueError):
+        MonthlyRollupStore(tmp_path / "rollups.parquet", columns=["price"])
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pandas_practical_tasks.statistics import describe
+
+
+@pytest.fixture
+def listings():
+    return pd.DataFrame(
+        {
+            "neighbourhood_group": ["Queens", "Bronx", "Queens", None, "Bronx"] * 4,
+            "room_type": ["Private", "Shared"] * 10,
+            "price": [50.0, 150.0, np.nan, 90.0, 300.0] * 4,
+            "number_of_reviews": range(20),
+        }
+    )
+
+
+def test_describe__should_match_pandas(listings):
+    result = describe(
+        listings,
+        ["price", "number_of_reviews"],
+        statistics=["count", "sum", "mean", "std", "min", "max", "median", 0.25],
+    )
+
+    columns = listings[["price", "number_of_reviews"]]
+    expected = columns.agg(["count", "sum", "mean", "std", "min", "max", "median"]).T
+    expected["25%"] = columns.quantile(0.25)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_describe__should_match_pandas_per_group(listings):
+    result = describe(
+        listings,
+        ["price"],
+        statistics=["count", "mean", "var", "median"],
+        by=["neighbourhood_group", "room_type"],
+    )
+
+    expected = listings.groupby(["neighbourhood_group", "room_type"]).agg(
+        {"price": ["count", "mean", "var", "median"]}
+    )
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_describe__should_merge_chunks(listings):
+    chunks = (listings.iloc[start : start + 6] for start in range(0, 20, 6))
+
+    result = describe(
+        chunks,
+        ["price"],
+        statistics=["count", "sum", "mean", "std", "max"],
+        by="room_type",
+    )
+
+    expected = describe(
+        listings,
+        ["price"],
+        statistics=["count", "sum", "mean", "std", "max"],
+        by="room_type",
+    )
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_describe__should_approximate_quantiles(listings):
+    result = describe(
+        [listings.iloc[:10], listings.iloc[10:]],
+        ["number_of_reviews"],
+        statistics=["median"],
+        approximate=True,
+    )
+
+    assert result.loc["number_of_reviews", "median"] in (9, 10)
+
+
+def test_describe__should_raise_value_error_for_exact_quantiles_of_chunks(listings):
+    with pytest.raises(ValueError):
+        describe(iter([listings]), ["price"], statistics=["median"])
+
+
+@pytest.mark.parametrize("statistic", ["mode", 1.5])
+def test_describe__should_raise_value_error_for_invalid_statistic(listings, statistic):
+    with pytest.raises(ValueError):
+        describe(listings, ["price"], statistics=[statistic])
@@ -7,7 +7,12 @@ from src.pandas_practical_tasks.task_1 import (
     columns_with_missing_values,
     categorize_by_minimum_nights,
     get_invalid_rows_by_price,
+    transform_data,
+    clean_listings,
+    clean_listings_in_chunks,
+    load_cleaned_listings,
 )
+from src.pandas_practical_tasks.listings import load_listings
 
 
 def test_print_dataframe_info__should_print_data(capsys):
@@ -45,7 +50,124 @@ def test_categorize_by_minimum_nights__should_categorize_values_correctly(
     assert categorize_by_minimum_nights(value) == expected
 
 
+def test_transform_data__should_categorize_length_of_stay():
+    result = transform_data(
+        pd.DataFrame({"price": [50, 150], "minimum_nights": [3, 14]})
+    )
+
+    assert result["length_of_stay_category"].dtype == "category"
+    assert result["length_of_stay_category"].to_list() == ["short-term", "long-term"]
+
+
 def test_get_invalid_rows_by_price__should_return_correct_indexes():
     result = get_invalid_rows_by_price(df=pd.DataFrame({"price": [1, 0, -100]}))
 
     assert result.to_list() == [1, 2]
+
+
+@pytest.fixture
+def listings_file(tmp_path):
+    file_path = tmp_path / "listings.csv"
+    pd.DataFrame(
+        {
+            "id": range(7),
+            "name": ["Cozy room", None, "Loft", "Studio", None, "Flat", "Suite"],
+            "host_name": ["Anna", "John", None, "Mike", "Kate", None, "Tom"],
+            "neighbourhood_group": ["Bronx", "Queens"] * 3 + ["Manhattan"],
+            "latitude": [40.64749, 40.75362, 40.80902, 40.68514, 40.79851, 0.1, 0.2],
+            "price": [149, 0, 350, -5, 99, 100, 300],
+            "minimum_nights": [1, 3, 4, 13, 14, 30, 2],
+            "last_review": ["2018-10-19", None, None, "2019-05-21", None, None, None],
+        }
+    ).to_csv(file_path, index=False)
+    return file_path
+
+
+def test_clean_listings__should_drop_invalid_prices(listings_file):
+    result = clean_listings(load_listings(listings_file))
+
+    assert result["id"].to_list() == [0, 2, 4, 5, 6]
+    assert result["name"].isna().sum() == 0
+    assert result["price_category"].to_list() == [
+        "Middle",
+        "High",
+        "Low",
+        "Middle",
+        "High",
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 100])
+def test_clean_listings_in_chunks__should_match_batch_cleaning(
+    listings_file, tmp_path, chunk_size
+):
+    clean_listings(load_listings(listings_file)).to_csv(
+        tmp_path / "batch.csv", index=False
+    )
+
+    result = clean_listings_in_chunks(
+        listings_file, tmp_path / "chunks.csv", chunk_size
+    )
+
+    assert result.read_text() == (tmp_path / "batch.csv").read_text()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 100])
+def test_clean_listings_in_chunks__should_format_counts_alike_in_every_chunk(
+    listings_file, tmp_path, chunk_size
+):
+    listings_file.write_text(listings_file.read_text().replace(",2,", ",,"))
+    clean_listings(load_listings(listings_file)).to_csv(
+        tmp_path / "batch.csv", index=False
+    )
+
+    result = clean_listings_in_chunks(
+        listings_file, tmp_path / "chunks.csv", chunk_size
+    )
+
+    assert result.read_text() == (tmp_path / "batch.csv").read_text()
+    assert ",30," in result.read_text()
+
+
+def test_clean_listings_in_chunks__should_write_header_without_rows(
+    listings_file, tmp_path
+):
+    listings_file.write_text(listings_file.read_text().splitlines()[0] + "\n")
+
+    result = clean_listings_in_chunks(listings_file, tmp_path / "chunks.csv", 2)
+
+    assert result.read_text().splitlines() == [
+        ",".join(clean_listings(load_listings(listings_file)).columns)
+    ]
+
+
+def test_clean_listings_in_chunks__should_read_back_with_same_categories(
+    listings_file, tmp_path
+):
+    expected = clean_listings(load_listings(listings_file))
+
+    result = load_listings(
+        clean_listings_in_chunks(listings_file, tmp_path / "chunks.csv", 2)
+    )
+
+    for column in ("price_category", "length_of_stay_category"):
+        assert result[column].dtype == expected[column].dtype
+
+
+def test_load_cleaned_listings__should_rebuild_cache_when_source_changes(
+    listings_file, tmp_path
+):
+    cache_folder = tmp_path / "cache"
+    result = load_cleaned_listings(
+        listings_file, columns=["id", "price_category"], cache_folder=cache_folder
+    )
+
+    assert result.columns.to_list() == ["id", "price_category"]
+    assert result["price_category"].dtype == "category"
+    assert len(list(cache_folder.glob("*.parquet"))) == 1
+
+    listings_file.write_text(listings_file.read_text().replace(",149,", ",0,"))
+    result = load_cleaned_listings(listings_file, cache_folder=cache_folder)
+
+    assert result["id"].to_list() == [2, 4, 5, 6]
+    assert len(list(cache_folder.glob("*.parquet"))) == 1
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from src.pandas_practical_tasks.grouping import GroupedAggregates
 from src.pandas_practical_tasks.task_2 import print_grouped_data, rank_neighborhoods
 
 
@@ -33,3 +34,29 @@ def test_rank_neighborhoods__should_rank_it_correctly():
         "neighbourhood_group": {0: "Downtown", 1: "Suburb", 2: "Uptown"},
         "total_listings": {0: 2, 1: 2, 2: 2},
     }
+
+
+def test_rank_neighborhoods__should_reuse_grouped_aggregates():
+    df = pd.DataFrame(
+        {"neighbourhood_group": ["Uptown", "Suburb", "Uptown"], "price": [1, 2, 3]}
+    )
+    grouped = GroupedAggregates(df)
+
+    result = rank_neighborhoods(df, grouped)
+
+    assert result["neighbourhood_group"].to_list() == ["Uptown", "Suburb"]
+    assert result["total_listings"].to_list() == [2, 1]
+    assert len(grouped._results) == 1
+
+
+def test_rank_neighborhoods__should_keep_top_neighborhoods():
+    df = pd.DataFrame(
+        {
+            "neighbourhood_group": ["Uptown", "Suburb", "Uptown", "Bronx"],
+            "price": [1, 2, 3, 1],
+        }
+    )
+
+    result = rank_neighborhoods(df, top=2)
+
+    assert result["neighbourhood_group"].to_list() == ["Uptown", "Bronx"]
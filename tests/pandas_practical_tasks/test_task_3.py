@@ -1,6 +1,11 @@
 import pandas as pd
+import pytest
 
-from src.pandas_practical_tasks.task_3 import print_analysis_results
+from src.pandas_practical_tasks.task_3 import (
+    AVAILABILITY_BINS,
+    classify_by_availability,
+    print_analysis_results,
+)
 
 
 def test_print_analysis_results__should_print_data(capsys):
@@ -8,3 +13,17 @@ def test_print_analysis_results__should_print_data(capsys):
     captured = capsys.readouterr()
 
     assert captured.out == "Message\n   test\n0     1\n1     2\n"
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (49, "Rarely Available"),
+        (50, "Occasionally Available"),
+        (200, "Occasionally Available"),
+        (201, "Highly Available"),
+    ],
+)
+def test_classify_by_availability__should_classify_values_correctly(value, expected):
+    assert classify_by_availability(value) == expected
+    assert AVAILABILITY_BINS.apply(pd.Series([value])).to_list() == [expected]